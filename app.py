@@ -1,17 +1,43 @@
-from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, session
-from flask_mysqldb import MySQL
-from flask_mail import Mail, Message
-import MySQLdb.cursors
+from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, session, Response, stream_with_context, g, send_from_directory
+from flask_mail import Mail
 import re
 import hashlib
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import random
 import string
 from twilio.rest import Client
 import os
 from dotenv import load_dotenv
 import json
+import base64
+import io
+import csv
+import zlib
+import time
+import click
+import functools
+import mimetypes
 import pyotp
+import tempfile
+from collections import Counter
+from assets import AssetManifest, build as build_assets
+from audit import AuditLog, insert_rows as insert_audit_rows
+from datagen import DataGenerator, PASSWORD as GENERATED_PASSWORD
+from caching import TTLCache, SQLiteCache, MemoryVersions, SQLiteVersions
+from db_pool import ConnectionPool, ReplicaSet
+from events import MemoryEventBus, SQLiteEventBus
+from metrics import Registry, RequestStats, InstrumentedCursor, COUNT_BUCKETS, ROW_BUCKETS, SIZE_BUCKETS
+from otp_store import MySQLOTPStore, MemoryOTPStore, OTPError
+from outbox import Outbox, ConsoleTransport, FlaskMailTransport, TwilioTransport
+from storage import MySQLBackend, SQLiteBackend
+from skills import parse_skills, sync_user_skills, sync_user_skills_bulk, sync_job_skills, skill_filter
+from matching import MatchEngine
+from suggest import SuggestIndexes
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 app = Flask(__name__)
 
@@ -21,16 +47,35 @@ load_dotenv()
 # Secret key for session management
 app.secret_key = os.environ.get('SECRET_KEY', 'your-secret-key-here')
 
+# Database backend Configuration: 'mysql', or 'sqlite' for an embedded database file (dev, tests, benchmarks)
+app.config['DB_BACKEND'] = os.environ.get('DB_BACKEND', 'mysql')
+app.config['SQLITE_PATH'] = os.environ.get('SQLITE_PATH', 'district_growth.db')
+
 # MySQL Configuration
 app.config['MYSQL_HOST'] = os.environ.get('MYSQL_HOST', 'localhost')
 app.config['MYSQL_USER'] = os.environ.get('MYSQL_USER', 'root')
 app.config['MYSQL_PASSWORD'] = os.environ.get('MYSQL_PASSWORD', '')
 app.config['MYSQL_DB'] = os.environ.get('MYSQL_DB', 'district_growth')
+app.config['MYSQL_PORT'] = int(os.environ.get('MYSQL_PORT', 3306))
+
+# Connection pool Configuration (per gunicorn worker)
+app.config['MYSQL_POOL_SIZE'] = int(os.environ.get('MYSQL_POOL_SIZE', 5))
+app.config['MYSQL_POOL_TIMEOUT'] = float(os.environ.get('MYSQL_POOL_TIMEOUT', 10))
+app.config['MYSQL_POOL_RECYCLE'] = int(os.environ.get('MYSQL_POOL_RECYCLE', 3600))
+app.config['MYSQL_POOL_PING_AFTER'] = int(os.environ.get('MYSQL_POOL_PING_AFTER', 30))
+
+# Read replicas: comma-separated host[:port] list sharing the primary's credentials
+app.config['MYSQL_REPLICA_HOSTS'] = [h.strip() for h in os.environ.get('MYSQL_REPLICA_HOSTS', '').split(',') if h.strip()]
+app.config['MYSQL_REPLICA_MAX_LAG'] = int(os.environ.get('MYSQL_REPLICA_MAX_LAG', 5))
+# Local testing only: use servers that report no replication status as if they were current replicas
+app.config['MYSQL_REPLICA_ALLOW_STANDALONE'] = os.environ.get('MYSQL_REPLICA_ALLOW_STANDALONE', 'false').lower() == 'true'
+# After a user's own write, their reads stay on the primary this long
+app.config['READ_YOUR_WRITES_SECONDS'] = int(os.environ.get('READ_YOUR_WRITES_SECONDS', 10))
 
 # Email Configuration
-app.config['MAIL_SERVER'] = 'smtp.gmail.com'
-app.config['MAIL_PORT'] = 587
-app.config['MAIL_USE_TLS'] = True
+app.config['MAIL_SERVER'] = os.getenv('MAIL_SERVER', 'smtp.gmail.com')
+app.config['MAIL_PORT'] = int(os.getenv('MAIL_PORT', 587))
+app.config['MAIL_USE_TLS'] = os.getenv('MAIL_USE_TLS', 'true').lower() == 'true'
 app.config['MAIL_USERNAME'] = os.getenv('MAIL_USERNAME')  # Set in .env file
 app.config['MAIL_PASSWORD'] = os.getenv('MAIL_PASSWORD')  # Set in .env file
 
@@ -38,67 +83,478 @@ app.config['MAIL_PASSWORD'] = os.getenv('MAIL_PASSWORD')  # Set in .env file
 TWILIO_ACCOUNT_SID = os.getenv('TWILIO_ACCOUNT_SID')
 TWILIO_AUTH_TOKEN = os.getenv('TWILIO_AUTH_TOKEN')
 TWILIO_PHONE_NUMBER = os.getenv('TWILIO_PHONE_NUMBER')
+# Development only: print SMS (OTP codes included) to stdout when Twilio is not configured
+SMS_CONSOLE = os.getenv('SMS_CONSOLE', 'false').lower() == 'true'
+
+# Identity cache Configuration
+# Bounds how long a deactivation or role change can go unnoticed by other workers
+IDENTITY_CACHE_TTL = int(os.getenv('IDENTITY_CACHE_TTL', 60))
+IDENTITY_CACHE_SIZE = int(os.getenv('IDENTITY_CACHE_SIZE', 10000))
+# Optional SQLite file for the identity cache, so an invalidation in one worker reaches the others at once
+IDENTITY_CACHE_PATH = os.getenv('IDENTITY_CACHE_PATH')
+
+# Instrumentation Configuration
+SLOW_QUERY_MS = float(os.getenv('SLOW_QUERY_MS', 200))
+# When set, /metrics requires "Authorization: Bearer <token>"
+METRICS_TOKEN = os.getenv('METRICS_TOKEN')
+
+# OTP Configuration
+# 'memory' keeps codes in-process and is only safe with a single worker (WEB_CONCURRENCY=1)
+OTP_BACKEND = os.getenv('OTP_BACKEND', 'mysql')
+OTP_TTL_MINUTES = int(os.getenv('OTP_TTL_MINUTES', 10))
+OTP_MAX_ATTEMPTS = int(os.getenv('OTP_MAX_ATTEMPTS', 5))
+OTP_SEND_LIMIT = int(os.getenv('OTP_SEND_LIMIT', 5))
+OTP_SEND_WINDOW_MINUTES = int(os.getenv('OTP_SEND_WINDOW_MINUTES', 15))
+
+# Outbound delivery queue Configuration
+# Worker threads per gunicorn worker; set to 0 and run `flask outbox-worker` separately instead
+OUTBOX_WORKERS = int(os.getenv('OUTBOX_WORKERS', 2))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv('OUTBOX_MAX_ATTEMPTS', 5))
+
+# Admin audit log Configuration
+# Local SQLite file holding audit rows that could not be written yet; shared by the host's workers
+AUDIT_SPILL_PATH = os.getenv('AUDIT_SPILL_PATH', os.path.join(tempfile.gettempdir(), 'palwalreunion-audit.sqlite3'))
+AUDIT_BATCH_SIZE = int(os.getenv('AUDIT_BATCH_SIZE', 200))
+AUDIT_FLUSH_SECONDS = float(os.getenv('AUDIT_FLUSH_SECONDS', 2))
+
+# Analytics Configuration
+ANALYTICS_CACHE_TTL = int(os.getenv('ANALYTICS_CACHE_TTL', 60))
+
+# Autocomplete Configuration (new profiles are added in place; edited ones trigger a rebuild)
+SUGGEST_REBUILD_SECONDS = int(os.getenv('SUGGEST_REBUILD_SECONDS', 600))
+
+# Job matching Configuration
+MATCH_REFRESH_SECONDS = int(os.getenv('MATCH_REFRESH_SECONDS', 30))
+MATCH_REBUILD_SECONDS = int(os.getenv('MATCH_REBUILD_SECONDS', 3600))
+MATCH_MAX_RESULTS = 50
+
+# Export Configuration
+EXPORT_BATCH_SIZE = int(os.getenv('EXPORT_BATCH_SIZE', 1000))
+
+# Import Configuration (rows per executemany batch)
+IMPORT_BATCH_SIZE = int(os.getenv('IMPORT_BATCH_SIZE', 500))
+
+# Admin list Configuration
+ADMIN_PAGE_SIZE = 20
+# Most users one bulk status change may touch
+BULK_STATUS_MAX_USERS = int(os.getenv('BULK_STATUS_MAX_USERS', 5000))
+ADMIN_COUNT_CACHE_TTL = int(os.getenv('ADMIN_COUNT_CACHE_TTL', 30))
+
+# Live dashboard event Configuration
+# SQLite file carrying events between workers; without it a stream only sees its own worker's events
+EVENT_BUS_PATH = os.getenv('EVENT_BUS_PATH')
+EVENT_STREAM_SECONDS = int(os.getenv('EVENT_STREAM_SECONDS', 300))
+EVENT_HEARTBEAT_SECONDS = 15
+
+# HTTP validator Configuration
+# SQLite file for the per-table change counters behind ETags; required when WEB_CONCURRENCY > 1
+DATA_VERSION_PATH = os.getenv('DATA_VERSION_PATH')
+# Validators also roll over this often, bounding staleness from writes made outside the app
+DATA_VERSION_MAX_AGE = int(os.getenv('DATA_VERSION_MAX_AGE', 300))
+# gunicorn's worker count; in-process counters (no DATA_VERSION_PATH) need a single worker
+WEB_CONCURRENCY = int(os.getenv('WEB_CONCURRENCY', 1))
+
+# Response compression Configuration
+COMPRESS_MIN_BYTES = int(os.getenv('COMPRESS_MIN_BYTES', 1024))
+COMPRESS_MIMETYPES = {'application/json', 'text/html', 'text/css', 'text/javascript', 'application/javascript',
+                      'text/plain', 'image/svg+xml'}
+# Compressed bodies kept per body hash and encoding, so cached pages and unchanged API results are compressed once
+COMPRESS_CACHE_SIZE = int(os.getenv('COMPRESS_CACHE_SIZE', 1000))
+COMPRESS_CACHE_TTL = 3600
+
+# Static asset Configuration (fingerprinted files from `flask build-assets` are cached this long)
+STATIC_MAX_AGE = 365 * 24 * 3600
+
+# Rendered page cache Configuration (anonymous pages plus one copy per logged-in username)
+PAGE_CACHE_SIZE = int(os.getenv('PAGE_CACHE_SIZE', 2000))
+PAGE_CACHE_TTL = 24 * 3600
 
-mysql = MySQL(app)
 mail = Mail(app)
+analytics_cache = TTLCache(ttl=ANALYTICS_CACHE_TTL)
+count_cache = TTLCache(ttl=ADMIN_COUNT_CACHE_TTL)
+if IDENTITY_CACHE_PATH:
+    identity_cache = SQLiteCache(IDENTITY_CACHE_PATH, ttl=IDENTITY_CACHE_TTL)
+else:
+    identity_cache = TTLCache(ttl=IDENTITY_CACHE_TTL, maxsize=IDENTITY_CACHE_SIZE)
+event_bus = SQLiteEventBus(EVENT_BUS_PATH) if EVENT_BUS_PATH else MemoryEventBus()
+page_cache = TTLCache(ttl=PAGE_CACHE_TTL, maxsize=PAGE_CACHE_SIZE)
+compressed_cache = TTLCache(ttl=COMPRESS_CACHE_TTL, maxsize=COMPRESS_CACHE_SIZE)
+
+def create_data_versions():
+    """Change counters behind ETags; in-process counters are refused when several workers would serve stale 304s"""
+    if DATA_VERSION_PATH:
+        return SQLiteVersions(DATA_VERSION_PATH)
+    if WEB_CONCURRENCY > 1:
+        raise RuntimeError(f'DATA_VERSION_PATH must be set when WEB_CONCURRENCY is {WEB_CONCURRENCY}; '
+                           'in-process data versions only see their own worker\'s writes')
+    return MemoryVersions()
+
+data_versions = create_data_versions()
+
+def create_backend():
+    """Storage backend selected by DB_BACKEND"""
+    if app.config['DB_BACKEND'] == 'sqlite':
+        return SQLiteBackend(app.config['SQLITE_PATH'])
+    return MySQLBackend(app.config['MYSQL_HOST'], app.config['MYSQL_USER'], app.config['MYSQL_PASSWORD'],
+                        app.config['MYSQL_DB'], app.config['MYSQL_PORT'])
+
+db_backend = create_backend()
+
+def connect_db(host=None, port=None):
+    """Open a new connection to the database (or to one MySQL replica)"""
+    return db_backend.connect(host, port)
+
+def create_pool(host=None, port=None):
+    """Connection pool for one database server, sized from the app configuration"""
+    return ConnectionPool(lambda: connect_db(host, port), size=app.config['MYSQL_POOL_SIZE'],
+                          timeout=app.config['MYSQL_POOL_TIMEOUT'],
+                          recycle=app.config['MYSQL_POOL_RECYCLE'],
+                          ping_after=app.config['MYSQL_POOL_PING_AFTER'])
+
+def create_replica_set():
+    """Replica pools from MYSQL_REPLICA_HOSTS (MySQL only)"""
+    pools = []
+    for address in app.config['MYSQL_REPLICA_HOSTS'] if db_backend.name == 'mysql' else []:
+        host, _, port = address.partition(':')
+        pools.append(create_pool(host, int(port) if port else None))
+    return ReplicaSet(pools, max_lag=app.config['MYSQL_REPLICA_MAX_LAG'],
+                      allow_standalone=app.config['MYSQL_REPLICA_ALLOW_STANDALONE'])
+
+db_pool = create_pool()
+replica_set = create_replica_set()
+match_engine = MatchEngine(connect_db, db_backend.dict_cursor, refresh_interval=MATCH_REFRESH_SECONDS,
+                           rebuild_interval=MATCH_REBUILD_SECONDS)
+
+def reads_pinned_to_primary():
+    """True while the current user is inside their read-your-writes window"""
+    return session.get('primary_until', 0) > time.time()
+
+def mark_user_write():
+    """Keep this user's reads on the primary until replicas have caught up with their write"""
+    session['primary_until'] = time.time() + app.config['READ_YOUR_WRITES_SECONDS']
+
+def get_db(readonly=False):
+    """Pooled connection for the current request, checked out on first use.
+
+    Read-only callers get a replica connection when one is healthy and the user
+    has not just written; everything else goes to the primary. Only pass
+    readonly=True for reads that tolerate a few seconds of replication lag.
+    """
+    if readonly and replica_set.pools and not reads_pinned_to_primary():
+        if 'read_db' not in g:
+            g.read_db = replica_set.acquire()
+        if g.read_db is not None:
+            return g.read_db[1]
+    if 'db' not in g:
+        g.db = db_pool.acquire()
+    return g.db
+
+def get_cursor(cursor_class=None, readonly=False):
+    """Instrumented cursor (rows as dicts by default) on the current request's pooled connection"""
+    return InstrumentedCursor(get_db(readonly).cursor(cursor_class or db_backend.dict_cursor), g.get('request_stats'),
+                              slow_query_seconds=SLOW_QUERY_MS / 1000)
+
+@app.teardown_appcontext
+def release_db(exception):
+    """Return the request's connections to their pools (discarding them after an error)"""
+    connection = g.pop('db', None)
+    if connection is not None:
+        db_pool.release(connection, discard=exception is not None)
+    replica = g.pop('read_db', None)
+    if replica is not None:
+        pool, connection = replica
+        pool.release(connection, discard=exception is not None)
+
+def build_outbox_transports():
+    """Email goes through Flask-Mail; SMS uses Twilio when configured, or the console with SMS_CONSOLE.
+
+    With neither, SMS has no transport and queued messages fail in the outbox
+    rather than having their codes printed to the logs.
+    """
+    transports = {'email': FlaskMailTransport(mail, app.config['MAIL_USERNAME'])}
+    if TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN and TWILIO_PHONE_NUMBER:
+        transports['sms'] = TwilioTransport(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN, TWILIO_PHONE_NUMBER)
+    elif SMS_CONSOLE:
+        transports['sms'] = ConsoleTransport('SMS')
+    return transports
+
+# Request metrics (per worker process)
+metrics = Registry()
+metrics.describe('http_requests_total', 'Requests served, by endpoint, method and status')
+metrics.describe('http_request_duration_seconds', 'Wall time per request')
+metrics.describe('http_request_sql_queries', 'SQL statements executed per request')
+metrics.describe('http_request_sql_duration_seconds', 'Time spent in SQL per request')
+metrics.describe('http_request_sql_rows', 'Rows fetched per request')
+metrics.describe('http_response_size_bytes', 'Response body size (buffered responses only)')
+
+@app.before_request
+def start_request_metrics():
+    g.request_started = time.perf_counter()
+    g.request_stats = RequestStats()
+
+@app.after_request
+def record_request_metrics(response):
+    """Record the request's metrics; for streamed responses, once the stream is closed.
+
+    Streamed bodies (NDJSON search, exports) run their SQL while the body is
+    sent, after this hook, so their duration and SQL counts are only complete
+    when the server closes the response.
+    """
+    started = g.get('request_started')
+    if started is None:
+        return response
+    stats = g.request_stats
+    labels = {'endpoint': request.url_rule.rule if request.url_rule else 'unmatched', 'method': request.method}
+    metrics.inc('http_requests_total', dict(labels, status=str(response.status_code)))
+    
+    def observe():
+        metrics.observe('http_request_duration_seconds', labels, time.perf_counter() - started)
+        metrics.observe('http_request_sql_queries', labels, stats.queries, COUNT_BUCKETS)
+        metrics.observe('http_request_sql_duration_seconds', labels, stats.sql_seconds)
+        metrics.observe('http_request_sql_rows', labels, stats.rows, ROW_BUCKETS)
+    
+    if response.is_streamed:
+        response.call_on_close(observe)
+    else:
+        observe()
+        if response.content_length is not None:
+            metrics.observe('http_response_size_bytes', labels, response.content_length, SIZE_BUCKETS)
+    return response
+
+def data_validators(tables):
+    """Weak ETag and Last-Modified for the current GET, from the change counters of ``tables``.
+
+    The ETag covers the URL, the session's user/admin, the tables' versions and
+    the current DATA_VERSION_MAX_AGE window.
+    """
+    versions = data_versions.get(tables)
+    window = int(time.time() // DATA_VERSION_MAX_AGE)
+    key = json.dumps([request.path, request.query_string.decode('latin-1'), session.get('id'),
+                      session.get('admin_id'), versions, window])
+    changed_at = max([changed_at for _, changed_at in versions] + [window * DATA_VERSION_MAX_AGE])
+    return hashlib.sha1(key.encode()).hexdigest()[:24], datetime.fromtimestamp(int(changed_at), timezone.utc)
+
+def conditional(*tables, auth=None):
+    """Answer repeat GETs of a JSON endpoint with 304 while ``tables`` are unchanged.
+
+    A matching If-None-Match (or, without one, If-Modified-Since) returns 304
+    before the view runs, so no SQL is executed. ``auth`` is checked first;
+    when it fails the view runs and returns its usual error. Only successful
+    buffered responses are given validators.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            if auth is not None and not auth():
+                return view(*args, **kwargs)
+            etag, last_modified = data_validators(tables)
+            if request.if_none_match:
+                unchanged = request.if_none_match.contains_weak(etag)
+            else:
+                unchanged = request.if_modified_since is not None and last_modified <= request.if_modified_since
+            
+            if unchanged:
+                response = Response(status=304)
+            else:
+                response = view(*args, **kwargs)
+                if (response.status_code != 200 or response.is_streamed
+                        or not (response.get_json(silent=True) or {}).get('success')):
+                    return response
+            response.set_etag(etag, weak=True)
+            response.last_modified = last_modified
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return wrapper
+    return decorator
+
+def compress_body(data, encoding):
+    if encoding == 'br':
+        return brotli.compress(data, quality=5)
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
+
+@app.after_request
+def compress_response(response):
+    """Gzip (or Brotli, when installed) buffered text responses of at least COMPRESS_MIN_BYTES.
+
+    Responses with an ETag (cached pages, ``conditional`` endpoints) tend to
+    repeat, so their compressed bodies are kept in compressed_cache under a hash
+    of the uncompressed body. The ETag itself is not the key: ``conditional``
+    computes it before the view runs, so one ETag can cover different bodies.
+    """
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or 'Content-Encoding' in response.headers or response.mimetype not in COMPRESS_MIMETYPES):
+        return response
+    response.vary.add('Accept-Encoding')
+    if response.content_length is None or response.content_length < COMPRESS_MIN_BYTES:
+        return response
+    
+    if brotli is not None and request.accept_encodings['br']:
+        encoding = 'br'
+    elif request.accept_encodings['gzip']:
+        encoding = 'gzip'
+    else:
+        return response
+    data = response.get_data()
+    etag, _ = response.get_etag()
+    if etag:
+        key = (hashlib.sha1(data).hexdigest(), encoding)
+        body = compressed_cache.get_or_set(key, lambda: compress_body(data, encoding))
+    else:
+        body = compress_body(data, encoding)
+    response.set_data(body)
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+@app.route('/metrics')
+def prometheus_metrics():
+    """Prometheus scrape endpoint for this worker's request and pool metrics"""
+    if METRICS_TOKEN and request.headers.get('Authorization') != f'Bearer {METRICS_TOKEN}':
+        return Response('Unauthorized\n', status=401, mimetype='text/plain')
+    
+    gauges = []
+    pools = [('primary', db_pool.stats())]
+    pools += [(f'replica{i}', stats) for i, stats in enumerate(replica_set.stats())]
+    for name, stats in pools:
+        for key in ('open', 'idle', 'in_use', 'acquired', 'timeouts', 'wait_seconds_total', 'wait_seconds_max'):
+            gauges.append((f'db_pool_{key}', {'pool': name}, stats[key]))
+    return Response(metrics.render(gauges), mimetype='text/plain; version=0.0.4')
+
+otp_store_class = MemoryOTPStore if OTP_BACKEND == 'memory' else MySQLOTPStore
+otp_store = otp_store_class(max_attempts=OTP_MAX_ATTEMPTS, send_limit=OTP_SEND_LIMIT,
+                            send_window=timedelta(minutes=OTP_SEND_WINDOW_MINUTES))
+
+outbox = Outbox(connect_db, build_outbox_transports(), db_backend.dict_cursor, context=app.app_context,
+                max_attempts=OUTBOX_MAX_ATTEMPTS)
+
+asset_manifest = AssetManifest(app.static_folder)
+
+@app.url_defaults
+def fingerprint_static_urls(endpoint, values):
+    """Point url_for('static', ...) at the fingerprinted copy when the asset build has run"""
+    if endpoint == 'static' and 'filename' in values:
+        values['filename'] = asset_manifest.resolve(values['filename'])
+
+def serve_static(filename):
+    """Static files; fingerprinted build output is served precompressed and cached for good"""
+    if not asset_manifest.is_hashed(filename):
+        return app.send_static_file(filename)
+    
+    encoding = asset_manifest.encoding_for(filename, request.accept_encodings)
+    suffix = {'br': '.br', 'gzip': '.gz'}.get(encoding, '')
+    response = send_from_directory(app.static_folder, filename + suffix,
+                                   mimetype=mimetypes.guess_type(filename)[0], max_age=STATIC_MAX_AGE)
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    if filename in asset_manifest.encodings:
+        response.vary.add('Accept-Encoding')
+    response.headers['Cache-Control'] = f'public, max-age={STATIC_MAX_AGE}, immutable'
+    return response
+
+app.view_functions['static'] = serve_static
+
+@app.template_global()
+def image_sources(filename):
+    """(MIME type, srcset) pairs of an image's resized variants for <picture> sources"""
+    return [(mimetype, ', '.join(f"{url_for('static', filename=name)} {width}w" for width, name in sizes))
+            for mimetype, sizes in asset_manifest.sources(filename)]
+
+@app.cli.command('build-assets')
+def build_assets_command():
+    """Fingerprint, precompress and resize the static assets (run at deploy time)"""
+    manifest = build_assets(app.static_folder)
+    print(f"Built {len(manifest['files'])} assets, {len(manifest['images'])} with image variants")
+
+# Pages rendered from templates alone; they may only read session.loggedin and session.username
+PAGE_TEMPLATES = ('index.html', 'register.html', 'login.html', 'search.html', 'analytics.html',
+                  'vision.html', 'developers.html', 'feedback.html', 'admin_login.html')
+
+def render_page(template):
+    """Serve a data-free page from the rendered-page cache.
+
+    Entries are keyed on the template, the logged-in username (None for
+    visitors) and the asset manifest version, so a deploy with new assets
+    renders afresh. Each entry carries an ETag for 304s on repeat visits.
+    Debug mode always re-renders so template edits show up.
+    """
+    if app.debug:
+        return render_template(template)
+    username = session.get('username') if session.get('loggedin') else None
+    key = (template, username, asset_manifest.version)
+    entry = page_cache.get(key)
+    if entry is None:
+        html = render_template(template)
+        entry = (html, hashlib.sha1(html.encode()).hexdigest())
+        page_cache.set(key, entry)
+    
+    response = Response(entry[0], mimetype='text/html')
+    response.set_etag(entry[1], weak=True)
+    response.headers['Cache-Control'] = 'private, no-cache' if username else 'no-cache'
+    return response.make_conditional(request)
+
+def warm_page_cache():
+    """Render the logged-out version of every cached page"""
+    with app.test_request_context():
+        for template in PAGE_TEMPLATES:
+            render_page(template)
 
 @app.route('/')
 def index():
     """Main dashboard page"""
-    return render_template('index.html')
+    return render_page('index.html')
 
 @app.route('/register')
 def register():
     """User registration page"""
-    return render_template('register.html')
+    return render_page('register.html')
 
 @app.route('/login')
 def login():
     """User login page"""
-    return render_template('login.html')
+    return render_page('login.html')
 
 @app.route('/profile')
 def profile():
     """User profile page for data input"""
-    if 'loggedin' in session:
+    if current_user():
         return render_template('profile.html')
     return redirect(url_for('login'))
 
 @app.route('/search')
 def search():
     """Professional search page"""
-    return render_template('search.html')
+    return render_page('search.html')
 
 @app.route('/analytics')
 def analytics():
     """District growth analytics page"""
-    return render_template('analytics.html')
+    return render_page('analytics.html')
 
 @app.route('/vision')
 def mla_vision():
     """Vision page - Shri Gaurav Gautam's ideas"""
-    return render_template('vision.html')
+    return render_page('vision.html')
 
 @app.route('/developers')
 def developers():
     """Developers page - About the development team"""
-    return render_template('developers.html')
+    return render_page('developers.html')
 
 @app.route('/feedback')
 def feedback():
     """Feedback and suggestions page"""
-    return render_template('feedback.html')
+    return render_page('feedback.html')
 
 # Admin Routes
 @app.route('/admin/login')
 def admin_login():
     """Admin login page"""
-    return render_template('admin_login.html')
+    return render_page('admin_login.html')
 
 @app.route('/admin/dashboard')
 def admin_dashboard():
     """Admin dashboard page"""
-    if 'admin_loggedin' in session:
+    if current_admin():
         return render_template('admin_dashboard.html')
     return redirect(url_for('admin_login'))
 
@@ -116,40 +572,216 @@ def generate_otp():
     """Generate a 6-digit OTP"""
     return str(random.randint(100000, 999999))
 
-def send_email_otp(email, otp):
-    """Send OTP via email"""
-    try:
-        msg = Message('District Growth - Email Verification', sender=app.config['MAIL_USERNAME'], recipients=[email])
-        msg.html = f'''
-        <html>
-        <body>
-            <h2>Email Verification - District Growth Platform</h2>
-            <p>Your OTP for email verification is: <strong>{otp}</strong></p>
-            <p>This OTP will expire in 10 minutes.</p>
-            <p>If you didn't request this, please ignore this email.</p>
-        </body>
-        </html>
-        '''
-        mail.send(msg)
-        return True
-    except Exception as e:
-        print(f"Email error: {str(e)}")
-        return False
+def admin_identity(admin):
+    """The admin_users fields kept in the identity cache"""
+    return {
+        'id': admin['id'],
+        'username': admin['username'],
+        'full_name': admin['full_name'],
+        'role': admin['role'],
+        'is_active': bool(admin['is_active'])
+    }
 
-def send_sms_otp(mobile, otp):
-    """Send OTP via SMS (Development Mode)"""
-    try:
-        # Store OTP in session for development/demo purposes
-        session['dev_otp'] = otp
-        # Log the OTP (remove in production)
-        print(f"Development Mode - SMS OTP for {mobile}: {otp}")
-        
-        # In production, implement your preferred SMS service here
-        # For now, we'll return True to simulate successful sending
-        return True
-    except Exception as e:
-        print(f"SMS error: {str(e)}")
-        return False
+def get_admin_identity(admin_id):
+    """Admin identity from the cache, loading it from admin_users on a miss"""
+    key = f'admin:{admin_id}'
+    identity = identity_cache.get(key)
+    if identity is None:
+        cursor = get_cursor()
+        cursor.execute('SELECT id, username, full_name, role, is_active FROM admin_users WHERE id = %s', (admin_id,))
+        admin = cursor.fetchone()
+        cursor.close()
+        if not admin:
+            return None
+        identity = admin_identity(admin)
+        identity_cache.set(key, identity)
+    return identity
+
+def get_user_identity(user_id):
+    """User identity from the cache, loading it from users on a miss"""
+    key = f'user:{user_id}'
+    identity = identity_cache.get(key)
+    if identity is None:
+        cursor = get_cursor()
+        cursor.execute('SELECT id, username, status FROM users WHERE id = %s', (user_id,))
+        user = cursor.fetchone()
+        cursor.close()
+        if not user:
+            return None
+        identity = {'id': user['id'], 'username': user['username'], 'status': user['status']}
+        identity_cache.set(key, identity)
+    return identity
+
+def current_admin():
+    """Identity of the logged-in admin, or None if not logged in or deactivated"""
+    if 'admin_loggedin' not in session:
+        return None
+    identity = get_admin_identity(session['admin_id'])
+    if not identity or not identity['is_active']:
+        return None
+    return identity
+
+def current_user():
+    """Identity of the logged-in user, or None if not logged in or suspended"""
+    if 'loggedin' not in session:
+        return None
+    identity = get_user_identity(session['id'])
+    if not identity or identity['status'] == 'suspended':
+        return None
+    return identity
+
+def record_activity(cursor, metric, dimension='', total=0, at=None, count=1):
+    """Add ``count`` events to the hourly and daily activity_rollups buckets.
+
+    Runs on the caller's cursor so the counters commit together with the write
+    they describe.
+    """
+    at = at or datetime.now()
+    hour_start = at.replace(minute=0, second=0, microsecond=0)
+    day_start = hour_start.replace(hour=0)
+    cursor.execute('''INSERT INTO activity_rollups 
+                    (bucket_type, bucket_start, metric, dimension, count, total) 
+                    VALUES ('hour', %s, %s, %s, %s, %s), ('day', %s, %s, %s, %s, %s) 
+                    ON DUPLICATE KEY UPDATE count = count + VALUES(count), total = total + VALUES(total)''',
+                 (hour_start, metric, dimension, count, total, day_start, metric, dimension, count, total))
+
+def audit_rollups(cursor, rows):
+    """Count flushed audit rows as admin_action activity, one upsert per action and hour"""
+    buckets = Counter((row[1], row[-1].replace(minute=0, second=0, microsecond=0)) for row in rows)
+    for (action, hour), count in buckets.items():
+        record_activity(cursor, 'admin_action', action, at=hour, count=count)
+
+audit_log = AuditLog(connect_db, AUDIT_SPILL_PATH, on_flush=audit_rollups,
+                     on_commit=lambda rows: data_versions.bump('activity'),
+                     batch_size=AUDIT_BATCH_SIZE, flush_interval=AUDIT_FLUSH_SECONDS)
+
+def audit_row(action, target_type, target_id=None, description=None):
+    """admin_activity_log row for the current admin, client address and user agent"""
+    return (session['admin_id'], action, target_type, target_id, description,
+            request.remote_addr, request.user_agent.string or None, datetime.now())
+
+def log_admin_action(action, target_type, target_id=None, description=None):
+    """Queue an admin_activity_log row; it is written in the background, off the request's transaction"""
+    audit_log.record_many([audit_row(action, target_type, target_id, description)])
+
+def send_email_otp(cursor, email, otp):
+    """Queue OTP email for background delivery"""
+    body = f'''
+    <html>
+    <body>
+        <h2>Email Verification - District Growth Platform</h2>
+        <p>Your OTP for email verification is: <strong>{otp}</strong></p>
+        <p>This OTP will expire in 10 minutes.</p>
+        <p>If you didn't request this, please ignore this email.</p>
+    </body>
+    </html>
+    '''
+    outbox.enqueue(cursor, 'email', email, body, subject='District Growth - Email Verification')
+
+def send_sms_otp(cursor, mobile, otp):
+    """Queue OTP SMS for background delivery"""
+    # Store OTP in session for development/demo purposes
+    session['dev_otp'] = otp
+    outbox.enqueue(cursor, 'sms', mobile, f'Your District Growth verification code is {otp}. It expires in 10 minutes.')
+
+@app.cli.command('sweep-otps')
+def sweep_otps_command():
+    """Delete expired OTPs in batches (run periodically from cron)"""
+    cursor = get_cursor()
+    removed = 0
+    while True:
+        batch = otp_store.sweep(cursor)
+        get_db().commit()
+        removed += batch
+        if not batch:
+            break
+    cursor.close()
+    print(f'Removed {removed} expired OTPs')
+
+@app.cli.command('flush-audit-log')
+def flush_audit_log_command():
+    """Write audit rows left in the spill file to admin_activity_log"""
+    before = audit_log.pending()
+    audit_log.flush()
+    print(f'Flushed {before - audit_log.pending()} audit rows, {audit_log.pending()} pending')
+
+@app.cli.command('outbox-worker')
+def outbox_worker_command():
+    """Deliver queued email and SMS in the foreground"""
+    outbox.run_forever()
+
+# Full-text search configuration
+# Words shorter than InnoDB's innodb_ft_min_token_size are never indexed
+FULLTEXT_MIN_TOKEN_SIZE = int(os.getenv('FULLTEXT_MIN_TOKEN_SIZE', 3))
+
+# Column groups must match a FULLTEXT index in database/schema.sql exactly
+SEARCH_INDEXES = {
+    'q': ('pp.profession', 'pp.education', 'pp.current_location', 'pp.company', 'pp.skills'),
+    'profession': ('pp.profession',),
+    'location': ('pp.current_location',),
+    'education': ('pp.education',),
+}
+
+# Search result paging and projection
+SEARCH_PAGE_SIZE = 20
+SEARCH_MAX_PAGE_SIZE = 100
+
+# Fields a client may request with ?fields=; contact details must be asked for explicitly
+SEARCH_FIELDS = {
+    'id': 'pp.id',
+    'user_id': 'pp.user_id',
+    'username': 'u.username',
+    'full_name': 'pp.full_name',
+    'profession': 'pp.profession',
+    'education': 'pp.education',
+    'experience': 'pp.experience',
+    'skills': 'pp.skills',
+    'current_location': 'pp.current_location',
+    'company': 'pp.company',
+    'salary_range': 'pp.salary_range',
+    'availability': 'pp.availability',
+    'phone': 'pp.phone',
+    'email': 'pp.email',
+    'created_at': 'pp.created_at',
+    'updated_at': 'pp.updated_at',
+}
+SEARCH_DEFAULT_FIELDS = [field for field in SEARCH_FIELDS if field not in ('phone', 'email')]
+
+def encode_cursor(values):
+    """Encode keyset values as an opaque URL-safe cursor"""
+    return base64.urlsafe_b64encode(json.dumps(values, default=str).encode()).decode().rstrip('=')
+
+def decode_cursor(cursor_token):
+    """Decode a cursor produced by encode_cursor"""
+    padding = '=' * (-len(cursor_token) % 4)
+    return json.loads(base64.urlsafe_b64decode(cursor_token + padding))
+
+def fulltext_words(term):
+    """Words of free text long enough for the full-text index"""
+    return [w for w in re.findall(r'\w+', term.lower()) if len(w) >= FULLTEXT_MIN_TOKEN_SIZE]
+
+def search_predicate(columns, term):
+    """Build the WHERE and relevance SQL for one search term.
+
+    Indexable words go through the backend's full-text match (MATCH ...
+    AGAINST on MySQL) so it can use the index, each required as a prefix.
+    Terms with words too short for the index keep a substring check, which
+    then only runs on the rows the index already narrowed down.
+    """
+    like_sql = '(' + ' OR '.join(f'{column} LIKE %s' for column in columns) + ')'
+    like_params = [f'%{term}%'] * len(columns)
+    
+    words = fulltext_words(term)
+    if not words:
+        return like_sql, like_params, None, []
+    
+    match_sql, score_sql, match_params = db_backend.text_match('professional_profiles', columns, words)
+    where_sql = match_sql
+    where_params = list(match_params)
+    if len(words) != len(re.findall(r'\w+', term)):
+        where_sql += f' AND {like_sql}'
+        where_params += like_params
+    return where_sql, where_params, score_sql, list(match_params)
 
 # API Routes
 @app.route('/api/send-otp', methods=['POST'])
@@ -166,36 +798,37 @@ def api_send_otp():
         
         # Generate OTP
         otp = generate_otp()
-        expires_at = datetime.now() + timedelta(minutes=10)
-        
-        cursor = mysql.connection.cursor(MySQLdb.cursors.DictCursor)
+        expires_at = datetime.now() + timedelta(minutes=OTP_TTL_MINUTES)
         
-        # Clean up expired OTPs
-        cursor.execute('DELETE FROM otp_verifications WHERE expires_at < %s', (datetime.now(),))
+        cursor = get_cursor()
         
-        # Store OTP in database
-        cursor.execute('''INSERT INTO otp_verifications 
-                        (email, mobile, otp_code, otp_type, expires_at) 
-                        VALUES (%s, %s, %s, %s, %s)''',
-                     (email, mobile, otp, otp_type, expires_at))
-        mysql.connection.commit()
+        # Store OTP (expired codes are removed by the sweeper, not here)
+        otp_store.issue(cursor, email, mobile, otp_type, otp, expires_at)
         
-        # Send OTP
-        email_sent = False
-        sms_sent = False
+        # Queue OTP delivery in the same transaction
+        queued = False
         
         if email and (otp_type in ['email', 'both']):
-            email_sent = send_email_otp(email, otp)
+            send_email_otp(cursor, email, otp)
+            queued = True
         
         if mobile and (otp_type in ['mobile', 'both']):
-            sms_sent = send_sms_otp(mobile, otp)
+            send_sms_otp(cursor, mobile, otp)
+            queued = True
         
+        get_db().commit()
         cursor.close()
         
-        if email_sent or sms_sent:
+        if queued:
+            outbox.start(OUTBOX_WORKERS)
+            outbox.notify()
             return jsonify({'success': True, 'message': 'OTP sent successfully!'})
         else:
             return jsonify({'success': False, 'message': 'Failed to send OTP. Please try again.'})
+    except OTPError as e:
+        # Send limit reached: 429 so clients and proxies can tell it from a failed send
+        get_db().rollback()
+        return jsonify({'success': False, 'message': str(e)}), 429
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
 
@@ -208,36 +841,21 @@ def api_verify_otp():
         mobile = data.get('mobile')
         otp_code = data.get('otp')
         
-        cursor = mysql.connection.cursor(MySQLdb.cursors.DictCursor)
+        cursor = get_cursor()
         
-        # Find valid OTP
-        query = '''SELECT * FROM otp_verifications 
-                  WHERE otp_code = %s AND expires_at > %s AND is_verified = FALSE'''
-        params = [otp_code, datetime.now()]
-        
-        if email:
-            query += ' AND email = %s'
-            params.append(email)
-        if mobile:
-            query += ' AND mobile = %s'
-            params.append(mobile)
+        try:
+            verified = otp_store.verify(cursor, email, mobile, otp_code)
+        except OTPError as e:
+            get_db().commit()
+            cursor.close()
+            return jsonify({'success': False, 'message': str(e)})
         
-        cursor.execute(query, params)
-        otp_record = cursor.fetchone()
+        get_db().commit()
+        cursor.close()
         
-        if otp_record:
-            # Update OTP as verified
-            cursor.execute('UPDATE otp_verifications SET is_verified = TRUE WHERE id = %s', 
-                         (otp_record['id'],))
-            mysql.connection.commit()
-            cursor.close()
+        if verified:
             return jsonify({'success': True, 'message': 'OTP verified successfully!'})
         else:
-            # Increment attempts
-            cursor.execute('''UPDATE otp_verifications SET attempts = attempts + 1 
-                            WHERE otp_code = %s''', (otp_code,))
-            mysql.connection.commit()
-            cursor.close()
             return jsonify({'success': False, 'message': 'Invalid or expired OTP!'})
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
@@ -255,20 +873,14 @@ def api_register():
         
         # Verify OTP first
         if otp_code:
-            cursor = mysql.connection.cursor(MySQLdb.cursors.DictCursor)
-            cursor.execute('''SELECT * FROM otp_verifications 
-                            WHERE otp_code = %s AND email = %s AND is_verified = TRUE 
-                            AND expires_at > %s''',
-                         (otp_code, email, datetime.now()))
-            otp_verified = cursor.fetchone()
-            
-            if not otp_verified:
+            cursor = get_cursor()
+            if not otp_store.is_verified(cursor, email, otp_code):
                 return jsonify({'success': False, 'message': 'Please verify your OTP first!'})
         
         # Hash password
         hashed_password = hashlib.sha256(password.encode()).hexdigest()
         
-        cursor = mysql.connection.cursor(MySQLdb.cursors.DictCursor)
+        cursor = get_cursor()
         cursor.execute('SELECT * FROM users WHERE username = %s OR email = %s', (username, email))
         account = cursor.fetchone()
         
@@ -280,14 +892,17 @@ def api_register():
                             (username, email, mobile, password, email_verified, mobile_verified, status, created_at) 
                             VALUES (%s, %s, %s, %s, %s, %s, %s, %s)''', 
                          (username, email, mobile, hashed_password, True, bool(mobile), 'active', datetime.now()))
-            mysql.connection.commit()
+            user_id = cursor.lastrowid
+            record_activity(cursor, 'registration')
             
             # Clean up verified OTP
             if otp_code:
-                cursor.execute('DELETE FROM otp_verifications WHERE otp_code = %s', (otp_code,))
-                mysql.connection.commit()
+                otp_store.consume(cursor, email, otp_code)
+            get_db().commit()
             
             cursor.close()
+            data_versions.bump('users')
+            event_bus.publish('registration', {'id': user_id, 'username': username})
             return jsonify({'success': True, 'message': 'Registration successful!'})
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
@@ -302,7 +917,7 @@ def api_login():
         
         hashed_password = hashlib.sha256(password.encode()).hexdigest()
         
-        cursor = mysql.connection.cursor(MySQLdb.cursors.DictCursor)
+        cursor = get_cursor()
         cursor.execute('SELECT * FROM users WHERE username = %s AND password = %s', (username, hashed_password))
         account = cursor.fetchone()
         cursor.close()
@@ -311,16 +926,29 @@ def api_login():
             session['loggedin'] = True
             session['id'] = account['id']
             session['username'] = account['username']
+            identity_cache.set(f"user:{account['id']}",
+                               {'id': account['id'], 'username': account['username'], 'status': account['status']})
             return jsonify({'success': True, 'message': 'Login successful!'})
         else:
             return jsonify({'success': False, 'message': 'Incorrect username/password!'})
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
 
+# Profile columns written by the profile form and the bulk import, in statement order
+PROFILE_COLUMNS = ('user_id', 'full_name', 'profession', 'education', 'experience', 'skills',
+                   'current_location', 'phone', 'email', 'company', 'salary_range', 'availability',
+                   'created_at', 'updated_at')
+
+# One statement creates or replaces a user's profile (user_id is unique); created_at is kept on update
+PROFILE_UPSERT_SQL = f'''INSERT INTO professional_profiles ({', '.join(PROFILE_COLUMNS)}) 
+    VALUES ({', '.join(['%s'] * len(PROFILE_COLUMNS))}) 
+    ON DUPLICATE KEY UPDATE {', '.join(f'{column} = VALUES({column})' for column in PROFILE_COLUMNS
+                                       if column not in ('user_id', 'created_at'))}'''
+
 @app.route('/api/profile', methods=['POST'])
 def api_profile():
     """Handle professional profile data submission"""
-    if 'loggedin' not in session:
+    if not current_user():
         return jsonify({'success': False, 'message': 'Please login first'})
     
     try:
@@ -340,132 +968,396 @@ def api_profile():
         salary_range = data.get('salary_range', '')
         availability = data.get('availability', '')
         
-        cursor = mysql.connection.cursor(MySQLdb.cursors.DictCursor)
-        
-        # Check if profile exists
-        cursor.execute('SELECT * FROM professional_profiles WHERE user_id = %s', (user_id,))
-        existing = cursor.fetchone()
-        
-        if existing:
-            # Update existing profile
-            cursor.execute('''UPDATE professional_profiles SET 
-                            full_name=%s, profession=%s, education=%s, experience=%s, 
-                            skills=%s, current_location=%s, phone=%s, email=%s, company=%s, 
-                            salary_range=%s, availability=%s, updated_at=%s 
-                            WHERE user_id=%s''',
-                         (full_name, profession, education, experience, skills, 
-                          current_location, phone, profile_email, company, salary_range, 
-                          availability, datetime.now(), user_id))
-        else:
-            # Insert new profile
-            cursor.execute('''INSERT INTO professional_profiles 
-                            (user_id, full_name, profession, education, experience, 
-                             skills, current_location, phone, email, company, salary_range, 
-                             availability, created_at, updated_at) 
-                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)''',
-                         (user_id, full_name, profession, education, experience, 
-                          skills, current_location, phone, profile_email, company, salary_range, 
-                          availability, datetime.now(), datetime.now()))
-        
-        mysql.connection.commit()
+        cursor = get_cursor()
+        now = datetime.now()
+        cursor.execute(PROFILE_UPSERT_SQL,
+                     (user_id, full_name, profession, education, experience, 
+                      skills, current_location, phone, profile_email, company, salary_range, 
+                      availability, now, now))
+        # Affected rows: 1 when the profile was inserted, 2 when an existing one was updated
+        event_type = 'profile_created' if cursor.rowcount == 1 else 'profile_updated'
+        record_activity(cursor, event_type)
+        sync_user_skills(cursor, user_id, skills)
+        
+        get_db().commit()
         cursor.close()
+        data_versions.bump('profiles')
+        event_bus.publish(event_type, {'user_id': user_id, 'full_name': full_name, 'profession': profession})
+        
+        # profile_stats was adjusted by its triggers; drop this worker's cached copy
+        analytics_cache.invalidate()
+        if event_type == 'profile_updated':
+            # The old values are not known here, so the counts are rebuilt from the table
+            suggest_indexes.refresh()
+        else:
+            for field, value in (('profession', profession), ('location', current_location),
+                                 ('education', education)):
+                suggest_indexes.add(field, value)
+        mark_user_write()
         
         return jsonify({'success': True, 'message': 'Profile updated successfully!'})
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
 
 @app.route('/api/search', methods=['GET'])
+@conditional('profiles', 'users')
 def api_search():
-    """Handle professional search queries"""
+    """Handle professional search queries, ranked by full-text relevance.
+
+    Results come back one page at a time: pass the returned ``next_cursor`` as
+    ``cursor`` to continue. ``format=ndjson`` streams every match instead,
+    one JSON object per line, from a server-side cursor.
+    """
     try:
-        profession = request.args.get('profession', '')
-        location = request.args.get('location', '')
-        education = request.args.get('education', '')
         experience = request.args.get('experience', '')
+        stream = request.args.get('format') == 'ndjson'
+        limit = request.args.get('limit', type=int)
+        if not stream or limit:
+            limit = max(1, min(limit or SEARCH_PAGE_SIZE, SEARCH_MAX_PAGE_SIZE))
         
-        cursor = mysql.connection.cursor(MySQLdb.cursors.DictCursor)
+        fields = [f.strip() for f in request.args.get('fields', '').split(',') if f.strip()]
+        unknown_fields = [f for f in fields if f not in SEARCH_FIELDS]
+        if unknown_fields:
+            return jsonify({'success': False, 'message': f'Unknown fields: {", ".join(unknown_fields)}'})
+        fields = fields or SEARCH_DEFAULT_FIELDS
         
         # Build dynamic query
-        query = '''SELECT pp.*, u.username FROM professional_profiles pp 
-                  JOIN users u ON pp.user_id = u.id WHERE 1=1'''
-        params = []
+        where_clause = 'WHERE 1=1'
+        where_params = []
+        score_parts = []
+        score_params = []
+        
+        for param, columns in SEARCH_INDEXES.items():
+            term = request.args.get(param, '').strip()
+            if not term:
+                continue
+            where_sql, params, score_sql, score_sql_params = search_predicate(columns, term)
+            # A known value also matches its other spellings, which the text match may miss
+            variants = suggest_variants(param, term)
+            if variants:
+                where_sql = f"({where_sql} OR {columns[0]} IN ({', '.join(['%s'] * len(variants))}))"
+                params = params + variants
+            where_clause += f' AND {where_sql}'
+            where_params.extend(params)
+            if score_sql:
+                score_parts.append(score_sql)
+                score_params.extend(score_sql_params)
         
-        if profession:
-            query += ' AND pp.profession LIKE %s'
-            params.append(f'%{profession}%')
-        if location:
-            query += ' AND pp.current_location LIKE %s'
-            params.append(f'%{location}%')
-        if education:
-            query += ' AND pp.education LIKE %s'
-            params.append(f'%{education}%')
         if experience:
-            query += ' AND pp.experience >= %s'
-            params.append(experience)
-        
-        cursor.execute(query, params)
+            where_clause += ' AND pp.experience >= %s'
+            where_params.append(experience)
+        
+        # Skill filters resolve through user_skills, not the free-text skills column
+        skill_sql, skill_params = skill_filter(parse_skills(request.args.get('skills', '')),
+                                               request.args.get('skill_category', '').strip())
+        if skill_sql:
+            where_clause += f' AND {skill_sql}'
+            where_params.extend(skill_params)
+        
+        relevance = ' + '.join(score_parts) if score_parts else '0'
+        columns = ', '.join(f'{SEARCH_FIELDS[f]} AS {f}' for f in fields if f != 'id')
+        query = f'''SELECT pp.id AS id, {columns}, {relevance} AS relevance 
+                   FROM professional_profiles pp 
+                   JOIN users u ON pp.user_id = u.id {where_clause}'''
+        params = score_params + where_params
+        
+        # Keyset pagination on (relevance, id); the derived table lets both backends filter on the alias
+        cursor_token = request.args.get('cursor')
+        if cursor_token:
+            last_relevance, last_id = decode_cursor(cursor_token)
+            query = f'''SELECT * FROM ({query}) results 
+                       WHERE relevance < %s OR (relevance = %s AND id < %s)'''
+            params += [last_relevance, last_relevance, last_id]
+        query += ' ORDER BY relevance DESC, id DESC'
+        
+        if stream:
+            if limit:
+                query += ' LIMIT %s'
+                params.append(limit)
+            return Response(stream_with_context(stream_search_results(query, params)),
+                            mimetype='application/x-ndjson')
+        
+        cursor = get_cursor(readonly=True)
+        cursor.execute(query + ' LIMIT %s', params + [limit + 1])
         results = cursor.fetchall()
         cursor.close()
         
-        return jsonify({'success': True, 'data': results})
+        next_cursor = None
+        if len(results) > limit:
+            results = results[:limit]
+            next_cursor = encode_cursor([results[-1]['relevance'], results[-1]['id']])
+        
+        return jsonify({
+            'success': True,
+            'data': results,
+            'pagination': {
+                'limit': limit,
+                'next_cursor': next_cursor
+            }
+        })
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
 
-@app.route('/api/analytics', methods=['GET'])
-def api_analytics():
-    """Get district growth analytics data"""
+def stream_search_results(query, params):
+    """Yield search rows as NDJSON lines without buffering the result set"""
+    cursor = get_cursor(db_backend.stream_cursor, readonly=True)
     try:
-        cursor = mysql.connection.cursor(MySQLdb.cursors.DictCursor)
-        
-        # Get profession distribution
-        cursor.execute('''SELECT profession, COUNT(*) as count 
-                         FROM professional_profiles 
-                         GROUP BY profession 
-                         ORDER BY count DESC''')
-        profession_stats = cursor.fetchall()
-        
-        # Get location distribution
-        cursor.execute('''SELECT current_location, COUNT(*) as count 
-                         FROM professional_profiles 
-                         GROUP BY current_location 
-                         ORDER BY count DESC''')
-        location_stats = cursor.fetchall()
-        
-        # Get education distribution
-        cursor.execute('''SELECT education, COUNT(*) as count 
-                         FROM professional_profiles 
-                         GROUP BY education 
-                         ORDER BY count DESC''')
-        education_stats = cursor.fetchall()
-        
-        # Get experience distribution
-        cursor.execute('''SELECT 
-                         CASE 
+        cursor.execute(query, params)
+        for row in cursor:
+            yield json.dumps(row, default=str) + '\n'
+    finally:
+        cursor.close()
+
+# Free-text profile columns with autocomplete; keys match profile_stats dimensions
+SUGGEST_FIELDS = {
+    'profession': {'column': 'pp.profession', 'location': False},
+    'location': {'column': 'pp.current_location', 'location': True},
+    'education': {'column': 'pp.education', 'location': False},
+}
+
+def load_suggest_values(cursor):
+    """(field, value, count) for the distinct values counted in profile_stats"""
+    cursor.execute('''SELECT dimension, value, count FROM profile_stats 
+                     WHERE dimension IN ('profession', 'location', 'education') AND count > 0''')
+    return [(row['dimension'], row['value'], row['count']) for row in cursor.fetchall()]
+
+suggest_indexes = SuggestIndexes(connect_db, db_backend.dict_cursor, load_suggest_values,
+                                 {field: options['location'] for field, options in SUGGEST_FIELDS.items()},
+                                 rebuild_interval=SUGGEST_REBUILD_SECONDS)
+
+def get_suggest_indexes():
+    return suggest_indexes.get()
+
+def suggest_variants(field, term):
+    """All stored spellings of ``term`` when it is a known value of ``field``, else []"""
+    if field not in SUGGEST_FIELDS:
+        return []
+    return get_suggest_indexes()[field].variants(term)
+
+@app.route('/api/suggest', methods=['GET'])
+def api_suggest():
+    """Typo-tolerant completions for profession, location or education"""
+    field = request.args.get('field', '')
+    if field not in SUGGEST_FIELDS:
+        return jsonify({'success': False, 'message': 'Invalid field'})
+    
+    try:
+        limit = max(1, min(request.args.get('limit', 8, type=int), 20))
+        suggestions = get_suggest_indexes()[field].suggest(request.args.get('q', ''), limit)
+        return jsonify({'success': True, 'data': suggestions})
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)})
+
+@app.route('/api/suggest/canonical', methods=['GET'])
+def api_suggest_canonical():
+    """Map of each variant spelling of a field's values to its canonical spelling"""
+    field = request.args.get('field', '')
+    if field not in SUGGEST_FIELDS:
+        return jsonify({'success': False, 'message': 'Invalid field'})
+    
+    try:
+        return jsonify({'success': True, 'data': get_suggest_indexes()[field].canonical_map()})
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)})
+
+# Maps profile_stats dimensions to the keys the analytics page expects
+ANALYTICS_DIMENSIONS = {
+    'profession': ('profession_stats', 'profession'),
+    'location': ('location_stats', 'current_location'),
+    'education': ('education_stats', 'education'),
+    'experience': ('experience_stats', 'experience_level'),
+}
+
+def load_profile_stats():
+    """Read the precomputed analytics counts maintained by the profile_stats triggers"""
+    cursor = get_cursor(readonly=True)
+    cursor.execute('''SELECT dimension, value, count FROM profile_stats 
+                     WHERE count > 0 
+                     ORDER BY count DESC''')
+    rows = cursor.fetchall()
+    cursor.close()
+    
+    # Variant spellings ("Palwal, Haryana", "palwal") are counted under their canonical value
+    indexes = get_suggest_indexes()
+    counts = {dimension: {} for dimension in ANALYTICS_DIMENSIONS}
+    for row in rows:
+        value = row['value']
+        if row['dimension'] in indexes:
+            value = indexes[row['dimension']].canonical(value)
+        counts[row['dimension']][value] = counts[row['dimension']].get(value, 0) + row['count']
+    
+    stats = {}
+    for dimension, (key, label) in ANALYTICS_DIMENSIONS.items():
+        merged = sorted(counts[dimension].items(), key=lambda item: item[1], reverse=True)
+        stats[key] = [{label: value, 'count': count} for value, count in merged]
+    return stats
+
+def rebuild_profile_stats():
+    """Recompute profile_stats from professional_profiles in one transaction"""
+    cursor = get_cursor(db_backend.tuple_cursor)
+    cursor.execute('DELETE FROM profile_stats')
+    cursor.execute('''INSERT INTO profile_stats (dimension, value, count)
+                     SELECT 'profession', profession, COUNT(*) FROM professional_profiles GROUP BY profession
+                     UNION ALL
+                     SELECT 'location', current_location, COUNT(*) FROM professional_profiles GROUP BY current_location
+                     UNION ALL
+                     SELECT 'education', education, COUNT(*) FROM professional_profiles GROUP BY education
+                     UNION ALL
+                     SELECT 'experience', experience_level, COUNT(*) FROM (
+                         SELECT CASE 
                          WHEN experience < 2 THEN 'Fresher (0-2 years)'
                          WHEN experience < 5 THEN 'Mid-level (2-5 years)'
                          WHEN experience < 10 THEN 'Senior (5-10 years)'
                          ELSE 'Expert (10+ years)'
-                         END as experience_level,
-                         COUNT(*) as count
-                         FROM professional_profiles 
-                         GROUP BY experience_level 
-                         ORDER BY count DESC''')
-        experience_stats = cursor.fetchall()
-        
-        cursor.close()
+                         END AS experience_level
+                         FROM professional_profiles
+                     ) buckets GROUP BY experience_level''')
+    get_db().commit()
+    cursor.close()
+    analytics_cache.invalidate()
+    data_versions.bump('profiles')
+
+@app.cli.command('rebuild-analytics')
+def rebuild_analytics_command():
+    """Rebuild the profile_stats analytics counts (run periodically from cron)"""
+    rebuild_profile_stats()
+    print('profile_stats rebuilt')
+
+@app.cli.command('rebuild-skills')
+def rebuild_skills_command():
+    """Backfill user_skills from the free-text skills column of every profile"""
+    cursor = get_cursor()
+    cursor.execute('SELECT user_id, skills FROM professional_profiles ORDER BY user_id')
+    profiles = cursor.fetchall()
+    for i, profile in enumerate(profiles, 1):
+        sync_user_skills(cursor, profile['user_id'], profile['skills'])
+        if i % 500 == 0:
+            get_db().commit()
+    get_db().commit()
+    cursor.close()
+    data_versions.bump('profiles')
+    print(f'user_skills rebuilt for {len(profiles)} profiles')
+
+@app.route('/api/analytics', methods=['GET'])
+@conditional('profiles')
+def api_analytics():
+    """Get district growth analytics data from the precomputed counts"""
+    try:
+        stats = analytics_cache.get_or_set('profile_stats', load_profile_stats)
         
         return jsonify({
             'success': True,
-            'data': {
-                'profession_stats': profession_stats,
-                'location_stats': location_stats,
-                'education_stats': education_stats,
-                'experience_stats': experience_stats
-            }
+            'data': stats
         })
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
 
+# Job Matching API Routes
+JOB_FIELDS = ('title', 'description', 'company', 'location', 'salary_range', 'requirements',
+              'job_type', 'education', 'min_experience', 'max_experience')
+
+@app.route('/api/jobs', methods=['POST'])
+def api_post_job():
+    """Post a job opportunity; ``skills`` is free text like a profile's.
+
+    Sharing openings is open to every member, so there is no employer role;
+    the account must be active (not pending verification) and the job records
+    it in ``posted_by``.
+    """
+    user = current_user()
+    if not user:
+        return jsonify({'success': False, 'message': 'Please login first'})
+    if user['status'] != 'active':
+        return jsonify({'success': False, 'message': 'Only active members can post jobs'})
+    
+    try:
+        data = request.get_json()
+        job = {field: data.get(field) for field in JOB_FIELDS}
+        job = {field: None if value == '' else value for field, value in job.items()}
+        if not all(job[field] for field in ('title', 'description', 'company', 'location')):
+            return jsonify({'success': False, 'message': 'Title, description, company and location are required'})
+        job['job_type'] = job['job_type'] or 'Full-time'
+        
+        cursor = get_cursor()
+        columns = ', '.join(JOB_FIELDS)
+        placeholders = ', '.join(['%s'] * len(JOB_FIELDS))
+        cursor.execute(f'''INSERT INTO job_opportunities (posted_by, {columns}, created_at) 
+                         VALUES (%s, {placeholders}, %s)''',
+                       [user['id']] + [job[field] for field in JOB_FIELDS] + [datetime.now()])
+        job_id = cursor.lastrowid
+        sync_job_skills(cursor, job_id, data.get('skills', ''))
+        get_db().commit()
+        cursor.close()
+        data_versions.bump('jobs')
+        
+        mark_user_write()
+        
+        return jsonify({'success': True, 'message': 'Job posted successfully!', 'job_id': job_id})
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)})
+
+def ranked_matches(finder, entity_id, limit, query):
+    """Rank with the match engine and attach the display rows fetched by ``query``.
+
+    If ``entity_id`` is not indexed yet (e.g. just posted), the engine is
+    refreshed once before giving up.
+    """
+    cursor = get_cursor(readonly=True)
+    match_engine.refresh(cursor)
+    ranked = finder(entity_id, limit)
+    if ranked is None:
+        match_engine.refresh(cursor, force=True)
+        ranked = finder(entity_id, limit)
+    if not ranked:
+        cursor.close()
+        return ranked
+    
+    ids = [match_id for match_id, _, _ in ranked]
+    placeholders = ', '.join(['%s'] * len(ids))
+    cursor.execute(query.format(placeholders=placeholders), ids)
+    rows = {row['id']: row for row in cursor.fetchall()}
+    cursor.close()
+    return [dict(rows[match_id], score=score, signals=signals)
+            for match_id, score, signals in ranked if match_id in rows]
+
+@app.route('/api/jobs/<int:job_id>/matches', methods=['GET'])
+def api_job_matches(job_id):
+    """Top profiles for a job by skill overlap, location, experience, education and availability"""
+    if not current_user() and not current_admin():
+        return jsonify({'success': False, 'message': 'Please login first'})
+    
+    try:
+        limit = max(1, min(request.args.get('limit', 10, type=int), MATCH_MAX_RESULTS))
+        matches = ranked_matches(match_engine.profiles_for_job, job_id, limit,
+                                 '''SELECT id, full_name, profession, education, experience, 
+                                    current_location, company, availability 
+                                    FROM professional_profiles WHERE id IN ({placeholders})''')
+        if matches is None:
+            return jsonify({'success': False, 'message': 'Job not found'})
+        
+        return jsonify({'success': True, 'data': matches})
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)})
+
+@app.route('/api/profiles/<int:profile_id>/jobs', methods=['GET'])
+def api_profile_jobs(profile_id):
+    """Top open jobs for a profile, scored the same way as job matches"""
+    if not current_user() and not current_admin():
+        return jsonify({'success': False, 'message': 'Please login first'})
+    
+    try:
+        limit = max(1, min(request.args.get('limit', 10, type=int), MATCH_MAX_RESULTS))
+        matches = ranked_matches(match_engine.jobs_for_profile, profile_id, limit,
+                                 '''SELECT id, title, company, location, salary_range, job_type, 
+                                    education, min_experience, max_experience 
+                                    FROM job_opportunities WHERE id IN ({placeholders})''')
+        if matches is None:
+            return jsonify({'success': False, 'message': 'Profile not found'})
+        
+        return jsonify({'success': True, 'data': matches})
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)})
+
 @app.route('/api/feedback', methods=['POST'])
 def api_feedback():
     """Handle feedback and suggestions submission"""
@@ -478,15 +1370,20 @@ def api_feedback():
         message = data['message']
         rating = data.get('rating', 0)
         
-        cursor = mysql.connection.cursor(MySQLdb.cursors.DictCursor)
+        cursor = get_cursor()
         cursor.execute('''INSERT INTO feedback 
                         (name, email, feedback_type, subject, message, rating, 
                          user_id, created_at) 
                         VALUES (%s, %s, %s, %s, %s, %s, %s, %s)''',
                      (name, email, feedback_type, subject, message, rating, 
                       session.get('id'), datetime.now()))
-        mysql.connection.commit()
+        record_activity(cursor, 'feedback', feedback_type, int(rating or 0))
+        get_db().commit()
         cursor.close()
+        data_versions.bump('feedback')
+        event_bus.publish('feedback', {'feedback_type': feedback_type, 'subject': subject, 'rating': rating})
+        
+        mark_user_write()
         
         return jsonify({'success': True, 'message': 'Thank you for your feedback! We appreciate your input.'})
     except Exception as e:
@@ -503,7 +1400,7 @@ def api_admin_login():
         
         hashed_password = hashlib.sha256(password.encode()).hexdigest()
         
-        cursor = mysql.connection.cursor(MySQLdb.cursors.DictCursor)
+        cursor = get_cursor()
         cursor.execute('SELECT * FROM admin_users WHERE username = %s AND password = %s AND is_active = TRUE', 
                      (username, hashed_password))
         admin = cursor.fetchone()
@@ -512,13 +1409,14 @@ def api_admin_login():
             # Update last login
             cursor.execute('UPDATE admin_users SET last_login = %s WHERE id = %s', 
                          (datetime.now(), admin['id']))
-            mysql.connection.commit()
+            get_db().commit()
             
             # Set session
             session['admin_loggedin'] = True
             session['admin_id'] = admin['id']
             session['admin_username'] = admin['username']
             session['admin_role'] = admin['role']
+            identity_cache.set(f"admin:{admin['id']}", admin_identity(admin))
             
             cursor.close()
             return jsonify({'success': True, 'message': 'Admin login successful!'})
@@ -528,233 +1426,474 @@ def api_admin_login():
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
 
+def admin_session_data(admin):
+    return {
+        'id': admin['id'],
+        'username': admin['username'],
+        'full_name': admin['full_name'],
+        'role': admin['role']
+    }
+
 @app.route('/api/admin-session', methods=['GET'])
 def api_admin_session():
-    """Check admin session"""
-    if 'admin_loggedin' in session:
-        cursor = mysql.connection.cursor(MySQLdb.cursors.DictCursor)
-        cursor.execute('SELECT * FROM admin_users WHERE id = %s', (session['admin_id'],))
-        admin = cursor.fetchone()
-        cursor.close()
-        
-        if admin:
-            return jsonify({
-                'success': True,
-                'admin': {
-                    'id': admin['id'],
-                    'username': admin['username'],
-                    'full_name': admin['full_name'],
-                    'role': admin['role']
-                }
-            })
+    """Check admin session (served from the identity cache)"""
+    admin = current_admin()
+    if admin:
+        return jsonify({
+            'success': True,
+            'admin': admin_session_data(admin)
+        })
     
     return jsonify({'success': False, 'message': 'Not authenticated'})
 
+@app.cli.command('set-admin')
+@click.argument('username')
+@click.option('--role', type=click.Choice(['admin', 'manager', 'viewer']))
+@click.option('--active/--inactive', default=None)
+def set_admin_command(username, role, active):
+    """Change an admin's role or active flag and drop their cached identity"""
+    cursor = get_cursor()
+    cursor.execute('SELECT id FROM admin_users WHERE username = %s', (username,))
+    admin = cursor.fetchone()
+    if not admin:
+        print(f'No admin named {username}')
+        return
+    if role:
+        cursor.execute('UPDATE admin_users SET role = %s WHERE id = %s', (role, admin['id']))
+    if active is not None:
+        cursor.execute('UPDATE admin_users SET is_active = %s WHERE id = %s', (active, admin['id']))
+    get_db().commit()
+    cursor.close()
+    identity_cache.invalidate(f"admin:{admin['id']}")
+    data_versions.bump('admins')
+    print(f'Updated {username}')
+
+@app.route('/api/admin-db-pool', methods=['GET'])
+def api_admin_db_pool():
+    """Get primary and replica connection pool usage for this worker"""
+    if not current_admin():
+        return jsonify({'success': False, 'message': 'Not authorized'})
+    
+    return jsonify({
+        'success': True,
+        'data': {
+            'primary': db_pool.stats(),
+            'replicas': replica_set.stats()
+        }
+    })
+
+def admin_stats_data(cursor):
+    """Headline counts for the dashboard; the totals share the admin list count cache"""
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    cursor.execute('SELECT COUNT(*) as count FROM users WHERE created_at >= %s', (today,))
+    today_registrations = cursor.fetchone()['count']
+    
+    return {
+        'total_users': cached_count(cursor, 'users', 'WHERE 1=1', []),
+        'total_profiles': cached_count(cursor, 'professional_profiles', 'WHERE 1=1', []),
+        'today_registrations': today_registrations,
+        'total_feedback': cached_count(cursor, 'feedback', 'WHERE 1=1', [])
+    }
+
 @app.route('/api/admin-stats', methods=['GET'])
+@conditional('users', 'profiles', 'feedback', auth=current_admin)
 def api_admin_stats():
     """Get admin dashboard statistics"""
-    if 'admin_loggedin' not in session:
+    if not current_admin():
         return jsonify({'success': False, 'message': 'Not authorized'})
     
     try:
-        cursor = mysql.connection.cursor(MySQLdb.cursors.DictCursor)
-        
-        # Total users
-        cursor.execute('SELECT COUNT(*) as count FROM users')
-        total_users = cursor.fetchone()['count']
-        
-        # Total profiles
-        cursor.execute('SELECT COUNT(*) as count FROM professional_profiles')
-        total_profiles = cursor.fetchone()['count']
-        
-        # Today's registrations
-        cursor.execute('SELECT COUNT(*) as count FROM users WHERE DATE(created_at) = CURDATE()')
-        today_registrations = cursor.fetchone()['count']
+        cursor = get_cursor(readonly=True)
+        data = admin_stats_data(cursor)
+        cursor.close()
         
-        # Total feedback
-        cursor.execute('SELECT COUNT(*) as count FROM feedback')
-        total_feedback = cursor.fetchone()['count']
+        return jsonify({
+            'success': True,
+            'data': data
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)})
+
+def rebuild_activity_rollups():
+    """Recompute activity_rollups from the raw tables in one transaction.
+
+    Profile updates are only recoverable as each profile's latest update, so a
+    rebuild undercounts profile_updated for profiles edited more than once.
+    """
+    sources = [
+        ("'registration'", "''", '0', 'users', 'created_at', ''),
+        ("'profile_created'", "''", '0', 'professional_profiles', 'created_at', ''),
+        ("'profile_updated'", "''", '0', 'professional_profiles', 'updated_at', 'WHERE updated_at > created_at'),
+        ("'feedback'", 'feedback_type', 'rating', 'feedback', 'created_at', ''),
+        ("'admin_action'", 'action', '0', 'admin_activity_log', 'created_at', ''),
+    ]
+    buckets = [
+        ("'hour'", db_backend.hour_bucket),
+        ("'day'", db_backend.day_bucket),
+    ]
+    
+    cursor = get_cursor(db_backend.tuple_cursor)
+    cursor.execute('DELETE FROM activity_rollups')
+    for metric, dimension, total, table, column, where_clause in sources:
+        for bucket_type, bucket_expr in buckets:
+            bucket_start = bucket_expr(column)
+            cursor.execute(f'''INSERT INTO activity_rollups 
+                            (bucket_type, bucket_start, metric, dimension, count, total) 
+                            SELECT {bucket_type}, {bucket_start}, {metric}, {dimension}, COUNT(*), COALESCE(SUM({total}), 0) 
+                            FROM {table} {where_clause} 
+                            GROUP BY {bucket_start}, {dimension}''')
+    get_db().commit()
+    cursor.close()
+    data_versions.bump('activity')
+
+@app.cli.command('rebuild-rollups')
+def rebuild_rollups_command():
+    """Backfill activity_rollups from users, profiles, feedback and the admin log"""
+    rebuild_activity_rollups()
+    print('activity_rollups rebuilt')
+
+@app.cli.command('generate-data')
+@click.option('--profiles', default=10000, help='Users with a profile and skills')
+@click.option('--users', type=int, help='Users in total (default: 10% more than --profiles)')
+@click.option('--feedback', default=2000)
+@click.option('--otps', default=20000, help='otp_verifications rows')
+@click.option('--admin-actions', default=5000, help='admin_activity_log rows')
+@click.option('--days', default=365, help='Spread created_at over this many days')
+@click.option('--seed', default=42)
+@click.option('--batch-size', default=2000)
+def generate_data_command(profiles, users, feedback, otps, admin_actions, days, seed, batch_size):
+    """Fill the database with synthetic district data for load testing (not for production)"""
+    users = max(users or int(profiles * 1.1), profiles)
+    connection = connect_db()
+    generator = DataGenerator(connection, seed=seed, batch_size=batch_size, days=days)
+    generator.users(users, profiles)
+    generator.feedback(feedback)
+    generator.otps(otps)
+    generator.admin_actions(admin_actions)
+    connection.close()
+    rebuild_activity_rollups()
+    data_versions.bump('users', 'profiles', 'feedback', 'activity')
+    print(f'Generated {users} users, {profiles} profiles, {feedback} feedback, {otps} OTPs, '
+          f'{admin_actions} admin actions; password for every user: {GENERATED_PASSWORD}')
+
+def admin_analytics_data(cursor, days=30, granularity='day'):
+    """Growth trends and totals from the activity rollups"""
+    now = datetime.now()
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    since = today - timedelta(days=days - 1)
+    week_start = today - timedelta(days=6)
+    month_start = today.replace(day=1)
+    
+    # Trend buckets for the requested window
+    cursor.execute('''SELECT bucket_start, metric, dimension, count, total 
+                     FROM activity_rollups 
+                     WHERE bucket_type = %s AND bucket_start >= %s 
+                     ORDER BY bucket_start''', (granularity, since))
+    buckets = cursor.fetchall()
+    
+    # All-time totals from the daily buckets
+    cursor.execute('''SELECT metric, dimension, SUM(count) as count, SUM(total) as total 
+                     FROM activity_rollups 
+                     WHERE bucket_type = 'day' 
+                     GROUP BY metric, dimension''')
+    totals = cursor.fetchall()
+    
+    # This week's and this month's registrations
+    cursor.execute('''SELECT 
+                     COALESCE(SUM(CASE WHEN bucket_start >= %s THEN count END), 0) as weekly, 
+                     COALESCE(SUM(CASE WHEN bucket_start >= %s THEN count END), 0) as monthly 
+                     FROM activity_rollups 
+                     WHERE bucket_type = 'day' AND metric = 'registration' AND bucket_start >= %s''',
+                   (week_start, month_start, min(week_start, month_start)))
+    recent = cursor.fetchone()
+    
+    step = timedelta(hours=1) if granularity == 'hour' else timedelta(days=1)
+    label_format = '%Y-%m-%d %H:00' if granularity == 'hour' else '%Y-%m-%d'
+    slots = []
+    slot = since
+    while slot <= now:
+        slots.append(slot)
+        slot += step
+    
+    def trend(metric):
+        counts = dict.fromkeys(slots, 0)
+        for row in buckets:
+            if row['metric'] == metric and row['bucket_start'] in counts:
+                counts[row['bucket_start']] += row['count']
+        return [{'date': slot.strftime(label_format), 'count': count} for slot, count in counts.items()]
+    
+    metric_totals = {}
+    feedback_by_type = []
+    admin_actions = []
+    for row in totals:
+        count, total = int(row['count']), int(row['total'])
+        metric_count, metric_total = metric_totals.get(row['metric'], (0, 0))
+        metric_totals[row['metric']] = (metric_count + count, metric_total + total)
+        if row['metric'] == 'feedback':
+            feedback_by_type.append({
+                'feedback_type': row['dimension'],
+                'count': count,
+                'avg_rating': round(total / count, 2) if count else 0
+            })
+        elif row['metric'] == 'admin_action':
+            admin_actions.append({'action': row['dimension'], 'count': count})
+    
+    total_users = metric_totals.get('registration', (0, 0))[0]
+    total_profiles = metric_totals.get('profile_created', (0, 0))[0]
+    feedback_count, rating_total = metric_totals.get('feedback', (0, 0))
+    
+    return {
+        'growth_stats': {
+            'weekly_registrations': int(recent['weekly']),
+            'monthly_registrations': int(recent['monthly']),
+            'profile_completion_rate': round(total_profiles * 100 / total_users, 1) if total_users else 0,
+            'avg_rating': rating_total / feedback_count if feedback_count else 0
+        },
+        'granularity': granularity,
+        'registration_trends': trend('registration'),
+        'profile_created_trends': trend('profile_created'),
+        'profile_updated_trends': trend('profile_updated'),
+        'feedback_trends': trend('feedback'),
+        'admin_action_trends': trend('admin_action'),
+        'feedback_by_type': sorted(feedback_by_type, key=lambda item: item['count'], reverse=True),
+        'admin_actions': sorted(admin_actions, key=lambda item: item['count'], reverse=True)
+    }
+
+@app.route('/api/admin-analytics', methods=['GET'])
+@conditional('users', 'profiles', 'feedback', 'activity', auth=current_admin)
+def api_admin_analytics():
+    """Get growth trends for the admin dashboard from the activity rollups"""
+    if not current_admin():
+        return jsonify({'success': False, 'message': 'Not authorized'})
+    
+    try:
+        days = max(1, min(request.args.get('days', 30, type=int), 366))
+        granularity = request.args.get('granularity', 'day')
+        if granularity not in ('hour', 'day'):
+            return jsonify({'success': False, 'message': 'Invalid granularity'})
         
+        cursor = get_cursor(readonly=True)
+        data = admin_analytics_data(cursor, days, granularity)
         cursor.close()
         
         return jsonify({
             'success': True,
-            'data': {
-                'total_users': total_users,
-                'total_profiles': total_profiles,
-                'today_registrations': today_registrations,
-                'total_feedback': total_feedback
-            }
+            'data': data
         })
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
 
+def cached_count(cursor, table, where_clause, params):
+    """COUNT(*) for an admin list filter, cached for ADMIN_COUNT_CACHE_TTL seconds"""
+    def count():
+        cursor.execute(f'SELECT COUNT(*) as total FROM {table} {where_clause}', params)
+        return cursor.fetchone()['total']
+    return count_cache.get_or_set((table, where_clause, tuple(params)), count)
+
+def admin_list_page(cursor, table, where_clause, params, sort_column, page=1, cursor_token=None):
+    """Fetch one page of an admin list ordered by (sort_column, id) descending.
+
+    With ``cursor_token`` the page is found by seeking past the last row seen,
+    so deep pages cost the same as the first; otherwise ``page`` uses OFFSET.
+    Both modes return a ``next_cursor`` for the following page.
+    """
+    limit = ADMIN_PAGE_SIZE
+    total_items = cached_count(cursor, table, where_clause, params)
+    total_pages = (total_items + limit - 1) // limit
+    
+    if cursor_token:
+        last_sort, last_id = decode_cursor(cursor_token)
+        query = f'''SELECT * FROM {table} {where_clause} 
+                   AND ({sort_column} < %s OR ({sort_column} = %s AND id < %s)) 
+                   ORDER BY {sort_column} DESC, id DESC LIMIT %s'''
+        cursor.execute(query, list(params) + [last_sort, last_sort, last_id, limit + 1])
+    else:
+        offset = (page - 1) * limit
+        query = f'''SELECT * FROM {table} {where_clause} 
+                   ORDER BY {sort_column} DESC, id DESC LIMIT %s OFFSET %s'''
+        cursor.execute(query, list(params) + [limit + 1, offset])
+    rows = cursor.fetchall()
+    
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([rows[-1][sort_column], rows[-1]['id']])
+    
+    if cursor_token:
+        pagination = {
+            'total_pages': total_pages,
+            'total_items': total_items,
+            'next_cursor': next_cursor
+        }
+    else:
+        pagination = {
+            'current_page': page,
+            'total_pages': total_pages,
+            'total_items': total_items,
+            'start_item': offset + 1,
+            'end_item': min(offset + limit, total_items),
+            'next_cursor': next_cursor
+        }
+    return rows, pagination
+
+def admin_users_filter(search='', filter_status=''):
+    """WHERE clause and params for the admin user list's search and status filter"""
+    where_clause = 'WHERE 1=1'
+    params = []
+    
+    if search:
+        where_clause += ' AND (username LIKE %s OR email LIKE %s)'
+        params.extend([f'%{search}%', f'%{search}%'])
+    
+    if filter_status:
+        where_clause += ' AND status = %s'
+        params.append(filter_status)
+    
+    return where_clause, params
+
+def admin_users_data(cursor, page=1, cursor_token=None, search='', filter_status=''):
+    """One page of users, filtered by username/email search and status"""
+    where_clause, params = admin_users_filter(search, filter_status)
+    users, pagination = admin_list_page(cursor, 'users', where_clause, params, 'created_at',
+                                        page, cursor_token)
+    return {
+        'users': users,
+        'pagination': pagination
+    }
+
+def admin_profiles_data(cursor, page=1, cursor_token=None, search='', profession_filter=''):
+    """One page of profiles plus the profession filter options"""
+    where_clause = 'WHERE 1=1'
+    params = []
+    
+    if search:
+        where_clause += ' AND (full_name LIKE %s OR email LIKE %s OR company LIKE %s)'
+        params.extend([f'%{search}%', f'%{search}%', f'%{search}%'])
+    
+    if profession_filter:
+        professions = suggest_variants('profession', profession_filter) or [profession_filter]
+        where_clause += f" AND profession IN ({', '.join(['%s'] * len(professions))})"
+        params.extend(professions)
+    
+    profiles, pagination = admin_list_page(cursor, 'professional_profiles', where_clause, params,
+                                           'updated_at', page, cursor_token)
+    
+    # Profession filter options come from the precomputed analytics counts
+    professions = analytics_cache.get_or_set('profile_stats', load_profile_stats)['profession_stats']
+    
+    return {
+        'profiles': profiles,
+        'professions': professions,
+        'pagination': pagination
+    }
+
+def admin_feedback_data(cursor, page=1, cursor_token=None):
+    """One page of feedback, newest first"""
+    feedback, pagination = admin_list_page(cursor, 'feedback', 'WHERE 1=1', [], 'created_at',
+                                           page, cursor_token)
+    return {
+        'feedback': feedback,
+        'pagination': pagination
+    }
+
 @app.route('/api/admin-users', methods=['GET'])
+@conditional('users', auth=current_admin)
 def api_admin_users():
     """Get users data for admin dashboard"""
-    if 'admin_loggedin' not in session:
+    if not current_admin():
         return jsonify({'success': False, 'message': 'Not authorized'})
     
     try:
-        page = int(request.args.get('page', 1))
-        search = request.args.get('search', '')
-        filter_status = request.args.get('filter', '')
-        limit = 20
-        offset = (page - 1) * limit
-        
-        cursor = mysql.connection.cursor(MySQLdb.cursors.DictCursor)
-        
-        # Build query
-        where_clause = 'WHERE 1=1'
-        params = []
-        
-        if search:
-            where_clause += ' AND (username LIKE %s OR email LIKE %s)'
-            params.extend([f'%{search}%', f'%{search}%'])
-        
-        if filter_status:
-            where_clause += ' AND status = %s'
-            params.append(filter_status)
-        
-        # Get total count
-        count_query = f'SELECT COUNT(*) as total FROM users {where_clause}'
-        cursor.execute(count_query, params)
-        total_items = cursor.fetchone()['total']
-        
-        # Get users data
-        query = f'''SELECT * FROM users {where_clause} 
-                   ORDER BY created_at DESC LIMIT %s OFFSET %s'''
-        cursor.execute(query, params + [limit, offset])
-        users = cursor.fetchall()
-        
+        page = max(1, int(request.args.get('page', 1)))
+        cursor = get_cursor(readonly=True)
+        data = admin_users_data(cursor, page, request.args.get('cursor'),
+                                request.args.get('search', ''), request.args.get('filter', ''))
         cursor.close()
         
-        # Calculate pagination
-        total_pages = (total_items + limit - 1) // limit
-        
         return jsonify({
             'success': True,
-            'data': {
-                'users': users,
-                'pagination': {
-                    'current_page': page,
-                    'total_pages': total_pages,
-                    'total_items': total_items,
-                    'start_item': offset + 1,
-                    'end_item': min(offset + limit, total_items)
-                }
-            }
+            'data': data
         })
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
 
 @app.route('/api/admin-profiles', methods=['GET'])
+@conditional('profiles', 'users', auth=current_admin)
 def api_admin_profiles():
     """Get professional profiles data for admin dashboard"""
-    if 'admin_loggedin' not in session:
+    if not current_admin():
         return jsonify({'success': False, 'message': 'Not authorized'})
     
     try:
-        page = int(request.args.get('page', 1))
-        search = request.args.get('search', '')
-        profession_filter = request.args.get('profession', '')
-        limit = 20
-        offset = (page - 1) * limit
-        
-        cursor = mysql.connection.cursor(MySQLdb.cursors.DictCursor)
-        
-        # Build query
-        where_clause = 'WHERE 1=1'
-        params = []
-        
-        if search:
-            where_clause += ' AND (full_name LIKE %s OR email LIKE %s OR company LIKE %s)'
-            params.extend([f'%{search}%', f'%{search}%', f'%{search}%'])
-        
-        if profession_filter:
-            where_clause += ' AND profession = %s'
-            params.append(profession_filter)
-        
-        # Get total count
-        count_query = f'SELECT COUNT(*) as total FROM professional_profiles {where_clause}'
-        cursor.execute(count_query, params)
-        total_items = cursor.fetchone()['total']
-        
-        # Get profiles data
-        query = f'''SELECT * FROM professional_profiles {where_clause} 
-                   ORDER BY updated_at DESC LIMIT %s OFFSET %s'''
-        cursor.execute(query, params + [limit, offset])
-        profiles = cursor.fetchall()
-        
-        # Get profession statistics for filter
-        cursor.execute('''SELECT profession, COUNT(*) as count 
-                         FROM professional_profiles 
-                         GROUP BY profession 
-                         ORDER BY count DESC''')
-        professions = cursor.fetchall()
-        
+        page = max(1, int(request.args.get('page', 1)))
+        cursor = get_cursor(readonly=True)
+        data = admin_profiles_data(cursor, page, request.args.get('cursor'),
+                                   request.args.get('search', ''), request.args.get('profession', ''))
         cursor.close()
         
-        # Calculate pagination
-        total_pages = (total_items + limit - 1) // limit
-        
         return jsonify({
             'success': True,
-            'data': {
-                'profiles': profiles,
-                'professions': professions,
-                'pagination': {
-                    'current_page': page,
-                    'total_pages': total_pages,
-                    'total_items': total_items,
-                    'start_item': offset + 1,
-                    'end_item': min(offset + limit, total_items)
-                }
-            }
+            'data': data
         })
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
 
 @app.route('/api/admin-feedback', methods=['GET'])
+@conditional('feedback', 'users', auth=current_admin)
 def api_admin_feedback():
     """Get feedback data for admin dashboard"""
-    if 'admin_loggedin' not in session:
+    if not current_admin():
         return jsonify({'success': False, 'message': 'Not authorized'})
     
     try:
-        page = int(request.args.get('page', 1))
-        limit = 20
-        offset = (page - 1) * limit
-        
-        cursor = mysql.connection.cursor(MySQLdb.cursors.DictCursor)
-        
-        # Get total count
-        cursor.execute('SELECT COUNT(*) as total FROM feedback')
-        total_items = cursor.fetchone()['total']
-        
-        # Get feedback data
-        cursor.execute('''SELECT * FROM feedback 
-                         ORDER BY created_at DESC LIMIT %s OFFSET %s''',
-                     (limit, offset))
-        feedback = cursor.fetchall()
-        
+        page = max(1, int(request.args.get('page', 1)))
+        cursor = get_cursor(readonly=True)
+        data = admin_feedback_data(cursor, page, request.args.get('cursor'))
         cursor.close()
         
-        # Calculate pagination
-        total_pages = (total_items + limit - 1) // limit
+        return jsonify({
+            'success': True,
+            'data': data
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)})
+
+ADMIN_BOOTSTRAP_SECTIONS = {
+    'stats': admin_stats_data,
+    'users': admin_users_data,
+    'profiles': admin_profiles_data,
+    'feedback': admin_feedback_data,
+    'analytics': admin_analytics_data
+}
+
+@app.route('/api/admin-bootstrap', methods=['GET'])
+@conditional('users', 'profiles', 'feedback', 'activity', 'admins', auth=current_admin)
+def api_admin_bootstrap():
+    """Everything the dashboard shows on load, in one response.
+
+    Returns the admin session plus the first page of each section, built on
+    one read cursor so the list totals and headline counts share cached counts.
+    ``include=stats,users`` limits the sections returned.
+    """
+    admin = current_admin()
+    if not admin:
+        return jsonify({'success': False, 'message': 'Not authorized'})
+    
+    try:
+        include = request.args.get('include')
+        sections = include.split(',') if include else list(ADMIN_BOOTSTRAP_SECTIONS)
+        if any(section not in ADMIN_BOOTSTRAP_SECTIONS for section in sections):
+            return jsonify({'success': False, 'message': 'Invalid section'})
+        
+        cursor = get_cursor(readonly=True)
+        data = {'admin': admin_session_data(admin)}
+        for section in sections:
+            data[section] = ADMIN_BOOTSTRAP_SECTIONS[section](cursor)
+        cursor.close()
         
         return jsonify({
             'success': True,
-            'data': {
-                'feedback': feedback,
-                'pagination': {
-                    'current_page': page,
-                    'total_pages': total_pages,
-                    'total_items': total_items,
-                    'start_item': offset + 1,
-                    'end_item': min(offset + limit, total_items)
-                }
-            }
+            'data': data
         })
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
@@ -762,7 +1901,7 @@ def api_admin_feedback():
 @app.route('/api/admin-update-user-status', methods=['POST'])
 def api_admin_update_user_status():
     """Update user status"""
-    if 'admin_loggedin' not in session:
+    if not current_admin():
         return jsonify({'success': False, 'message': 'Not authorized'})
     
     try:
@@ -770,82 +1909,425 @@ def api_admin_update_user_status():
         user_id = data['user_id']
         status = data['status']
         
-        cursor = mysql.connection.cursor(MySQLdb.cursors.DictCursor)
+        cursor = get_cursor()
         cursor.execute('UPDATE users SET status = %s WHERE id = %s', (status, user_id))
-        mysql.connection.commit()
-        
-        # Log admin activity
-        cursor.execute('''INSERT INTO admin_activity_log 
-                        (admin_id, action, target_type, target_id, description, created_at) 
-                        VALUES (%s, %s, %s, %s, %s, %s)''',
-                     (session['admin_id'], f'update_user_status_{status}', 'user', user_id, 
-                      f'Changed user status to {status}', datetime.now()))
-        mysql.connection.commit()
+        get_db().commit()
         cursor.close()
         
+        log_admin_action(f'update_user_status_{status}', 'user', user_id, f'Changed user status to {status}')
+        identity_cache.invalidate(f'user:{user_id}')
+        count_cache.invalidate()
+        data_versions.bump('users')
+        event_bus.publish('user_status', {'user_id': user_id, 'status': status})
+        
+        mark_user_write()
+        
         return jsonify({'success': True, 'message': 'User status updated successfully!'})
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
 
+@app.route('/api/admin-bulk-user-status', methods=['POST'])
+def api_admin_bulk_user_status():
+    """Set the status of many users at once.
+
+    Takes ``user_ids`` or the ``search``/``filter`` params of /api/admin-users,
+    plus the new ``status``. Users already in that status are left alone. The
+    UPDATE and the audit rows are one set-based statement each and commit
+    together; the rows skip the buffered audit log, which is for single events.
+    """
+    if not current_admin():
+        return jsonify({'success': False, 'message': 'Not authorized'})
+    
+    try:
+        data = request.get_json()
+        status = data.get('status')
+        if status not in ('pending', 'active', 'suspended'):
+            return jsonify({'success': False, 'message': 'Invalid status'})
+        
+        if 'user_ids' in data:
+            user_ids = [int(user_id) for user_id in data['user_ids']]
+            if not user_ids:
+                return jsonify({'success': False, 'message': 'No users selected'})
+            where_clause = f"WHERE id IN ({', '.join(['%s'] * len(user_ids))})"
+            params = user_ids
+        else:
+            search = data.get('search', '').strip()
+            filter_status = data.get('filter', '').strip()
+            # An empty search and filter would match every user
+            if not search and not filter_status:
+                return jsonify({'success': False, 'message': 'Select users or give a search or filter'})
+            where_clause, params = admin_users_filter(search, filter_status)
+        
+        cursor = get_cursor()
+        cursor.execute(f'''SELECT id FROM users {where_clause} AND status != %s
+                           ORDER BY id LIMIT %s FOR UPDATE''',
+                       params + [status, BULK_STATUS_MAX_USERS + 1])
+        changed = [row['id'] for row in cursor.fetchall()]
+        if len(changed) > BULK_STATUS_MAX_USERS:
+            get_db().rollback()
+            cursor.close()
+            return jsonify({'success': False,
+                            'message': f'More than {BULK_STATUS_MAX_USERS} users match; narrow the selection'})
+        
+        if changed:
+            placeholders = ', '.join(['%s'] * len(changed))
+            cursor.execute(f'UPDATE users SET status = %s WHERE id IN ({placeholders})', [status] + changed)
+            audit_rows = [audit_row(f'update_user_status_{status}', 'user', user_id,
+                                    f'Changed user status to {status} (bulk)') for user_id in changed]
+            insert_audit_rows(cursor, audit_rows)
+            audit_rollups(cursor, audit_rows)
+        get_db().commit()
+        cursor.close()
+    except Exception as e:
+        get_db().rollback()
+        return jsonify({'success': False, 'message': str(e)})
+    
+    if changed:
+        data_versions.bump('activity')
+        for user_id in changed:
+            identity_cache.invalidate(f'user:{user_id}')
+        count_cache.invalidate()
+        data_versions.bump('users')
+        event_bus.publish('users_status', {'user_ids': changed, 'status': status})
+        mark_user_write()
+    
+    return jsonify({'success': True, 'updated': len(changed),
+                    'message': f'{len(changed)} users set to {status}'})
+
+@app.route('/api/admin-events', methods=['GET'])
+def api_admin_events():
+    """Server-Sent Events stream of registrations, profile saves, feedback and status changes.
+
+    Events come from the event bus, not MySQL, and the request's database
+    connection is released before streaming starts. Each stream ends after
+    EVENT_STREAM_SECONDS; the browser reconnects and resumes from
+    ``Last-Event-ID``.
+    """
+    if not current_admin():
+        return jsonify({'success': False, 'message': 'Not authorized'})
+    
+    last_event_id = request.headers.get('Last-Event-ID', type=int)
+    if last_event_id is None:
+        last_event_id = event_bus.last_id()
+    
+    def generate(after_id):
+        deadline = time.monotonic() + EVENT_STREAM_SECONDS
+        yield 'retry: 3000\n\n'
+        while time.monotonic() < deadline:
+            events = event_bus.wait(after_id, min(EVENT_HEARTBEAT_SECONDS, deadline - time.monotonic()))
+            if not events:
+                yield ': keepalive\n\n'
+            for event in events:
+                after_id = event['id']
+                yield f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event['data'], default=str)}\n\n"
+    
+    return Response(generate(last_event_id), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+# Export sources: base query, column compared against since=, allowed filters and ordering
+EXPORT_SOURCES = {
+    'users': {
+        'query': '''SELECT id, username, email, mobile, status, email_verified, 
+                    mobile_verified, created_at, updated_at FROM users''',
+        'since_column': 'updated_at',
+        'filters': {'status': 'status'},
+        'order_by': 'created_at DESC',
+    },
+    'profiles': {
+        'query': '''SELECT pp.*, u.username, u.email as user_email 
+                    FROM professional_profiles pp 
+                    JOIN users u ON pp.user_id = u.id''',
+        'since_column': 'pp.updated_at',
+        'filters': {'profession': 'pp.profession', 'location': 'pp.current_location'},
+        'order_by': 'pp.updated_at DESC',
+    },
+    'feedback': {
+        'query': 'SELECT * FROM feedback',
+        'since_column': 'updated_at',
+        'filters': {'status': 'status', 'feedback_type': 'feedback_type'},
+        'order_by': 'created_at DESC',
+    },
+}
+
+def export_rows(query, params, export_format):
+    """Yield an export as CSV or NDJSON text chunks, one batch of rows at a time"""
+    cursor = get_cursor(db_backend.stream_cursor, readonly=True)
+    try:
+        cursor.execute(query, params)
+        columns = [column[0] for column in cursor.description]
+        output = io.StringIO()
+        writer = csv.DictWriter(output, fieldnames=columns)
+        if export_format == 'csv':
+            writer.writeheader()
+        
+        while True:
+            rows = cursor.fetchmany(EXPORT_BATCH_SIZE)
+            if not rows:
+                break
+            if export_format == 'csv':
+                writer.writerows(rows)
+            else:
+                for row in rows:
+                    output.write(json.dumps(row, default=str) + '\n')
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate()
+        
+        if export_format == 'csv' and output.getvalue():
+            yield output.getvalue()
+    finally:
+        cursor.close()
+
+def gzip_chunks(chunks):
+    """Gzip a stream of text chunks on the fly"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8'))
+        if data:
+            yield data
+    yield compressor.flush()
+
 @app.route('/api/admin-export/<data_type>', methods=['GET'])
 def api_admin_export(data_type):
-    """Export data as CSV"""
-    if 'admin_loggedin' not in session:
+    """Stream an export as CSV or NDJSON, optionally gzipped and limited to rows changed since a date"""
+    if not current_admin():
         return jsonify({'success': False, 'message': 'Not authorized'})
     
     try:
-        cursor = mysql.connection.cursor(MySQLdb.cursors.DictCursor)
-        
-        if data_type == 'users':
-            cursor.execute('''SELECT id, username, email, mobile, status, email_verified, 
-                            mobile_verified, created_at FROM users ORDER BY created_at DESC''')
-        elif data_type == 'profiles':
-            cursor.execute('''SELECT pp.*, u.username, u.email as user_email 
-                            FROM professional_profiles pp 
-                            JOIN users u ON pp.user_id = u.id 
-                            ORDER BY pp.updated_at DESC''')
-        elif data_type == 'feedback':
-            cursor.execute('''SELECT * FROM feedback ORDER BY created_at DESC''')
-        else:
+        source = EXPORT_SOURCES.get(data_type)
+        if not source:
             return jsonify({'success': False, 'message': 'Invalid data type'})
         
-        data = cursor.fetchall()
-        cursor.close()
+        export_format = request.args.get('format', 'csv')
+        if export_format not in ('csv', 'ndjson'):
+            return jsonify({'success': False, 'message': 'Invalid format'})
+        use_gzip = request.args.get('gzip') in ('1', 'true')
         
-        # Convert to CSV
-        import io
-        import csv
+        # Build query
+        where_clause = 'WHERE 1=1'
+        params = []
         
-        output = io.StringIO()
-        if data:
-            writer = csv.DictWriter(output, fieldnames=data[0].keys())
-            writer.writeheader()
-            writer.writerows(data)
-        
-        csv_data = output.getvalue()
-        output.close()
-        
-        # Log admin activity
-        cursor = mysql.connection.cursor(MySQLdb.cursors.DictCursor)
-        cursor.execute('''INSERT INTO admin_activity_log 
-                        (admin_id, action, target_type, description, created_at) 
-                        VALUES (%s, %s, %s, %s, %s)''',
-                     (session['admin_id'], f'export_{data_type}', 'system', 
-                      f'Exported {data_type} data', datetime.now()))
-        mysql.connection.commit()
-        cursor.close()
+        since = request.args.get('since')
+        if since:
+            where_clause += f" AND {source['since_column']} >= %s"
+            params.append(datetime.fromisoformat(since))
+        
+        for param, column in source['filters'].items():
+            value = request.args.get(param)
+            if value:
+                where_clause += f' AND {column} = %s'
+                params.append(value)
+        
+        query = f"{source['query']} {where_clause} ORDER BY {source['order_by']}"
+        
+        description = f'Exported {data_type} data'
+        if since:
+            description += f' changed since {since}'
+        log_admin_action(f'export_{data_type}', 'system', description=description)
+        
+        chunks = export_rows(query, params, export_format)
+        extension = export_format
+        mimetype = 'text/csv' if export_format == 'csv' else 'application/x-ndjson'
+        if use_gzip:
+            chunks = gzip_chunks(chunks)
+            extension += '.gz'
+            mimetype = 'application/gzip'
         
-        from flask import Response
         return Response(
-            csv_data,
-            mimetype='text/csv',
+            stream_with_context(chunks),
+            mimetype=mimetype,
             headers={
-                'Content-Disposition': f'attachment; filename=district_growth_{data_type}_{datetime.now().strftime("%Y%m%d")}.csv'
+                'Content-Disposition': f'attachment; filename=district_growth_{data_type}_{datetime.now().strftime("%Y%m%d")}.{extension}'
             }
         )
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
 
+# Bulk profile import: columns accepted per record, besides user_id / email / username
+IMPORT_FIELDS = ('full_name', 'profession', 'education', 'experience', 'skills', 'current_location',
+                 'phone', 'profile_email', 'company', 'salary_range', 'availability')
+IMPORT_REQUIRED_FIELDS = ('full_name', 'profession', 'education', 'current_location')
+IMPORT_AVAILABILITY = ('Available', 'Not Available', 'Open to Opportunities')
+IMPORT_MAX_ERRORS = 100
+
+def read_import_records(stream, import_format):
+    """Yield dicts from an uploaded CSV (with header row) or NDJSON stream"""
+    text = io.TextIOWrapper(stream, encoding='utf-8-sig')
+    if import_format == 'csv':
+        yield from csv.DictReader(text)
+    else:
+        for line in text:
+            if line.strip():
+                yield json.loads(line)
+
+def validate_import_record(record):
+    """Return (profile, None) with cleaned values, or (None, error message)"""
+    record = {key: (value.strip() if isinstance(value, str) else value) for key, value in record.items() if key}
+    missing = [field for field in IMPORT_REQUIRED_FIELDS if not record.get(field)]
+    if missing:
+        return None, f'Missing {", ".join(missing)}'
+    if not (record.get('user_id') or record.get('email') or record.get('username')):
+        return None, 'Missing user_id, email or username'
+    
+    profile = {field: record.get(field) or None for field in IMPORT_FIELDS}
+    try:
+        profile['experience'] = int(record.get('experience') or 0)
+        user_id = int(record['user_id']) if record.get('user_id') else None
+    except (TypeError, ValueError):
+        return None, 'experience and user_id must be whole numbers'
+    profile['availability'] = profile['availability'] or 'Available'
+    if profile['availability'] not in IMPORT_AVAILABILITY:
+        return None, f'availability must be one of {", ".join(IMPORT_AVAILABILITY)}'
+    profile.update(user_id=user_id, user_email=record.get('email') or None, username=record.get('username') or None)
+    return profile, None
+
+def resolve_import_users(cursor, batch, create_users):
+    """Fill in user_id from email or username, creating pending users when asked.
+
+    Returns the number of users created. Records whose user cannot be found
+    are left with user_id None.
+    """
+    def lookup(column, key):
+        values = list({profile[key] for profile in batch if not profile['user_id'] and profile[key]})
+        if not values:
+            return {}
+        placeholders = ', '.join(['%s'] * len(values))
+        cursor.execute(f'SELECT id, {column} FROM users WHERE {column} IN ({placeholders})', values)
+        return {row[column].lower(): row['id'] for row in cursor.fetchall()}
+    
+    def fill():
+        by_email = lookup('email', 'user_email')
+        by_username = lookup('username', 'username')
+        for profile in batch:
+            if not profile['user_id']:
+                profile['user_id'] = (by_email.get((profile['user_email'] or '').lower()) or
+                                      by_username.get((profile['username'] or '').lower()))
+    
+    fill()
+    missing = [profile for profile in batch if not profile['user_id'] and profile['user_email']]
+    if not create_users or not missing:
+        return 0
+    
+    # Attendees without an account get a pending user with an unusable password
+    now = datetime.now()
+    cursor.executemany('''INSERT IGNORE INTO users (username, email, password, status, created_at) 
+                        VALUES (%s, %s, %s, 'pending', %s)''',
+                       [(profile['username'] or profile['user_email'].split('@')[0][:43] + '_' + generate_otp(),
+                         profile['user_email'], hashlib.sha256(os.urandom(32)).hexdigest(), now)
+                        for profile in missing])
+    created = cursor.rowcount
+    fill()
+    if created > 0:
+        record_activity(cursor, 'registration', count=created)
+    return max(created, 0)
+
+def write_import_batch(cursor, batch, create_users, result, seen):
+    """Upsert one batch of validated profiles with executemany.
+
+    ``seen`` maps each user_id already imported to its record number; a later
+    record for the same user is skipped and reported rather than overwriting it.
+    """
+    result['users_created'] += resolve_import_users(cursor, batch, create_users)
+    
+    profiles = {}
+    for profile in batch:
+        if not profile['user_id']:
+            error = 'No matching user'
+        elif profile['user_id'] in seen:
+            error = f"Same user as record {seen[profile['user_id']]}"
+        else:
+            seen[profile['user_id']] = profile['record']
+            profiles[profile['user_id']] = profile
+            continue
+        result['skipped'] += 1
+        if len(result['errors']) < IMPORT_MAX_ERRORS:
+            result['errors'].append({'record': profile['record'], 'message': error})
+    if not profiles:
+        return
+    
+    user_ids = list(profiles)
+    placeholders = ', '.join(['%s'] * len(user_ids))
+    cursor.execute(f'SELECT user_id FROM professional_profiles WHERE user_id IN ({placeholders})', user_ids)
+    existing = {row['user_id'] for row in cursor.fetchall()}
+    
+    now = datetime.now()
+    cursor.executemany(PROFILE_UPSERT_SQL, [
+        (user_id, profile['full_name'], profile['profession'], profile['education'], profile['experience'],
+         profile['skills'], profile['current_location'], profile['phone'], profile['profile_email'],
+         profile['company'], profile['salary_range'], profile['availability'], now, now)
+        for user_id, profile in profiles.items()
+    ])
+    sync_user_skills_bulk(cursor, {user_id: profile['skills'] for user_id, profile in profiles.items()})
+    
+    created = len(profiles) - len(existing)
+    if created:
+        record_activity(cursor, 'profile_created', count=created)
+    if existing:
+        record_activity(cursor, 'profile_updated', count=len(existing))
+    result['created'] += created
+    result['updated'] += len(existing)
+
+@app.route('/api/admin-import-profiles', methods=['POST'])
+def api_admin_import_profiles():
+    """Create or update many profiles from a CSV or NDJSON upload in one transaction.
+
+    Send the file as multipart field ``file`` or as the request body. Each
+    record names its user by ``user_id``, ``email`` or ``username``; with
+    ``create_users=1`` unknown emails get a pending account. Invalid records
+    are skipped and reported; anything else rolls the whole import back.
+    """
+    if not current_admin():
+        return jsonify({'success': False, 'message': 'Not authorized'})
+    
+    upload = request.files.get('file')
+    filename = upload.filename if upload else ''
+    import_format = request.args.get('format')
+    if not import_format:
+        ndjson = filename.endswith(('.ndjson', '.jsonl')) or request.mimetype == 'application/x-ndjson'
+        import_format = 'ndjson' if ndjson else 'csv'
+    if import_format not in ('csv', 'ndjson'):
+        return jsonify({'success': False, 'message': 'Invalid format'})
+    create_users = request.args.get('create_users') == '1'
+    
+    result = {'created': 0, 'updated': 0, 'users_created': 0, 'skipped': 0, 'errors': []}
+    try:
+        cursor = get_cursor()
+        batch = []
+        seen = {}
+        records = read_import_records(upload.stream if upload else request.stream, import_format)
+        for number, record in enumerate(records, 1):
+            profile, error = validate_import_record(record)
+            if error:
+                result['skipped'] += 1
+                if len(result['errors']) < IMPORT_MAX_ERRORS:
+                    result['errors'].append({'record': number, 'message': error})
+                continue
+            profile['record'] = number
+            batch.append(profile)
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                write_import_batch(cursor, batch, create_users, result, seen)
+                batch = []
+        if batch:
+            write_import_batch(cursor, batch, create_users, result, seen)
+        
+        get_db().commit()
+        cursor.close()
+    except Exception as e:
+        get_db().rollback()
+        return jsonify({'success': False, 'message': f'Import rolled back: {str(e)}'})
+    
+    log_admin_action('import_profiles', 'system',
+                     description=f"Imported profiles: {result['created']} created, {result['updated']} updated")
+    analytics_cache.invalidate()
+    suggest_indexes.refresh()
+    count_cache.invalidate()
+    data_versions.bump('users', 'profiles')
+    event_bus.publish('profiles_imported', {'created': result['created'], 'updated': result['updated'],
+                                            'users_created': result['users_created']})
+    mark_user_write()
+    
+    return jsonify({'success': True, 'data': result})
+
 @app.route('/logout')
 def logout():
     """Handle user logout"""
@@ -865,5 +2347,8 @@ def dev_get_otp():
         })
     return jsonify({'success': False, 'message': 'Not available in production'})
 
+# Every route is registered now, so url_for works while rendering
+warm_page_cache()
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
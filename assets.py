@@ -0,0 +1,151 @@
+import gzip
+import hashlib
+import json
+import os
+import shutil
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    from PIL import Image, features
+except ImportError:
+    Image = None
+
+# Text assets copied under a content hash and precompressed
+TEXT_EXTENSIONS = {'.css', '.js', '.svg'}
+# Images copied under a content hash and resized into modern formats
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png'}
+# Widths (CSS px at 1x, 2x and 3x for the 200px portraits) of the image variants
+IMAGE_WIDTHS = (200, 400, 600)
+# Pillow format name and MIME type for each variant format, best first
+IMAGE_FORMATS = {'avif': ('AVIF', 'image/avif'), 'webp': ('WEBP', 'image/webp')}
+
+MANIFEST_NAME = 'manifest.json'
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:12]
+
+
+def hashed_name(name, digest, extension=None):
+    root, original_extension = os.path.splitext(name)
+    return f'{root}.{digest}{extension or original_extension}'
+
+
+def build(static_dir, output_dir='dist'):
+    """Write fingerprinted copies of the static assets and a manifest describing them.
+
+    Files go to ``static_dir/output_dir``. Text assets get ``.gz`` (and
+    ``.br`` when the brotli package is installed) siblings; images get
+    WebP/AVIF variants at IMAGE_WIDTHS when Pillow supports the format.
+    The manifest maps each source name (relative to ``static_dir``) to
+    its hashed name and lists the image variants and the precompressed
+    encodings available for each hashed file. It is also returned.
+    """
+    out_root = os.path.join(static_dir, output_dir)
+    if os.path.isdir(out_root):
+        shutil.rmtree(out_root)
+    manifest = {'files': {}, 'images': {}, 'encodings': {}}
+
+    for directory, subdirectories, filenames in os.walk(static_dir):
+        subdirectories[:] = sorted(d for d in subdirectories if os.path.join(directory, d) != out_root)
+        for filename in sorted(filenames):
+            path = os.path.join(directory, filename)
+            name = os.path.relpath(path, static_dir).replace(os.sep, '/')
+            extension = os.path.splitext(filename)[1].lower()
+            if extension not in TEXT_EXTENSIONS | IMAGE_EXTENSIONS:
+                continue
+            with open(path, 'rb') as f:
+                data = f.read()
+            digest = content_hash(data)
+            target = f'{output_dir}/{hashed_name(name, digest)}'
+            _write(static_dir, target, data)
+            manifest['files'][name] = target
+            if extension in TEXT_EXTENSIONS:
+                encodings = ['gzip']
+                _write(static_dir, target + '.gz', gzip.compress(data, compresslevel=9, mtime=0))
+                if brotli is not None:
+                    encodings.insert(0, 'br')
+                    _write(static_dir, target + '.br', brotli.compress(data, quality=11))
+                manifest['encodings'][target] = encodings
+            elif Image is not None:
+                manifest['images'][name] = _image_variants(static_dir, path, output_dir, name, digest)
+
+    _write(static_dir, f'{output_dir}/{MANIFEST_NAME}', json.dumps(manifest, indent=2, sort_keys=True).encode())
+    return manifest
+
+
+def _image_variants(static_dir, path, output_dir, name, digest):
+    """{format: [[width, hashed name], ...]} of resized copies of one image"""
+    variants = {}
+    with Image.open(path) as image:
+        image.load()
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA' if 'transparency' in image.info else 'RGB')
+        widths = [width for width in IMAGE_WIDTHS if width < image.width] or [image.width]
+        for fmt, (pillow_format, _) in IMAGE_FORMATS.items():
+            if not features.check(fmt):
+                continue
+            variants[fmt] = []
+            for width in widths:
+                height = round(image.height * width / image.width)
+                target = f'{output_dir}/{hashed_name(name, digest, f".{width}w.{fmt}")}'
+                resized = image.resize((width, height), Image.LANCZOS)
+                resized.save(os.path.join(static_dir, target), pillow_format, quality=75)
+                variants[fmt].append([width, target])
+    return variants
+
+
+def _write(static_dir, name, data):
+    path = os.path.join(static_dir, name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+class AssetManifest:
+    """Lookup of fingerprinted asset names read from a manifest written by ``build``.
+
+    Without a manifest every lookup falls back to the source name, so the app
+    runs unchanged before the build step has been run.
+    """
+
+    def __init__(self, static_dir, output_dir='dist'):
+        self.files = {}
+        self.images = {}
+        self.encodings = {}
+        self.hashed = set()
+        self.version = ''
+        path = os.path.join(static_dir, output_dir, MANIFEST_NAME)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                data = f.read()
+            manifest = json.loads(data)
+            self.version = content_hash(data)
+            self.files = manifest['files']
+            self.images = manifest['images']
+            self.encodings = manifest['encodings']
+            self.hashed = set(self.files.values())
+            self.hashed.update(target for variants in self.images.values()
+                               for sizes in variants.values() for _, target in sizes)
+
+    def resolve(self, filename):
+        return self.files.get(filename, filename)
+
+    def is_hashed(self, filename):
+        return filename in self.hashed
+
+    def encoding_for(self, filename, accept_encodings):
+        """Best precompressed encoding of a hashed file the client accepts, or None"""
+        for encoding in self.encodings.get(filename, ()):
+            if accept_encodings[encoding]:
+                return encoding
+        return None
+
+    def sources(self, filename):
+        """[(MIME type, [(width, hashed name), ...])] for an image's variants, best format first"""
+        variants = self.images.get(filename, {})
+        return [(IMAGE_FORMATS[fmt][1], variants[fmt]) for fmt in IMAGE_FORMATS if variants.get(fmt)]
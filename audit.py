@@ -0,0 +1,180 @@
+import atexit
+import json
+import os
+import threading
+from datetime import datetime
+
+from sqlite_file import SQLiteFile
+
+AUDIT_COLUMNS = ('admin_id', 'action', 'target_type', 'target_id', 'description',
+                 'ip_address', 'user_agent', 'created_at')
+
+
+def insert_rows(cursor, rows):
+    """INSERT rows given as tuples in AUDIT_COLUMNS order with one multi-row statement, uncommitted"""
+    cursor.executemany(f'''INSERT INTO admin_activity_log ({', '.join(AUDIT_COLUMNS)})
+                        VALUES ({', '.join(['%s'] * len(AUDIT_COLUMNS))})''', rows)
+
+
+class AuditLog:
+    """Buffered writer for admin_activity_log.
+
+    ``record`` appends to an in-memory buffer and returns; a background thread
+    writes the buffer with one multi-row INSERT per ``batch_size`` events when
+    it reaches ``batch_size`` or every ``flush_interval`` seconds. ``on_flush``
+    (cursor, events) runs in the same transaction, e.g. to update rollups, and
+    ``on_commit`` (events) after it commits.
+
+    Events that cannot be written, and whatever is still buffered when the
+    process exits, go to a SQLite spill file. Every flush drains the spill file
+    first, so entries survive MySQL outages and worker restarts; only a worker
+    killed outright loses its last ``flush_interval`` seconds of events.
+    """
+
+    def __init__(self, connect, spill_path, on_flush=None, on_commit=None, batch_size=200, flush_interval=2):
+        self.connect = connect
+        self.spill_path = spill_path
+        self.on_flush = on_flush
+        self.on_commit = on_commit
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._connection = None
+        self._pid = None
+        self._spill_file = SQLiteFile(spill_path, '''CREATE TABLE IF NOT EXISTS audit_spill (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, event TEXT NOT NULL)''', timeout=30)
+        atexit.register(self.close)
+
+    def record(self, admin_id, action, target_type, target_id=None, description=None,
+               ip_address=None, user_agent=None, created_at=None):
+        """Queue one audit row; it reaches MySQL on the next flush"""
+        self.record_many([(admin_id, action, target_type, target_id, description,
+                           ip_address, user_agent, created_at or datetime.now())])
+
+    def record_many(self, rows):
+        """Queue rows given as tuples in AUDIT_COLUMNS order"""
+        self.start()
+        with self._lock:
+            self._buffer.extend(rows)
+            full = len(self._buffer) >= self.batch_size
+        if full:
+            self._wakeup.set()
+
+    def start(self):
+        """Start the flusher thread in this process (once per process, safe after fork)"""
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._buffer = []
+            self._connection = None
+            self._wakeup = threading.Event()
+        threading.Thread(target=self._run, name='audit-log-flusher', daemon=True).start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def _take(self):
+        with self._lock:
+            rows, self._buffer = self._buffer, []
+        return rows
+
+    def flush(self):
+        """Write spilled and buffered events to MySQL; spill them again on failure"""
+        with self._flush_lock:
+            rows = self._take()
+            try:
+                if self._connection is None:
+                    self._connection = self.connect()
+                self._drain_spill()
+                while rows:
+                    self._write(rows[:self.batch_size])
+                    rows = rows[self.batch_size:]
+            except Exception as e:
+                print(f"Audit log error: {str(e)}")
+                self._reset_connection()
+                self.spill(rows)
+
+    def _write(self, rows):
+        cursor = self._connection.cursor()
+        insert_rows(cursor, rows)
+        if self.on_flush:
+            self.on_flush(cursor, rows)
+        self._connection.commit()
+        cursor.close()
+        if self.on_commit:
+            self.on_commit(rows)
+
+    def _drain_spill(self):
+        # BEGIN IMMEDIATE keeps other workers off the batch until it is in MySQL
+        spill = self._spill_file.connection()
+        if spill.execute('SELECT 1 FROM audit_spill LIMIT 1').fetchone() is None:
+            return
+        while True:
+            # The connection outlives this call, so a failed batch must not leave its transaction open
+            spill.execute('BEGIN IMMEDIATE')
+            try:
+                spilled = spill.execute('SELECT id, event FROM audit_spill ORDER BY id LIMIT ?',
+                                        (self.batch_size,)).fetchall()
+                if spilled:
+                    self._write([_decode(event) for _, event in spilled])
+                    spill.execute('DELETE FROM audit_spill WHERE id <= ?', (spilled[-1][0],))
+            except Exception:
+                spill.execute('ROLLBACK')
+                raise
+            if not spilled:
+                spill.execute('ROLLBACK')
+                return
+            spill.execute('COMMIT')
+
+    def spill(self, rows):
+        if not rows:
+            return
+        spill = self._spill_file.connection()
+        spill.execute('BEGIN')
+        try:
+            spill.executemany('INSERT INTO audit_spill (event) VALUES (?)',
+                              [(json.dumps(row, default=str),) for row in rows])
+        except Exception:
+            spill.execute('ROLLBACK')
+            raise
+        spill.execute('COMMIT')
+
+    def _reset_connection(self):
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except Exception:
+                pass
+        self._connection = None
+
+    def pending(self):
+        """Number of events buffered in this process plus those in the spill file"""
+        with self._lock:
+            buffered = len(self._buffer)
+        spill = self._spill_file.connection()
+        return buffered + spill.execute('SELECT COUNT(*) FROM audit_spill').fetchone()[0]
+
+    def close(self):
+        """Spill whatever is still buffered; registered to run at process exit"""
+        if self._pid != os.getpid():
+            return
+        # Let a flush in progress finish so its rows are not lost mid-write
+        locked = self._flush_lock.acquire(timeout=5)
+        try:
+            self.spill(self._take())
+        finally:
+            if locked:
+                self._flush_lock.release()
+
+
+def _decode(event):
+    row = json.loads(event)
+    row[-1] = datetime.fromisoformat(row[-1])
+    return tuple(row)
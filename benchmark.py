@@ -0,0 +1,368 @@
+"""Drive every /api/* route of a running instance and report throughput and latency as JSON.
+
+Run against a local server loaded with `flask --app app generate-data`, with
+one gunicorn worker so /metrics covers every request::
+
+    gunicorn --worker-class gthread --threads 8 -w 1 wsgi:app
+    python benchmark.py --base-url http://127.0.0.1:8000 --output bench.json
+    python benchmark.py --baseline bench.json        # exit status 1 on a regression
+
+Each route runs for ``--duration`` seconds from ``--concurrency`` threads.
+Queries per request come from the server's http_request_sql_queries
+histogram. Write routes really write, so never point this at production.
+"""
+import argparse
+import json
+import random
+import re
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+
+import requests
+
+from datagen import PROFESSIONS, LOCATIONS, EDUCATION, PASSWORD, FEEDBACK_TYPES
+
+METRIC_LINE = re.compile(r'^http_request_sql_queries_(sum|count)\{endpoint="([^"]*)",method="([^"]*)"\} (\S+)$')
+
+
+class Route:
+    """One endpoint: its URL rule, how to build a request, and which session sends it"""
+
+    def __init__(self, rule, method='GET', role='anon', path=None, params=None, body=None,
+                 raw=None, expect_success=True, stream=False):
+        self.rule = rule
+        self.method = method
+        self.role = role
+        self.path = path or (lambda ctx, rng: rule)
+        self.params = params
+        self.body = body
+        self.raw = raw
+        self.expect_success = expect_success
+        self.stream = stream
+
+    @property
+    def name(self):
+        return f'{self.method} {self.rule}'
+
+
+def profile_payload(rng):
+    return {
+        'full_name': 'Bench User',
+        'profession': rng.choice(PROFESSIONS),
+        'education': rng.choice(EDUCATION),
+        'experience': rng.randint(0, 30),
+        'skills': 'Python, MySQL, Excel',
+        'current_location': rng.choice(LOCATIONS),
+        'phone': f'9{rng.randrange(10 ** 9):09d}',
+        'availability': 'Available',
+    }
+
+
+def import_body(ctx, rng):
+    lines = [json.dumps(dict(profile_payload(rng), email=user['email'])) for user in ctx['users']]
+    return '\n'.join(lines).encode()
+
+
+def new_user(ctx):
+    username = f"{ctx['prefix']}r{next(ctx['counter'])}"
+    return {'username': username, 'email': f'{username}@example.com', 'password': PASSWORD}
+
+
+def next_status(ctx):
+    # Alternate so every call really changes rows
+    ctx['status_flip'] = not ctx.get('status_flip')
+    return 'pending' if ctx['status_flip'] else 'active'
+
+
+ROUTES = [
+    Route('/api/search', params=lambda ctx, rng: {'profession': rng.choice(PROFESSIONS),
+                                                  'location': rng.choice(LOCATIONS)}),
+    Route('/api/suggest', params=lambda ctx, rng: {'field': 'profession', 'q': rng.choice(PROFESSIONS)[:3]}),
+    Route('/api/suggest/canonical', params=lambda ctx, rng: {'field': 'location'}),
+    Route('/api/analytics'),
+    Route('/api/send-otp', 'POST', body=lambda ctx, rng: {'mobile': f'8{rng.randrange(10 ** 9):09d}',
+                                                          'type': 'mobile'}),
+    Route('/api/verify-otp', 'POST', expect_success=False,
+          body=lambda ctx, rng: {'mobile': f'8{rng.randrange(10 ** 9):09d}', 'otp': '000000'}),
+    Route('/api/register', 'POST', body=lambda ctx, rng: new_user(ctx)),
+    Route('/api/login', 'POST', body=lambda ctx, rng: {'username': rng.choice(ctx['users'])['username'],
+                                                       'password': PASSWORD}),
+    Route('/api/profile', 'POST', role='user', body=lambda ctx, rng: profile_payload(rng)),
+    Route('/api/jobs', 'POST', role='user', body=lambda ctx, rng: {
+        'title': f'{rng.choice(PROFESSIONS)} needed', 'description': 'Benchmark job', 'company': 'Bench Co',
+        'location': rng.choice(LOCATIONS), 'skills': 'Python, MySQL'}),
+    Route('/api/jobs/<int:job_id>/matches', role='user',
+          path=lambda ctx, rng: f"/api/jobs/{ctx['job_id']}/matches"),
+    Route('/api/profiles/<int:profile_id>/jobs', role='user',
+          path=lambda ctx, rng: f"/api/profiles/{rng.choice(ctx['profile_ids'])}/jobs"),
+    Route('/api/feedback', 'POST', body=lambda ctx, rng: {
+        'name': 'Bench User', 'email': 'bench@example.com', 'feedback_type': rng.choice(FEEDBACK_TYPES),
+        'subject': 'Benchmark', 'message': 'Benchmark feedback', 'rating': rng.randint(1, 5)}),
+    Route('/api/admin-login', 'POST', body=lambda ctx, rng: ctx['admin']),
+    Route('/api/admin-session', role='admin'),
+    Route('/api/admin-db-pool', role='admin'),
+    Route('/api/admin-stats', role='admin'),
+    Route('/api/admin-analytics', role='admin', params=lambda ctx, rng: {'days': 30}),
+    Route('/api/admin-users', role='admin', params=lambda ctx, rng: {'page': rng.randint(1, 5)}),
+    Route('/api/admin-profiles', role='admin', params=lambda ctx, rng: {'profession': rng.choice(PROFESSIONS)}),
+    Route('/api/admin-feedback', role='admin'),
+    Route('/api/admin-bootstrap', role='admin'),
+    Route('/api/admin-update-user-status', 'POST', role='admin', body=lambda ctx, rng: {
+        'user_id': rng.choice(ctx['users'])['id'], 'status': next_status(ctx)}),
+    Route('/api/admin-bulk-user-status', 'POST', role='admin', body=lambda ctx, rng: {
+        'user_ids': [user['id'] for user in ctx['users']], 'status': next_status(ctx)}),
+    Route('/api/admin-import-profiles', 'POST', role='admin', raw=import_body,
+          params=lambda ctx, rng: {'format': 'ndjson'}),
+    Route('/api/admin-export/<data_type>', role='admin', stream=True,
+          path=lambda ctx, rng: '/api/admin-export/profiles',
+          params=lambda ctx, rng: {'since': (datetime.now() - timedelta(days=1)).date().isoformat()}),
+    Route('/api/admin-events', role='admin', stream=True),
+]
+
+
+def check(response, route):
+    if response.status_code != 200:
+        return False
+    if route.stream:
+        return True
+    try:
+        return bool(response.json().get('success')) == route.expect_success
+    except ValueError:
+        return False
+
+
+def send(session, base_url, route, ctx, rng, timeout):
+    kwargs = {'timeout': timeout}
+    if route.params:
+        kwargs['params'] = route.params(ctx, rng)
+    if route.body:
+        kwargs['json'] = route.body(ctx, rng)
+    if route.raw:
+        kwargs['data'] = route.raw(ctx, rng)
+    url = base_url + route.path(ctx, rng)
+    if route.rule == '/api/admin-events':
+        # Server-Sent Events never finish; time to the first line instead
+        with session.get(url, stream=True, **kwargs) as response:
+            next(response.iter_lines(), None)
+            return check(response, route)
+    response = session.request(route.method, url, **kwargs)
+    return check(response, route)
+
+
+def login(session, base_url, path, credentials):
+    response = session.post(base_url + path, json=credentials, timeout=30)
+    if not response.json().get('success'):
+        raise SystemExit(f'Login to {path} failed: {response.text[:200]}')
+    return session
+
+
+def setup(args):
+    """Register one user (with a profile) per thread, post a job and log everyone in"""
+    base_url = args.base_url
+    prefix = f'bench{int(time.time())}'
+    admin = {'username': args.admin_username, 'password': args.admin_password}
+    ctx = {'prefix': prefix, 'admin': admin, 'counter': _Counter(), 'users': []}
+    rng = random.Random(args.seed)
+
+    sessions = []
+    for i in range(args.concurrency):
+        user = {'username': f'{prefix}u{i}', 'email': f'{prefix}u{i}@example.com'}
+        requests.post(base_url + '/api/register', json=dict(user, password=PASSWORD), timeout=30)
+        user_session = login(requests.Session(), base_url, '/api/login',
+                             {'username': user['username'], 'password': PASSWORD})
+        user_session.post(base_url + '/api/profile', json=profile_payload(rng), timeout=30)
+        ctx['users'].append(user)
+        sessions.append({
+            'anon': requests.Session(),
+            'user': user_session,
+            'admin': login(requests.Session(), base_url, '/api/admin-login', admin),
+        })
+
+    admin_session = sessions[0]['admin']
+    listed = admin_session.get(base_url + '/api/admin-users', params={'search': prefix}, timeout=30).json()
+    ids = {user['username']: user['id'] for user in listed['data']['users']}
+    for user in ctx['users']:
+        user['id'] = ids[user['username']]
+
+    job = sessions[0]['user'].post(base_url + '/api/jobs', json={
+        'title': 'Benchmark job', 'description': 'Benchmark job', 'company': 'Bench Co',
+        'location': LOCATIONS[0], 'skills': 'Python, MySQL'}, timeout=30).json()
+    ctx['job_id'] = job.get('job_id', 1)
+    found = requests.get(base_url + '/api/search', params={'location': LOCATIONS[0], 'limit': 100}, timeout=30).json()
+    ctx['profile_ids'] = [row['id'] for row in found.get('data', [])] or [1]
+    return ctx, sessions
+
+
+class _Counter:
+    def __init__(self):
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def __next__(self):
+        with self._lock:
+            self._value += 1
+            return self._value
+
+
+def sql_queries(args):
+    """{(endpoint, method): [sum, count]} from the server's /metrics, or None if unavailable"""
+    headers = {'Authorization': f'Bearer {args.metrics_token}'} if args.metrics_token else {}
+    try:
+        response = requests.get(args.base_url + '/metrics', headers=headers, timeout=10)
+    except requests.RequestException:
+        return None
+    if response.status_code != 200:
+        return None
+    totals = {}
+    for line in response.text.splitlines():
+        match = METRIC_LINE.match(line)
+        if match:
+            kind, endpoint, method, value = match.groups()
+            totals.setdefault((endpoint, method), [0.0, 0.0])[kind == 'count'] = float(value)
+    return totals
+
+
+def percentile(ordered, fraction):
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run_route(route, args, ctx, sessions):
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    started = time.perf_counter()
+    measure_from = started + args.warmup
+    stop_at = measure_from + args.duration
+
+    def worker(index):
+        rng = random.Random(args.seed * 1000 + index)
+        session = sessions[index][route.role]
+        while True:
+            begin = time.perf_counter()
+            if begin >= stop_at:
+                return
+            try:
+                ok = send(session, args.base_url, route, ctx, rng, args.timeout)
+            except requests.RequestException:
+                ok = False
+            elapsed = time.perf_counter() - begin
+            if begin >= measure_from:
+                with lock:
+                    latencies.append(elapsed)
+                    errors[0] += not ok
+
+    before = sql_queries(args)
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(args.concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    after = sql_queries(args)
+
+    queries = None
+    if before is not None and after is not None:
+        key = (route.rule, route.method)
+        total, count = after.get(key, [0.0, 0.0])
+        total -= before.get(key, [0.0, 0.0])[0]
+        count -= before.get(key, [0.0, 0.0])[1]
+        queries = round(total / count, 2) if count else None
+
+    ordered = sorted(latencies)
+    return {
+        'route': route.name,
+        'requests': len(latencies),
+        'errors': errors[0],
+        'throughput_rps': round(len(latencies) / args.duration, 1),
+        'p50_ms': round(percentile(ordered, 0.5) * 1000, 2) if ordered else None,
+        'p99_ms': round(percentile(ordered, 0.99) * 1000, 2) if ordered else None,
+        'mean_ms': round(sum(ordered) / len(ordered) * 1000, 2) if ordered else None,
+        'queries_per_request': queries,
+    }
+
+
+def regressions(results, baseline, tolerance):
+    """Routes whose p99 rose, throughput fell or query count grew beyond ``tolerance``"""
+    previous = {result['route']: result for result in baseline['results']}
+    found = []
+    for result in results:
+        old = previous.get(result['route'])
+        if not old or not result['requests'] or not old['requests']:
+            continue
+        if result['p99_ms'] > old['p99_ms'] * (1 + tolerance):
+            found.append(f"{result['route']}: p99 {old['p99_ms']} -> {result['p99_ms']} ms")
+        if result['throughput_rps'] < old['throughput_rps'] * (1 - tolerance):
+            found.append(f"{result['route']}: throughput {old['throughput_rps']} -> {result['throughput_rps']} rps")
+        if (result['queries_per_request'] or 0) > (old['queries_per_request'] or 0) + 0.5:
+            found.append(f"{result['route']}: queries/request {old['queries_per_request']} -> "
+                         f"{result['queries_per_request']}")
+    return found
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--base-url', default='http://127.0.0.1:5000')
+    parser.add_argument('--duration', type=float, default=10, help='Measured seconds per route')
+    parser.add_argument('--warmup', type=float, default=1, help='Unmeasured seconds before each route')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--timeout', type=float, default=30)
+    parser.add_argument('--routes', help='Comma-separated substrings; only matching routes run')
+    parser.add_argument('--admin-username', default='admin')
+    parser.add_argument('--admin-password', default='admin123')
+    parser.add_argument('--metrics-token')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='Write the JSON report here as well as to stdout')
+    parser.add_argument('--baseline', help='Earlier report to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='Allowed relative slowdown')
+    args = parser.parse_args(argv)
+
+    routes = ROUTES
+    if args.routes:
+        wanted = args.routes.split(',')
+        routes = [route for route in ROUTES if any(part in route.rule for part in wanted)]
+
+    ctx, sessions = setup(args)
+    results = []
+    for route in routes:
+        result = run_route(route, args, ctx, sessions)
+        print(f"{result['route']:<45} {result['throughput_rps']:>8} rps  p50 {result['p50_ms']} ms  "
+              f"p99 {result['p99_ms']} ms  errors {result['errors']}", file=sys.stderr)
+        results.append(result)
+
+    report = {
+        'started_at': datetime.now().isoformat(timespec='seconds'),
+        'revision': git_revision(),
+        'base_url': args.base_url,
+        'concurrency': args.concurrency,
+        'duration': args.duration,
+        'results': results,
+    }
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            found = regressions(results, json.load(f), args.tolerance)
+        for line in found:
+            print(f'REGRESSION {line}', file=sys.stderr)
+        return 1 if found else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
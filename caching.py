@@ -0,0 +1,150 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from sqlite_file import SQLiteFile
+
+
+class TTLCache:
+    """Thread-safe in-process cache whose entries expire after ``ttl`` seconds.
+
+    With ``maxsize`` set, the least recently used entry is evicted once the
+    cache is full.
+    """
+
+    def __init__(self, ttl=60, maxsize=None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+
+    def get_or_set(self, key, factory, ttl=None):
+        """Return the cached value for ``key``, computing it with ``factory()`` on a miss"""
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = factory()
+            self.set(key, value, ttl)
+        return value
+
+    def invalidate(self, key=None):
+        """Drop one entry, or everything when ``key`` is None"""
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+
+class SQLiteCache:
+    """TTL cache kept in a SQLite file instead of process memory.
+
+    Values must be JSON-serializable. Workers pointed at the same file share
+    entries, so an invalidation in one gunicorn worker is seen by the others
+    on their next lookup.
+    """
+
+    def __init__(self, path, ttl=60):
+        self.ttl = ttl
+        self._file = SQLiteFile(path, '''CREATE TABLE IF NOT EXISTS cache (
+            key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)''')
+        self._connection = self._file.connection
+
+    def get(self, key, default=None):
+        row = self._connection().execute('SELECT value, expires_at FROM cache WHERE key = ?', (str(key),)).fetchone()
+        if row is None or row[1] < time.time():
+            return default
+        return json.loads(row[0])
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        self._connection().execute('INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)',
+                                   (str(key), json.dumps(value, default=str), expires_at))
+
+    def get_or_set(self, key, factory, ttl=None):
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = factory()
+            self.set(key, value, ttl)
+        return value
+
+    def invalidate(self, key=None):
+        if key is None:
+            self._connection().execute('DELETE FROM cache')
+        else:
+            self._connection().execute('DELETE FROM cache WHERE key = ?', (str(key),))
+
+
+class MemoryVersions:
+    """Per-table change counters for HTTP validators, kept in this process.
+
+    Each table has a (counter, last change time) pair; a fresh process starts
+    every table at its own start time, so validators issued before a restart
+    never match. Bumps made by other processes are invisible here, which is
+    why the app refuses it when WEB_CONCURRENCY is above 1.
+    """
+
+    def __init__(self):
+        self._started_at = time.time()
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def bump(self, *tables):
+        now = time.time()
+        with self._lock:
+            for table in tables:
+                counter, _ = self._versions.get(table, (0, now))
+                self._versions[table] = (counter + 1, now)
+
+    def get(self, tables):
+        """[(counter, changed_at)] for ``tables``, in order"""
+        with self._lock:
+            return [self._versions.get(table, (0, self._started_at)) for table in tables]
+
+
+class SQLiteVersions:
+    """Per-table change counters in a SQLite file, so a bump in any worker changes every worker's ETags.
+
+    A table never bumped reads as (0, 0.0).
+    """
+
+    def __init__(self, path):
+        self._file = SQLiteFile(path, '''CREATE TABLE IF NOT EXISTS versions (
+            name TEXT PRIMARY KEY, counter INTEGER NOT NULL, changed_at REAL NOT NULL)''')
+        self._connection = self._file.connection
+
+    def bump(self, *tables):
+        now = time.time()
+        self._connection().executemany('''INSERT INTO versions (name, counter, changed_at) VALUES (?, 1, ?)
+            ON CONFLICT(name) DO UPDATE SET counter = counter + 1, changed_at = excluded.changed_at''',
+                                       [(table, now) for table in tables])
+
+    def get(self, tables):
+        placeholders = ', '.join(['?'] * len(tables))
+        rows = self._connection().execute(f'SELECT name, counter, changed_at FROM versions WHERE name IN ({placeholders})',
+                                          list(tables)).fetchall()
+        found = {name: (counter, changed_at) for name, counter, changed_at in rows}
+        return [found.get(table, (0, 0.0)) for table in tables]
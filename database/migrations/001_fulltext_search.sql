@@ -0,0 +1,8 @@
+-- Full-text indexes for /api/search
+-- Apply to an existing district_growth database created from an older schema.sql
+USE district_growth;
+
+CREATE FULLTEXT INDEX ft_profiles_search ON professional_profiles(profession, education, current_location, company, skills);
+CREATE FULLTEXT INDEX ft_profiles_profession ON professional_profiles(profession);
+CREATE FULLTEXT INDEX ft_profiles_education ON professional_profiles(education);
+CREATE FULLTEXT INDEX ft_profiles_location ON professional_profiles(current_location);
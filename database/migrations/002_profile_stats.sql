@@ -0,0 +1,54 @@
+-- Precomputed analytics counts for /api/analytics
+-- After applying, populate the table once with: flask --app app rebuild-analytics
+USE district_growth;
+
+CREATE TABLE profile_stats (
+    dimension ENUM('profession', 'location', 'education', 'experience') NOT NULL,
+    value VARCHAR(200) NOT NULL,
+    count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (dimension, value),
+    INDEX idx_profile_stats_count (dimension, count)
+);
+
+CREATE TRIGGER trg_profile_stats_insert AFTER INSERT ON professional_profiles
+FOR EACH ROW
+INSERT INTO profile_stats (dimension, value, count) VALUES
+    ('profession', NEW.profession, 1),
+    ('location', NEW.current_location, 1),
+    ('education', NEW.education, 1),
+    ('experience', CASE WHEN NEW.experience < 2 THEN 'Fresher (0-2 years)'
+                        WHEN NEW.experience < 5 THEN 'Mid-level (2-5 years)'
+                        WHEN NEW.experience < 10 THEN 'Senior (5-10 years)'
+                        ELSE 'Expert (10+ years)' END, 1)
+ON DUPLICATE KEY UPDATE count = count + VALUES(count);
+
+CREATE TRIGGER trg_profile_stats_update AFTER UPDATE ON professional_profiles
+FOR EACH ROW
+INSERT INTO profile_stats (dimension, value, count) VALUES
+    ('profession', OLD.profession, -1),
+    ('profession', NEW.profession, 1),
+    ('location', OLD.current_location, -1),
+    ('location', NEW.current_location, 1),
+    ('education', OLD.education, -1),
+    ('education', NEW.education, 1),
+    ('experience', CASE WHEN OLD.experience < 2 THEN 'Fresher (0-2 years)'
+                        WHEN OLD.experience < 5 THEN 'Mid-level (2-5 years)'
+                        WHEN OLD.experience < 10 THEN 'Senior (5-10 years)'
+                        ELSE 'Expert (10+ years)' END, -1),
+    ('experience', CASE WHEN NEW.experience < 2 THEN 'Fresher (0-2 years)'
+                        WHEN NEW.experience < 5 THEN 'Mid-level (2-5 years)'
+                        WHEN NEW.experience < 10 THEN 'Senior (5-10 years)'
+                        ELSE 'Expert (10+ years)' END, 1)
+ON DUPLICATE KEY UPDATE count = count + VALUES(count);
+
+CREATE TRIGGER trg_profile_stats_delete AFTER DELETE ON professional_profiles
+FOR EACH ROW
+INSERT INTO profile_stats (dimension, value, count) VALUES
+    ('profession', OLD.profession, -1),
+    ('location', OLD.current_location, -1),
+    ('education', OLD.education, -1),
+    ('experience', CASE WHEN OLD.experience < 2 THEN 'Fresher (0-2 years)'
+                        WHEN OLD.experience < 5 THEN 'Mid-level (2-5 years)'
+                        WHEN OLD.experience < 10 THEN 'Senior (5-10 years)'
+                        ELSE 'Expert (10+ years)' END, -1)
+ON DUPLICATE KEY UPDATE count = count + VALUES(count);
@@ -0,0 +1,13 @@
+-- Time-bucketed activity counters for /api/admin-analytics
+-- After applying, backfill from existing rows with: flask --app app rebuild-rollups
+USE district_growth;
+
+CREATE TABLE activity_rollups (
+    bucket_type ENUM('hour', 'day') NOT NULL,
+    bucket_start DATETIME NOT NULL,
+    metric VARCHAR(50) NOT NULL, -- registration, profile_created, profile_updated, feedback, admin_action
+    dimension VARCHAR(100) NOT NULL DEFAULT '', -- e.g. feedback_type or admin action name
+    count INT NOT NULL DEFAULT 0,
+    total BIGINT NOT NULL DEFAULT 0, -- summed value, e.g. feedback ratings
+    PRIMARY KEY (bucket_type, metric, bucket_start, dimension)
+);
@@ -0,0 +1,6 @@
+-- Seek indexes for keyset pagination of the admin lists
+-- feedback already has idx_feedback_created
+USE district_growth;
+
+CREATE INDEX idx_users_created ON users(created_at);
+CREATE INDEX idx_profiles_updated ON professional_profiles(updated_at);
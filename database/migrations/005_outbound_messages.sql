@@ -0,0 +1,18 @@
+-- Outbound email/SMS queue for /api/send-otp, drained by the outbox workers
+-- After applying, deliver queued messages with OUTBOX_WORKERS > 0 or: flask --app app outbox-worker
+USE district_growth;
+
+CREATE TABLE outbound_messages (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    channel ENUM('email', 'sms') NOT NULL,
+    recipient VARCHAR(100) NOT NULL,
+    subject VARCHAR(200),
+    body TEXT NOT NULL,
+    status ENUM('pending', 'sending', 'sent', 'failed') DEFAULT 'pending',
+    attempts INT DEFAULT 0,
+    next_attempt_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    last_error TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    sent_at TIMESTAMP NULL,
+    INDEX idx_outbound_due (status, next_attempt_at)
+);
@@ -0,0 +1,8 @@
+-- Identity-keyed OTP lookups: (email|mobile, otp_code) replaces the single-column indexes
+USE district_growth;
+
+ALTER TABLE otp_verifications
+    ADD INDEX idx_otp_email_code (email, otp_code),
+    ADD INDEX idx_otp_mobile_code (mobile, otp_code),
+    DROP INDEX idx_otp_email,
+    DROP INDEX idx_otp_mobile;
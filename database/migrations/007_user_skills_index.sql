@@ -0,0 +1,5 @@
+-- Skill search looks up users by skill: index user_skills on (skill_id, user_id)
+USE district_growth;
+
+ALTER TABLE user_skills
+    ADD INDEX idx_user_skills_skill (skill_id, user_id);
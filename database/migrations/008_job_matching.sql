@@ -0,0 +1,16 @@
+-- Job matching: structured requirements on jobs and a job -> skill mapping
+USE district_growth;
+
+ALTER TABLE job_opportunities
+    ADD COLUMN education VARCHAR(200) AFTER requirements,
+    ADD COLUMN min_experience INT AFTER education,
+    ADD COLUMN max_experience INT AFTER min_experience,
+    ADD INDEX idx_job_opportunities_updated (updated_at);
+
+CREATE TABLE job_skills (
+    job_id INT NOT NULL,
+    skill_id INT NOT NULL,
+    PRIMARY KEY (job_id, skill_id),
+    FOREIGN KEY (job_id) REFERENCES job_opportunities(id) ON DELETE CASCADE,
+    FOREIGN KEY (skill_id) REFERENCES skills(id) ON DELETE CASCADE
+);
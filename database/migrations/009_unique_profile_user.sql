@@ -0,0 +1,9 @@
+-- One profile per user, so profile saves can be a single INSERT ... ON DUPLICATE KEY UPDATE
+USE district_growth;
+
+-- Keep the newest profile of any user that has several (the delete trigger adjusts profile_stats)
+DELETE older FROM professional_profiles older
+JOIN professional_profiles newer ON newer.user_id = older.user_id AND newer.id > older.id;
+
+ALTER TABLE professional_profiles
+    ADD UNIQUE KEY uq_profiles_user (user_id);
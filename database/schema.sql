@@ -36,6 +36,7 @@ CREATE TABLE professional_profiles (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+    UNIQUE KEY uq_profiles_user (user_id),
     INDEX idx_profession (profession),
     INDEX idx_location (current_location),
     INDEX idx_education (education),
@@ -66,6 +67,9 @@ CREATE TABLE job_opportunities (
     location VARCHAR(100) NOT NULL,
     salary_range VARCHAR(50),
     requirements TEXT,
+    education VARCHAR(200),
+    min_experience INT,
+    max_experience INT,
     job_type ENUM('Full-time', 'Part-time', 'Contract', 'Freelance', 'Internship') DEFAULT 'Full-time',
     status ENUM('Open', 'Closed', 'On Hold') DEFAULT 'Open',
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -103,7 +107,17 @@ CREATE TABLE user_skills (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
     FOREIGN KEY (skill_id) REFERENCES skills(id) ON DELETE CASCADE,
-    UNIQUE KEY unique_user_skill (user_id, skill_id)
+    UNIQUE KEY unique_user_skill (user_id, skill_id),
+    INDEX idx_user_skills_skill (skill_id, user_id)
+);
+
+-- Skills a job asks for (matched against user_skills)
+CREATE TABLE job_skills (
+    job_id INT NOT NULL,
+    skill_id INT NOT NULL,
+    PRIMARY KEY (job_id, skill_id),
+    FOREIGN KEY (job_id) REFERENCES job_opportunities(id) ON DELETE CASCADE,
+    FOREIGN KEY (skill_id) REFERENCES skills(id) ON DELETE CASCADE
 );
 
 -- Education institutions table
@@ -192,11 +206,27 @@ CREATE TABLE otp_verifications (
     is_verified BOOLEAN DEFAULT FALSE,
     attempts INT DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    INDEX idx_otp_email (email),
-    INDEX idx_otp_mobile (mobile),
+    INDEX idx_otp_email_code (email, otp_code),
+    INDEX idx_otp_mobile_code (mobile, otp_code),
     INDEX idx_otp_expires (expires_at)
 );
 
+-- Outbound email/SMS queue drained by the outbox workers
+CREATE TABLE outbound_messages (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    channel ENUM('email', 'sms') NOT NULL,
+    recipient VARCHAR(100) NOT NULL,
+    subject VARCHAR(200),
+    body TEXT NOT NULL,
+    status ENUM('pending', 'sending', 'sent', 'failed') DEFAULT 'pending',
+    attempts INT DEFAULT 0,
+    next_attempt_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    last_error TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    sent_at TIMESTAMP NULL,
+    INDEX idx_outbound_due (status, next_attempt_at)
+);
+
 -- Admin users table for management access
 CREATE TABLE admin_users (
     id INT AUTO_INCREMENT PRIMARY KEY,
@@ -254,6 +284,82 @@ CREATE INDEX idx_users_username ON users(username);
 CREATE INDEX idx_profiles_user_location ON professional_profiles(user_id, current_location);
 CREATE INDEX idx_profiles_profession_location ON professional_profiles(profession, current_location);
 CREATE INDEX idx_job_opportunities_location_status ON job_opportunities(location, status);
+CREATE INDEX idx_job_opportunities_updated ON job_opportunities(updated_at);
+
+-- Seek indexes for keyset pagination of the admin lists (InnoDB appends id to each)
+CREATE INDEX idx_users_created ON users(created_at);
+CREATE INDEX idx_profiles_updated ON professional_profiles(updated_at);
+
+-- Full-text indexes for professional search (relevance-ranked MATCH ... AGAINST)
+CREATE FULLTEXT INDEX ft_profiles_search ON professional_profiles(profession, education, current_location, company, skills);
+CREATE FULLTEXT INDEX ft_profiles_profession ON professional_profiles(profession);
+CREATE FULLTEXT INDEX ft_profiles_education ON professional_profiles(education);
+CREATE FULLTEXT INDEX ft_profiles_location ON professional_profiles(current_location);
+
+-- Precomputed analytics counts, kept current by the triggers below
+-- Rebuild from scratch with: flask --app app rebuild-analytics
+CREATE TABLE profile_stats (
+    dimension ENUM('profession', 'location', 'education', 'experience') NOT NULL,
+    value VARCHAR(200) NOT NULL,
+    count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (dimension, value),
+    INDEX idx_profile_stats_count (dimension, count)
+);
+
+CREATE TRIGGER trg_profile_stats_insert AFTER INSERT ON professional_profiles
+FOR EACH ROW
+INSERT INTO profile_stats (dimension, value, count) VALUES
+    ('profession', NEW.profession, 1),
+    ('location', NEW.current_location, 1),
+    ('education', NEW.education, 1),
+    ('experience', CASE WHEN NEW.experience < 2 THEN 'Fresher (0-2 years)'
+                        WHEN NEW.experience < 5 THEN 'Mid-level (2-5 years)'
+                        WHEN NEW.experience < 10 THEN 'Senior (5-10 years)'
+                        ELSE 'Expert (10+ years)' END, 1)
+ON DUPLICATE KEY UPDATE count = count + VALUES(count);
+
+CREATE TRIGGER trg_profile_stats_update AFTER UPDATE ON professional_profiles
+FOR EACH ROW
+INSERT INTO profile_stats (dimension, value, count) VALUES
+    ('profession', OLD.profession, -1),
+    ('profession', NEW.profession, 1),
+    ('location', OLD.current_location, -1),
+    ('location', NEW.current_location, 1),
+    ('education', OLD.education, -1),
+    ('education', NEW.education, 1),
+    ('experience', CASE WHEN OLD.experience < 2 THEN 'Fresher (0-2 years)'
+                        WHEN OLD.experience < 5 THEN 'Mid-level (2-5 years)'
+                        WHEN OLD.experience < 10 THEN 'Senior (5-10 years)'
+                        ELSE 'Expert (10+ years)' END, -1),
+    ('experience', CASE WHEN NEW.experience < 2 THEN 'Fresher (0-2 years)'
+                        WHEN NEW.experience < 5 THEN 'Mid-level (2-5 years)'
+                        WHEN NEW.experience < 10 THEN 'Senior (5-10 years)'
+                        ELSE 'Expert (10+ years)' END, 1)
+ON DUPLICATE KEY UPDATE count = count + VALUES(count);
+
+CREATE TRIGGER trg_profile_stats_delete AFTER DELETE ON professional_profiles
+FOR EACH ROW
+INSERT INTO profile_stats (dimension, value, count) VALUES
+    ('profession', OLD.profession, -1),
+    ('location', OLD.current_location, -1),
+    ('education', OLD.education, -1),
+    ('experience', CASE WHEN OLD.experience < 2 THEN 'Fresher (0-2 years)'
+                        WHEN OLD.experience < 5 THEN 'Mid-level (2-5 years)'
+                        WHEN OLD.experience < 10 THEN 'Senior (5-10 years)'
+                        ELSE 'Expert (10+ years)' END, -1)
+ON DUPLICATE KEY UPDATE count = count + VALUES(count);
+
+-- Hourly and daily activity counters behind /api/admin-analytics
+-- Filled incrementally by the app; backfill with: flask --app app rebuild-rollups
+CREATE TABLE activity_rollups (
+    bucket_type ENUM('hour', 'day') NOT NULL,
+    bucket_start DATETIME NOT NULL,
+    metric VARCHAR(50) NOT NULL, -- registration, profile_created, profile_updated, feedback, admin_action
+    dimension VARCHAR(100) NOT NULL DEFAULT '', -- e.g. feedback_type or admin action name
+    count INT NOT NULL DEFAULT 0,
+    total BIGINT NOT NULL DEFAULT 0, -- summed value, e.g. feedback ratings
+    PRIMARY KEY (bucket_type, metric, bucket_start, dimension)
+);
 
 -- Create a view for professional search with aggregated data
 CREATE VIEW professional_search_view AS
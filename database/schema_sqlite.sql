@@ -0,0 +1,454 @@
+-- District Growth Database Schema for the embedded SQLite backend (DB_BACKEND=sqlite)
+-- Mirrors database/schema.sql; the app creates it on first connection to an empty file.
+-- ENUM -> TEXT with a CHECK constraint, AUTO_INCREMENT -> INTEGER PRIMARY KEY AUTOINCREMENT,
+-- MySQL's case-insensitive collation -> COLLATE NOCASE, ON UPDATE CURRENT_TIMESTAMP -> triggers,
+-- FULLTEXT indexes -> an FTS5 table kept in sync by triggers.
+
+-- Users table for authentication
+CREATE TABLE users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username VARCHAR(50) COLLATE NOCASE UNIQUE NOT NULL,
+    email VARCHAR(100) COLLATE NOCASE UNIQUE NOT NULL,
+    mobile VARCHAR(20) COLLATE NOCASE,
+    password VARCHAR(255) NOT NULL,
+    email_verified BOOLEAN DEFAULT FALSE,
+    mobile_verified BOOLEAN DEFAULT FALSE,
+    is_admin BOOLEAN DEFAULT FALSE,
+    status TEXT DEFAULT 'pending' CHECK (status IN ('pending', 'active', 'suspended')),
+    created_at DATETIME DEFAULT (datetime('now', 'localtime')),
+    updated_at DATETIME DEFAULT (datetime('now', 'localtime'))
+);
+
+-- Professional profiles table for storing detailed professional information
+CREATE TABLE professional_profiles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INT NOT NULL UNIQUE REFERENCES users(id) ON DELETE CASCADE,
+    full_name VARCHAR(100) COLLATE NOCASE NOT NULL,
+    profession VARCHAR(100) COLLATE NOCASE NOT NULL,
+    education VARCHAR(200) COLLATE NOCASE NOT NULL,
+    experience INT NOT NULL DEFAULT 0, -- Years of experience
+    skills TEXT COLLATE NOCASE, -- JSON or comma-separated skills
+    current_location VARCHAR(100) COLLATE NOCASE NOT NULL,
+    phone VARCHAR(20),
+    email VARCHAR(100) COLLATE NOCASE,
+    company VARCHAR(100) COLLATE NOCASE,
+    salary_range VARCHAR(50),
+    availability TEXT DEFAULT 'Available' CHECK (availability IN ('Available', 'Not Available', 'Open to Opportunities')),
+    created_at DATETIME DEFAULT (datetime('now', 'localtime')),
+    updated_at DATETIME DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX idx_profession ON professional_profiles(profession);
+CREATE INDEX idx_location ON professional_profiles(current_location);
+CREATE INDEX idx_education ON professional_profiles(education);
+CREATE INDEX idx_experience ON professional_profiles(experience);
+
+-- Professional connections table for networking
+CREATE TABLE professional_connections (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    requester_id INT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    recipient_id INT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    status TEXT DEFAULT 'pending' CHECK (status IN ('pending', 'accepted', 'rejected')),
+    message TEXT,
+    created_at DATETIME DEFAULT (datetime('now', 'localtime')),
+    updated_at DATETIME DEFAULT (datetime('now', 'localtime')),
+    UNIQUE (requester_id, recipient_id)
+);
+
+-- Job opportunities table
+CREATE TABLE job_opportunities (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    posted_by INT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    title VARCHAR(200) NOT NULL,
+    description TEXT NOT NULL,
+    company VARCHAR(100) COLLATE NOCASE NOT NULL,
+    location VARCHAR(100) COLLATE NOCASE NOT NULL,
+    salary_range VARCHAR(50),
+    requirements TEXT,
+    education VARCHAR(200) COLLATE NOCASE,
+    min_experience INT,
+    max_experience INT,
+    job_type TEXT DEFAULT 'Full-time' CHECK (job_type IN ('Full-time', 'Part-time', 'Contract', 'Freelance', 'Internship')),
+    status TEXT DEFAULT 'Open' CHECK (status IN ('Open', 'Closed', 'On Hold')),
+    created_at DATETIME DEFAULT (datetime('now', 'localtime')),
+    updated_at DATETIME DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX idx_jobs_location ON job_opportunities(location);
+CREATE INDEX idx_jobs_company ON job_opportunities(company);
+CREATE INDEX idx_jobs_status ON job_opportunities(status);
+
+-- Skill categories for better organization
+CREATE TABLE skill_categories (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    category_name VARCHAR(50) COLLATE NOCASE NOT NULL UNIQUE,
+    description TEXT,
+    created_at DATETIME DEFAULT (datetime('now', 'localtime'))
+);
+
+-- Individual skills table
+CREATE TABLE skills (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    skill_name VARCHAR(100) COLLATE NOCASE NOT NULL UNIQUE,
+    category_id INT REFERENCES skill_categories(id) ON DELETE SET NULL,
+    created_at DATETIME DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX idx_category ON skills(category_id);
+
+-- User skills mapping table
+CREATE TABLE user_skills (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    skill_id INT NOT NULL REFERENCES skills(id) ON DELETE CASCADE,
+    proficiency_level TEXT DEFAULT 'Intermediate' CHECK (proficiency_level IN ('Beginner', 'Intermediate', 'Advanced', 'Expert')),
+    created_at DATETIME DEFAULT (datetime('now', 'localtime')),
+    UNIQUE (user_id, skill_id)
+);
+CREATE INDEX idx_user_skills_skill ON user_skills(skill_id, user_id);
+
+-- Skills a job asks for (matched against user_skills)
+CREATE TABLE job_skills (
+    job_id INT NOT NULL REFERENCES job_opportunities(id) ON DELETE CASCADE,
+    skill_id INT NOT NULL REFERENCES skills(id) ON DELETE CASCADE,
+    PRIMARY KEY (job_id, skill_id)
+);
+
+-- Education institutions table
+CREATE TABLE institutions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name VARCHAR(200) COLLATE NOCASE NOT NULL,
+    location VARCHAR(100) COLLATE NOCASE,
+    type TEXT DEFAULT 'University' CHECK (type IN ('University', 'College', 'Institute', 'School', 'Online', 'Other')),
+    created_at DATETIME DEFAULT (datetime('now', 'localtime'))
+);
+
+-- User education details
+CREATE TABLE user_education (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    institution_id INT REFERENCES institutions(id) ON DELETE SET NULL,
+    degree VARCHAR(100) NOT NULL,
+    field_of_study VARCHAR(100),
+    start_year INT,
+    end_year INT,
+    grade_or_gpa VARCHAR(20),
+    created_at DATETIME DEFAULT (datetime('now', 'localtime'))
+);
+
+-- Work experience table
+CREATE TABLE work_experience (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INT NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    company VARCHAR(100) NOT NULL,
+    position VARCHAR(100) NOT NULL,
+    location VARCHAR(100),
+    start_date DATE,
+    end_date DATE,
+    is_current BOOLEAN DEFAULT FALSE,
+    description TEXT,
+    created_at DATETIME DEFAULT (datetime('now', 'localtime'))
+);
+
+-- Insert some sample data for skill categories
+INSERT INTO skill_categories (category_name, description) VALUES
+('Programming Languages', 'Various programming languages and scripting'),
+('Web Development', 'Frontend and backend web development technologies'),
+('Database', 'Database management and related technologies'),
+('Mobile Development', 'Mobile app development platforms and frameworks'),
+('Data Science', 'Data analysis, machine learning, and AI technologies'),
+('DevOps', 'Development operations and infrastructure tools'),
+('Design', 'UI/UX design and graphic design tools'),
+('Project Management', 'Project management methodologies and tools'),
+('Digital Marketing', 'Online marketing and social media tools'),
+('Business Analysis', 'Business analysis and process improvement tools');
+
+-- Insert some sample skills
+INSERT INTO skills (skill_name, category_id) VALUES
+-- Programming Languages
+('Python', 1), ('Java', 1), ('JavaScript', 1), ('C++', 1), ('C#', 1), ('PHP', 1), ('Ruby', 1), ('Go', 1),
+-- Web Development
+('React', 2), ('Angular', 2), ('Vue.js', 2), ('Node.js', 2), ('Django', 2), ('Flask', 2), ('Spring Boot', 2), ('HTML/CSS', 2),
+-- Database
+('MySQL', 3), ('PostgreSQL', 3), ('MongoDB', 3), ('Redis', 3), ('Oracle', 3), ('SQL Server', 3),
+-- Mobile Development
+('React Native', 4), ('Flutter', 4), ('iOS Development', 4), ('Android Development', 4), ('Xamarin', 4),
+-- Data Science
+('Machine Learning', 5), ('Data Analysis', 5), ('TensorFlow', 5), ('PyTorch', 5), ('Pandas', 5), ('NumPy', 5),
+-- DevOps
+('Docker', 6), ('Kubernetes', 6), ('AWS', 6), ('Azure', 6), ('Jenkins', 6), ('Git', 6),
+-- Design
+('Photoshop', 7), ('Figma', 7), ('Sketch', 7), ('Adobe Illustrator', 7), ('UI/UX Design', 7),
+-- Project Management
+('Scrum', 8), ('Agile', 8), ('Jira', 8), ('Trello', 8), ('Microsoft Project', 8),
+-- Digital Marketing
+('SEO', 9), ('Google Analytics', 9), ('Social Media Marketing', 9), ('Content Marketing', 9), ('PPC Advertising', 9),
+-- Business Analysis
+('Business Process Modeling', 10), ('Requirements Analysis', 10), ('Data Modeling', 10), ('Stakeholder Management', 10);
+
+-- OTP verification table for email and mobile verification
+CREATE TABLE otp_verifications (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    email VARCHAR(100) COLLATE NOCASE,
+    mobile VARCHAR(20) COLLATE NOCASE,
+    otp_code VARCHAR(6) NOT NULL,
+    otp_type TEXT NOT NULL CHECK (otp_type IN ('email', 'mobile', 'both')),
+    expires_at DATETIME NOT NULL,
+    is_verified BOOLEAN DEFAULT FALSE,
+    attempts INT DEFAULT 0,
+    created_at DATETIME DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX idx_otp_email_code ON otp_verifications(email, otp_code);
+CREATE INDEX idx_otp_mobile_code ON otp_verifications(mobile, otp_code);
+CREATE INDEX idx_otp_expires ON otp_verifications(expires_at);
+
+-- Outbound email/SMS queue drained by the outbox workers
+CREATE TABLE outbound_messages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    channel TEXT NOT NULL CHECK (channel IN ('email', 'sms')),
+    recipient VARCHAR(100) NOT NULL,
+    subject VARCHAR(200),
+    body TEXT NOT NULL,
+    status TEXT DEFAULT 'pending' CHECK (status IN ('pending', 'sending', 'sent', 'failed')),
+    attempts INT DEFAULT 0,
+    next_attempt_at DATETIME NOT NULL DEFAULT (datetime('now', 'localtime')),
+    last_error TEXT,
+    created_at DATETIME DEFAULT (datetime('now', 'localtime')),
+    sent_at DATETIME NULL
+);
+CREATE INDEX idx_outbound_due ON outbound_messages(status, next_attempt_at);
+
+-- Admin users table for management access
+CREATE TABLE admin_users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username VARCHAR(50) COLLATE NOCASE UNIQUE NOT NULL,
+    email VARCHAR(100) COLLATE NOCASE UNIQUE NOT NULL,
+    password VARCHAR(255) NOT NULL,
+    full_name VARCHAR(100) NOT NULL,
+    role TEXT DEFAULT 'admin' CHECK (role IN ('admin', 'manager', 'viewer')),
+    permissions TEXT, -- JSON
+    last_login DATETIME,
+    is_active BOOLEAN DEFAULT TRUE,
+    created_at DATETIME DEFAULT (datetime('now', 'localtime')),
+    updated_at DATETIME DEFAULT (datetime('now', 'localtime'))
+);
+
+-- Admin activity log table
+CREATE TABLE admin_activity_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    admin_id INT NOT NULL REFERENCES admin_users(id) ON DELETE CASCADE,
+    action VARCHAR(100) NOT NULL,
+    target_type TEXT NOT NULL CHECK (target_type IN ('user', 'profile', 'feedback', 'system')),
+    target_id INT,
+    description TEXT,
+    ip_address VARCHAR(45),
+    user_agent TEXT,
+    created_at DATETIME DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX idx_admin_activity_date ON admin_activity_log(created_at);
+CREATE INDEX idx_admin_activity_action ON admin_activity_log(action);
+
+-- Feedback and suggestions table
+CREATE TABLE feedback (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name VARCHAR(100) NOT NULL,
+    email VARCHAR(100) COLLATE NOCASE NOT NULL,
+    feedback_type TEXT NOT NULL CHECK (feedback_type IN ('Bug Report', 'Feature Request', 'General Feedback', 'Suggestion', 'Complaint', 'Appreciation')),
+    subject VARCHAR(200) NOT NULL,
+    message TEXT NOT NULL,
+    rating INT DEFAULT 0 CHECK (rating >= 0 AND rating <= 5),
+    user_id INT REFERENCES users(id) ON DELETE SET NULL,
+    status TEXT DEFAULT 'New' CHECK (status IN ('New', 'In Progress', 'Resolved', 'Closed')),
+    admin_response TEXT,
+    created_at DATETIME DEFAULT (datetime('now', 'localtime')),
+    updated_at DATETIME DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX idx_feedback_type ON feedback(feedback_type);
+CREATE INDEX idx_feedback_status ON feedback(status);
+CREATE INDEX idx_feedback_created ON feedback(created_at);
+
+-- Create indexes for better performance
+CREATE INDEX idx_profiles_user_location ON professional_profiles(user_id, current_location);
+CREATE INDEX idx_profiles_profession_location ON professional_profiles(profession, current_location);
+CREATE INDEX idx_job_opportunities_location_status ON job_opportunities(location, status);
+CREATE INDEX idx_job_opportunities_updated ON job_opportunities(updated_at);
+
+-- Seek indexes for keyset pagination of the admin lists
+CREATE INDEX idx_users_created ON users(created_at, id);
+CREATE INDEX idx_profiles_updated ON professional_profiles(updated_at, id);
+
+-- ON UPDATE CURRENT_TIMESTAMP: stamp rows whose update did not set updated_at itself
+CREATE TRIGGER trg_users_updated_at AFTER UPDATE ON users
+FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE users SET updated_at = datetime('now', 'localtime') WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER trg_profiles_updated_at AFTER UPDATE ON professional_profiles
+FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE professional_profiles SET updated_at = datetime('now', 'localtime') WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER trg_connections_updated_at AFTER UPDATE ON professional_connections
+FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE professional_connections SET updated_at = datetime('now', 'localtime') WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER trg_jobs_updated_at AFTER UPDATE ON job_opportunities
+FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE job_opportunities SET updated_at = datetime('now', 'localtime') WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER trg_admin_users_updated_at AFTER UPDATE ON admin_users
+FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE admin_users SET updated_at = datetime('now', 'localtime') WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER trg_feedback_updated_at AFTER UPDATE ON feedback
+FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE feedback SET updated_at = datetime('now', 'localtime') WHERE id = NEW.id;
+END;
+
+-- Full-text index for professional search (the FULLTEXT indexes of the MySQL schema)
+-- Column filters in the MATCH query stand in for the per-column FULLTEXT indexes
+CREATE VIRTUAL TABLE professional_profiles_fts USING fts5(
+    profession, education, current_location, company, skills,
+    content='professional_profiles', content_rowid='id'
+);
+
+CREATE TRIGGER trg_profiles_fts_insert AFTER INSERT ON professional_profiles
+FOR EACH ROW
+BEGIN
+    INSERT INTO professional_profiles_fts (rowid, profession, education, current_location, company, skills)
+    VALUES (NEW.id, NEW.profession, NEW.education, NEW.current_location, NEW.company, NEW.skills);
+END;
+
+CREATE TRIGGER trg_profiles_fts_update AFTER UPDATE OF profession, education, current_location, company, skills
+ON professional_profiles
+FOR EACH ROW
+BEGIN
+    INSERT INTO professional_profiles_fts (professional_profiles_fts, rowid, profession, education, current_location, company, skills)
+    VALUES ('delete', OLD.id, OLD.profession, OLD.education, OLD.current_location, OLD.company, OLD.skills);
+    INSERT INTO professional_profiles_fts (rowid, profession, education, current_location, company, skills)
+    VALUES (NEW.id, NEW.profession, NEW.education, NEW.current_location, NEW.company, NEW.skills);
+END;
+
+CREATE TRIGGER trg_profiles_fts_delete AFTER DELETE ON professional_profiles
+FOR EACH ROW
+BEGIN
+    INSERT INTO professional_profiles_fts (professional_profiles_fts, rowid, profession, education, current_location, company, skills)
+    VALUES ('delete', OLD.id, OLD.profession, OLD.education, OLD.current_location, OLD.company, OLD.skills);
+END;
+
+-- Precomputed analytics counts, kept current by the triggers below
+-- Rebuild from scratch with: flask --app app rebuild-analytics
+CREATE TABLE profile_stats (
+    dimension TEXT NOT NULL CHECK (dimension IN ('profession', 'location', 'education', 'experience')),
+    value VARCHAR(200) COLLATE NOCASE NOT NULL,
+    count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (dimension, value)
+);
+CREATE INDEX idx_profile_stats_count ON profile_stats(dimension, count);
+
+CREATE TRIGGER trg_profile_stats_insert AFTER INSERT ON professional_profiles
+FOR EACH ROW
+BEGIN
+    INSERT INTO profile_stats (dimension, value, count) VALUES
+        ('profession', NEW.profession, 1),
+        ('location', NEW.current_location, 1),
+        ('education', NEW.education, 1),
+        ('experience', CASE WHEN NEW.experience < 2 THEN 'Fresher (0-2 years)'
+                            WHEN NEW.experience < 5 THEN 'Mid-level (2-5 years)'
+                            WHEN NEW.experience < 10 THEN 'Senior (5-10 years)'
+                            ELSE 'Expert (10+ years)' END, 1)
+    ON CONFLICT (dimension, value) DO UPDATE SET count = count + excluded.count;
+END;
+
+CREATE TRIGGER trg_profile_stats_update AFTER UPDATE OF profession, current_location, education, experience
+ON professional_profiles
+FOR EACH ROW
+BEGIN
+    INSERT INTO profile_stats (dimension, value, count) VALUES
+        ('profession', OLD.profession, -1),
+        ('profession', NEW.profession, 1),
+        ('location', OLD.current_location, -1),
+        ('location', NEW.current_location, 1),
+        ('education', OLD.education, -1),
+        ('education', NEW.education, 1),
+        ('experience', CASE WHEN OLD.experience < 2 THEN 'Fresher (0-2 years)'
+                            WHEN OLD.experience < 5 THEN 'Mid-level (2-5 years)'
+                            WHEN OLD.experience < 10 THEN 'Senior (5-10 years)'
+                            ELSE 'Expert (10+ years)' END, -1),
+        ('experience', CASE WHEN NEW.experience < 2 THEN 'Fresher (0-2 years)'
+                            WHEN NEW.experience < 5 THEN 'Mid-level (2-5 years)'
+                            WHEN NEW.experience < 10 THEN 'Senior (5-10 years)'
+                            ELSE 'Expert (10+ years)' END, 1)
+    ON CONFLICT (dimension, value) DO UPDATE SET count = count + excluded.count;
+END;
+
+CREATE TRIGGER trg_profile_stats_delete AFTER DELETE ON professional_profiles
+FOR EACH ROW
+BEGIN
+    INSERT INTO profile_stats (dimension, value, count) VALUES
+        ('profession', OLD.profession, -1),
+        ('location', OLD.current_location, -1),
+        ('education', OLD.education, -1),
+        ('experience', CASE WHEN OLD.experience < 2 THEN 'Fresher (0-2 years)'
+                            WHEN OLD.experience < 5 THEN 'Mid-level (2-5 years)'
+                            WHEN OLD.experience < 10 THEN 'Senior (5-10 years)'
+                            ELSE 'Expert (10+ years)' END, -1)
+    ON CONFLICT (dimension, value) DO UPDATE SET count = count + excluded.count;
+END;
+
+-- Hourly and daily activity counters behind /api/admin-analytics
+-- Filled incrementally by the app; backfill with: flask --app app rebuild-rollups
+CREATE TABLE activity_rollups (
+    bucket_type TEXT NOT NULL CHECK (bucket_type IN ('hour', 'day')),
+    bucket_start DATETIME NOT NULL,
+    metric VARCHAR(50) NOT NULL, -- registration, profile_created, profile_updated, feedback, admin_action
+    dimension VARCHAR(100) COLLATE NOCASE NOT NULL DEFAULT '', -- e.g. feedback_type or admin action name
+    count INT NOT NULL DEFAULT 0,
+    total BIGINT NOT NULL DEFAULT 0, -- summed value, e.g. feedback ratings
+    PRIMARY KEY (bucket_type, metric, bucket_start, dimension)
+);
+
+-- Create a view for professional search with aggregated data
+CREATE VIEW professional_search_view AS
+SELECT
+    pp.id,
+    pp.user_id,
+    u.username,
+    u.email as user_email,
+    u.mobile as user_mobile,
+    pp.full_name,
+    pp.profession,
+    pp.education,
+    pp.experience,
+    pp.current_location,
+    pp.phone,
+    pp.email as profile_email,
+    pp.company,
+    pp.salary_range,
+    pp.availability,
+    GROUP_CONCAT(s.skill_name) as skills_list,
+    pp.created_at,
+    pp.updated_at
+FROM professional_profiles pp
+JOIN users u ON pp.user_id = u.id
+LEFT JOIN user_skills us ON pp.user_id = us.user_id
+LEFT JOIN skills s ON us.skill_id = s.id
+GROUP BY pp.id;
+
+-- Insert default admin user (passwords are SHA-256 hex digests, as SHA2(..., 256) in MySQL)
+INSERT INTO admin_users (username, email, password, full_name, role, permissions) VALUES
+('admin', 'admin@districtgrowth.com', '240be518fabd2724ddb6f04eeb1da5967448d7e831c08c8fa822809f74c720a9', 'System Administrator', 'admin',
+ '{"can_view_users": true, "can_edit_users": true, "can_delete_users": true, "can_export_data": true, "can_manage_feedback": true}');
+
+-- Insert sample admin users for management team
+INSERT INTO admin_users (username, email, password, full_name, role, permissions) VALUES
+('manager1', 'manager1@districtgrowth.com', '866485796cfa8d7c0cf7111640205b83076433547577511d81f8030ae99ecea5', 'District Manager', 'manager',
+ '{"can_view_users": true, "can_edit_users": false, "can_delete_users": false, "can_export_data": true, "can_manage_feedback": true}'),
+('viewer1', 'viewer1@districtgrowth.com', '65375049b9e4d7cad6c9ba286fdeb9394b28135a3e84136404cfccfdcc438894', 'Data Analyst', 'viewer',
+ '{"can_view_users": true, "can_edit_users": false, "can_delete_users": false, "can_export_data": true, "can_manage_feedback": false}');
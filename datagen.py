@@ -0,0 +1,259 @@
+import hashlib
+import itertools
+import random
+from datetime import datetime, timedelta
+
+# Values are listed most common first; generated data follows a Zipf-like skew over them
+PROFESSIONS = [
+    'Teacher', 'Farmer', 'Software Engineer', 'Business Owner', 'Government Officer', 'Accountant',
+    'Sales Executive', 'Civil Engineer', 'Driver', 'Doctor', 'Nurse', 'Electrician', 'Shopkeeper',
+    'Police Officer', 'Army Personnel', 'Bank Clerk', 'Mechanical Engineer', 'Lawyer', 'Pharmacist',
+    'Web Developer', 'Data Analyst', 'Professor', 'Chartered Accountant', 'Electrical Engineer',
+    'Marketing Manager', 'HR Manager', 'Lab Technician', 'Graphic Designer', 'Architect', 'Dentist',
+]
+LOCATIONS = [
+    'Palwal', 'Hodal', 'Hathin', 'Faridabad', 'Prithla', 'Hassanpur', 'Gurugram', 'Delhi', 'Ballabgarh',
+    'Aurangabad', 'Alawalpur', 'Mandkola', 'Bamnikhera', 'Noida', 'Mathura', 'Bengaluru', 'Pune',
+    'Jaipur', 'Hyderabad', 'Mumbai',
+]
+EDUCATION = [
+    '12th', 'B.A.', 'B.Tech', 'B.Com', '10th', 'B.Sc', 'ITI', 'Diploma', 'M.A.', 'MBA', 'B.Ed',
+    'M.Tech', 'M.Sc', 'LLB', 'MBBS', 'Ph.D',
+]
+# Everyday misspellings mixed in so autocomplete and canonical grouping see realistic input
+VARIANTS = {
+    'Software Engineer': ['Software Engg', 'software engineer', 'Sofware Engineer', 'Sr Software Engineer'],
+    'Government Officer': ['Govt Officer', 'Govt. Officer'],
+    'Civil Engineer': ['Civil Engg', 'civil engineer'],
+    'Teacher': ['teacher', 'Govt Teacher'],
+    'Palwal': ['Palwal, Haryana', 'palwal', 'Palwal Haryana'],
+    'Hodal': ['Hodal, Palwal', 'hodal'],
+    'Faridabad': ['Faridabad, Haryana', 'faridabad'],
+}
+VARIANT_RATE = 0.03
+
+FIRST_NAMES = [
+    'Amit', 'Rahul', 'Sunil', 'Anil', 'Vikas', 'Deepak', 'Sandeep', 'Rajesh', 'Manoj', 'Pooja', 'Neha',
+    'Priya', 'Sunita', 'Anjali', 'Kavita', 'Ritu', 'Suresh', 'Mukesh', 'Ravi', 'Ajay', 'Vijay', 'Sanjay',
+    'Rekha', 'Meena', 'Geeta', 'Sonia', 'Nikhil', 'Rohit', 'Ankit', 'Yogesh', 'Hemant', 'Jyoti',
+]
+LAST_NAMES = [
+    'Sharma', 'Kumar', 'Singh', 'Yadav', 'Chauhan', 'Tewatia', 'Rawat', 'Gautam', 'Jain', 'Garg',
+    'Verma', 'Saini', 'Dagar', 'Sehrawat', 'Bansal', 'Goyal', 'Tanwar', 'Rathi', 'Malik', 'Mittal',
+]
+COMPANIES = [
+    'Self Employed', 'Haryana Government', 'Tata Consultancy Services', 'Infosys', 'HCL Technologies',
+    'Maruti Suzuki', 'JCB India', 'State Bank of India', 'Escorts Kubota', 'Wipro', 'Indian Army',
+    'Private School', 'Civil Hospital Palwal', 'Amazon', 'Hero MotoCorp',
+]
+SALARY_RANGES = ['Below 3 LPA', '3-5 LPA', '5-10 LPA', '10-20 LPA', 'Above 20 LPA']
+AVAILABILITY = ['Available', 'Open to Opportunities', 'Not Available']
+USER_STATUSES = (('active', 85), ('pending', 10), ('suspended', 5))
+# Share of profiles edited after they were created; the rest keep updated_at = created_at
+PROFILE_EDIT_RATE = 0.3
+
+FEEDBACK_TYPES = ['General Feedback', 'Suggestion', 'Appreciation', 'Feature Request', 'Bug Report', 'Complaint']
+FEEDBACK_SUBJECTS = {
+    'General Feedback': ['Nice platform', 'Useful for our district', 'Good initiative'],
+    'Suggestion': ['Add Hindi language support', 'Add a job board', 'Show more analytics'],
+    'Appreciation': ['Thank you', 'Great work by the team', 'Helped me find a job'],
+    'Feature Request': ['Mobile app please', 'Resume upload', 'Filter by salary'],
+    'Bug Report': ['Search not working', 'OTP not received', 'Profile save error'],
+    'Complaint': ['Slow page load', 'Wrong analytics numbers', 'Cannot log in'],
+}
+FEEDBACK_STATUSES = (('New', 50), ('In Progress', 15), ('Resolved', 30), ('Closed', 5))
+ADMIN_ACTIONS = (('update_user_status_suspended', 30), ('update_user_status_active', 35), ('export_users', 10),
+                 ('export_profiles', 15), ('export_feedback', 5), ('import_profiles', 5))
+USER_AGENTS = [
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 14_2) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15',
+    'Mozilla/5.0 (Linux; Android 14) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Mobile Safari/537.36',
+]
+
+# Password for every generated user, so benchmark runs can log in as any of them
+PASSWORD = 'benchmark123'
+
+
+def zipf_weights(n, exponent=1.1):
+    """Cumulative weights making item ``i`` about ``(i + 1) ** -exponent`` as likely as the first"""
+    return list(itertools.accumulate(1 / (rank + 1) ** exponent for rank in range(n)))
+
+
+class DataGenerator:
+    """Fills the main tables with synthetic but plausibly distributed district data.
+
+    Rows are inserted ``batch_size`` at a time with ``executemany`` on the
+    given DB-API connection, committing after each batch. The same ``seed``
+    produces the same data. Runs append to existing data, numbering new users
+    after the highest existing id.
+    """
+
+    def __init__(self, connection, seed=42, batch_size=2000, days=365, progress=print):
+        self.connection = connection
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.days = days
+        self.progress = progress
+        self.now = datetime.now().replace(microsecond=0)
+        self._professions = zipf_weights(len(PROFESSIONS))
+        self._locations = zipf_weights(len(LOCATIONS), 1.3)
+        self._education = zipf_weights(len(EDUCATION), 0.9)
+        self.password = hashlib.sha256(PASSWORD.encode()).hexdigest()
+
+    def _pick(self, values, cum_weights):
+        value = self.rng.choices(values, cum_weights=cum_weights)[0]
+        if value in VARIANTS and self.rng.random() < VARIANT_RATE:
+            return self.rng.choice(VARIANTS[value])
+        return value
+
+    def _weighted(self, pairs):
+        return self.rng.choices([value for value, _ in pairs], weights=[weight for _, weight in pairs])[0]
+
+    def _created_at(self):
+        # Squaring skews sign-ups towards the recent end of the window
+        return self.now - timedelta(seconds=int(self.days * 86400 * self.rng.random() ** 2))
+
+    def _updated_at(self, created_at):
+        if self.rng.random() >= PROFILE_EDIT_RATE:
+            return created_at
+        return (created_at + (self.now - created_at) * self.rng.random()).replace(microsecond=0)
+
+    def _batches(self, total):
+        for start in range(0, total, self.batch_size):
+            yield start, min(self.batch_size, total - start)
+
+    def _insert(self, cursor, sql, rows):
+        cursor.executemany(sql, rows)
+        self.connection.commit()
+
+    def users(self, count, profile_count):
+        """Insert ``count`` users, the first ``profile_count`` of them with profiles and skills"""
+        cursor = self.connection.cursor()
+        cursor.execute('SELECT COALESCE(MAX(id), 0) FROM users')
+        offset = cursor.fetchone()[0]
+        cursor.execute('SELECT id, skill_name FROM skills ORDER BY id')
+        skills = list(cursor.fetchall())
+        self.rng.shuffle(skills)
+        skill_weights = zipf_weights(len(skills), 0.8)
+
+        for start, size in self._batches(count):
+            people = []
+            for i in range(start, start + size):
+                number = offset + i + 1
+                first, last = self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+                username = f'{first.lower()}.{last.lower()}{number}'
+                people.append({
+                    'username': username,
+                    'name': f'{first} {last}',
+                    'email': f'{username}@example.com',
+                    'mobile': f'9{self.rng.randrange(10 ** 9):09d}',
+                    'created_at': self._created_at(),
+                    'profile': i < profile_count,
+                })
+            self._insert(cursor, '''INSERT INTO users
+                (username, email, mobile, password, email_verified, mobile_verified, status, created_at,
+                 updated_at)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)''',
+                [(p['username'], p['email'], p['mobile'], self.password, True, self.rng.random() < 0.7,
+                  self._weighted(USER_STATUSES), p['created_at'], p['created_at']) for p in people])
+
+            with_profiles = [p for p in people if p['profile']]
+            if not with_profiles:
+                continue
+            placeholders = ', '.join(['%s'] * len(with_profiles))
+            cursor.execute(f'SELECT username, id FROM users WHERE username IN ({placeholders})',
+                           [p['username'] for p in with_profiles])
+            ids = dict(cursor.fetchall())
+
+            profiles, user_skills = [], []
+            for p in with_profiles:
+                user_id = ids[p['username']]
+                chosen = {}
+                for _ in range(self.rng.randint(2, 6)):
+                    skill_id, name = self.rng.choices(skills, cum_weights=skill_weights)[0]
+                    chosen[skill_id] = name
+                user_skills.extend((user_id, skill_id) for skill_id in chosen)
+                experience = min(40, int(self.rng.expovariate(1 / 6)))
+                profiles.append((user_id, p['name'], self._pick(PROFESSIONS, self._professions),
+                                 self._pick(EDUCATION, self._education), experience, ', '.join(chosen.values()),
+                                 self._pick(LOCATIONS, self._locations), p['mobile'], p['email'],
+                                 self.rng.choice(COMPANIES), self.rng.choice(SALARY_RANGES),
+                                 self.rng.choice(AVAILABILITY), p['created_at'],
+                                 self._updated_at(p['created_at'])))
+            # updated_at is set explicitly: the column default (now) would count every profile as just edited
+            self._insert(cursor, '''INSERT INTO professional_profiles
+                (user_id, full_name, profession, education, experience, skills, current_location,
+                 phone, email, company, salary_range, availability, created_at, updated_at)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)''', profiles)
+            self._insert(cursor, 'INSERT IGNORE INTO user_skills (user_id, skill_id) VALUES (%s, %s)', user_skills)
+            self.progress(f'users: {start + size}/{count}')
+        cursor.close()
+
+    def _user_ids(self, cursor):
+        cursor.execute('SELECT MIN(id), MAX(id) FROM users')
+        return cursor.fetchone()
+
+    def feedback(self, count):
+        cursor = self.connection.cursor()
+        low, high = self._user_ids(cursor)
+        for start, size in self._batches(count):
+            rows = []
+            for _ in range(size):
+                feedback_type = self.rng.choice(FEEDBACK_TYPES)
+                first, last = self.rng.choice(FIRST_NAMES), self.rng.choice(LAST_NAMES)
+                user_id = self.rng.randint(low, high) if high and self.rng.random() < 0.4 else None
+                rating = min(5, max(1, round(self.rng.gauss(4, 1))))
+                subject = self.rng.choice(FEEDBACK_SUBJECTS[feedback_type])
+                rows.append((f'{first} {last}', f'{first.lower()}.{last.lower()}@example.com', feedback_type,
+                             subject, f'{subject}. Submitted from the feedback page.', rating, user_id,
+                             self._weighted(FEEDBACK_STATUSES), self._created_at()))
+            self._insert(cursor, '''INSERT INTO feedback
+                (name, email, feedback_type, subject, message, rating, user_id, status, created_at)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)''', rows)
+            self.progress(f'feedback: {start + size}/{count}')
+        cursor.close()
+
+    def otps(self, count):
+        cursor = self.connection.cursor()
+        for start, size in self._batches(count):
+            rows = []
+            for _ in range(size):
+                created_at = self._created_at()
+                if self.rng.random() < 0.5:
+                    email, mobile, otp_type = f'user{self.rng.randrange(10 ** 7)}@example.com', None, 'email'
+                else:
+                    email, mobile, otp_type = None, f'9{self.rng.randrange(10 ** 9):09d}', 'mobile'
+                rows.append((email, mobile, f'{self.rng.randrange(10 ** 6):06d}', otp_type,
+                             created_at + timedelta(minutes=10), self.rng.random() < 0.6,
+                             min(5, int(self.rng.expovariate(1.5))), created_at))
+            self._insert(cursor, '''INSERT INTO otp_verifications
+                (email, mobile, otp_code, otp_type, expires_at, is_verified, attempts, created_at)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)''', rows)
+            self.progress(f'otp_verifications: {start + size}/{count}')
+        cursor.close()
+
+    def admin_actions(self, count):
+        cursor = self.connection.cursor()
+        cursor.execute('SELECT id FROM admin_users')
+        admin_ids = [row[0] for row in cursor.fetchall()]
+        if not admin_ids:
+            self.progress('admin_activity_log: skipped, no admin_users')
+            return
+        low, high = self._user_ids(cursor)
+        for start, size in self._batches(count):
+            rows = []
+            for _ in range(size):
+                action = self._weighted(ADMIN_ACTIONS)
+                if action.startswith('update_user_status_') and high:
+                    target_type, target_id = 'user', self.rng.randint(low, high)
+                    description = f"Changed user status to {action.rsplit('_', 1)[1]}"
+                else:
+                    target_type, target_id, description = 'system', None, action.replace('_', ' ').capitalize()
+                rows.append((self.rng.choice(admin_ids), action, target_type, target_id, description,
+                             f'10.0.{self.rng.randrange(256)}.{self.rng.randrange(1, 255)}',
+                             self.rng.choice(USER_AGENTS), self._created_at()))
+            self._insert(cursor, '''INSERT INTO admin_activity_log
+                (admin_id, action, target_type, target_id, description, ip_address, user_agent, created_at)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)''', rows)
+            self.progress(f'admin_activity_log: {start + size}/{count}')
+        cursor.close()
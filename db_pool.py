@@ -0,0 +1,217 @@
+import threading
+import time
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection becomes available within the pool timeout"""
+
+
+class _PooledConnection:
+    """Bookkeeping for one connection owned by the pool"""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+class ConnectionPool:
+    """Fixed-size, thread-safe pool of DB-API connections.
+
+    Connections idle longer than ``ping_after`` seconds are pinged before being
+    handed out, and connections older than ``recycle`` seconds are replaced, so
+    callers never see one MySQL has already dropped (wait_timeout).
+    """
+
+    def __init__(self, connect, size=5, timeout=10, recycle=3600, ping_after=30):
+        self.connect = connect
+        self.size = size
+        self.timeout = timeout
+        self.recycle = recycle
+        self.ping_after = ping_after
+        self._idle = []
+        self._checked_out = {}
+        self._open = 0
+        self._condition = threading.Condition()
+        self._stats = {
+            'acquired': 0,
+            'created': 0,
+            'recycled': 0,
+            'failed_pings': 0,
+            'timeouts': 0,
+            'wait_seconds_total': 0.0,
+            'wait_seconds_max': 0.0,
+        }
+
+    def acquire(self):
+        """Check out a healthy connection, waiting up to ``timeout`` seconds"""
+        started = time.monotonic()
+        deadline = started + self.timeout
+        with self._condition:
+            while True:
+                if self._idle:
+                    pooled = self._idle.pop()
+                    break
+                if self._open < self.size:
+                    self._open += 1
+                    pooled = None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats['timeouts'] += 1
+                    raise PoolTimeout(f'No database connection available after {self.timeout}s')
+                self._condition.wait(remaining)
+
+        try:
+            pooled = self._checkout(pooled)
+        except Exception:
+            with self._condition:
+                self._open -= 1
+                self._condition.notify()
+            raise
+
+        waited = time.monotonic() - started
+        with self._condition:
+            self._checked_out[id(pooled.raw)] = pooled
+            self._stats['acquired'] += 1
+            self._stats['wait_seconds_total'] += waited
+            self._stats['wait_seconds_max'] = max(self._stats['wait_seconds_max'], waited)
+        return pooled.raw
+
+    def _checkout(self, pooled):
+        """Validate an idle connection (or open a new one) outside the lock"""
+        now = time.monotonic()
+        if pooled is not None and now - pooled.created_at > self.recycle:
+            self._close(pooled.raw)
+            self._count('recycled')
+            pooled = None
+        if pooled is not None and now - pooled.last_used > self.ping_after:
+            try:
+                pooled.raw.ping()
+            except Exception:
+                self._close(pooled.raw)
+                self._count('failed_pings')
+                pooled = None
+        if pooled is None:
+            pooled = _PooledConnection(self.connect())
+            self._count('created')
+        return pooled
+
+    def _count(self, key):
+        with self._condition:
+            self._stats[key] += 1
+
+    def release(self, raw, discard=False):
+        """Return a connection, rolling back anything left uncommitted"""
+        with self._condition:
+            pooled = self._checked_out.pop(id(raw), None)
+        if pooled is None:
+            return
+
+        if not discard:
+            try:
+                raw.rollback()
+            except Exception:
+                discard = True
+
+        with self._condition:
+            if discard:
+                self._open -= 1
+            else:
+                pooled.last_used = time.monotonic()
+                self._idle.append(pooled)
+            self._condition.notify()
+        if discard:
+            self._close(raw)
+
+    def stats(self):
+        """Snapshot of pool usage counters, including time spent waiting for a connection"""
+        with self._condition:
+            stats = dict(self._stats)
+            stats.update({
+                'size': self.size,
+                'open': self._open,
+                'idle': len(self._idle),
+                'in_use': len(self._checked_out),
+            })
+        stats['wait_seconds_avg'] = stats['wait_seconds_total'] / stats['acquired'] if stats['acquired'] else 0.0
+        return stats
+
+    @staticmethod
+    def _close(raw):
+        try:
+            raw.close()
+        except Exception:
+            pass
+
+
+class ReplicaSet:
+    """Routes read-only work across replica pools, skipping lagging replicas.
+
+    Each replica's lag is checked at most every ``check_interval`` seconds on a
+    connection from its own pool. A replica that is more than ``max_lag``
+    seconds behind, has replication stopped, or fails to connect is skipped
+    until its next check, as is a server that reports no replication status at
+    all unless ``allow_standalone`` is set (for local testing against a plain
+    second server). ``acquire`` returns None when no replica is usable so the
+    caller can fall back to the primary.
+    """
+
+    def __init__(self, pools, max_lag=5, check_interval=5, allow_standalone=False):
+        self.pools = pools
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.allow_standalone = allow_standalone
+        self._health = {}
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Return (pool, connection) for a healthy replica, or None"""
+        with self._lock:
+            start = self._next
+            self._next = (self._next + 1) % len(self.pools) if self.pools else 0
+        for offset in range(len(self.pools)):
+            pool = self.pools[(start + offset) % len(self.pools)]
+            healthy, checked_at = self._health.get(id(pool), (True, 0))
+            stale = time.monotonic() - checked_at > self.check_interval
+            if not healthy and not stale:
+                continue
+            try:
+                connection = pool.acquire()
+            except Exception:
+                self._health[id(pool)] = (False, time.monotonic())
+                continue
+            if stale:
+                healthy = self._check_lag(connection)
+                self._health[id(pool)] = (healthy, time.monotonic())
+                if not healthy:
+                    pool.release(connection)
+                    continue
+            return pool, connection
+        return None
+
+    def _check_lag(self, connection):
+        cursor = connection.cursor()
+        try:
+            try:
+                cursor.execute('SHOW REPLICA STATUS')
+                lag_column = 'Seconds_Behind_Source'
+            except Exception:
+                cursor.execute('SHOW SLAVE STATUS')
+                lag_column = 'Seconds_Behind_Master'
+            row = cursor.fetchone()
+            if row is None:
+                # Not a replica, e.g. a misconfigured host or a primary: its data may be anything
+                return self.allow_standalone
+            columns = [column[0] for column in cursor.description]
+            lag = row[columns.index(lag_column)]
+            return lag is not None and lag <= self.max_lag
+        except Exception:
+            return False
+        finally:
+            cursor.close()
+
+    def stats(self):
+        """Pool counters and last known health for each replica"""
+        return [dict(pool.stats(), healthy=self._health.get(id(pool), (True, 0))[0]) for pool in self.pools]
@@ -0,0 +1,81 @@
+import json
+import threading
+import time
+from collections import deque
+
+from sqlite_file import SQLiteFile
+
+
+class MemoryEventBus:
+    """In-process event bus keeping the most recent ``maxlen`` events.
+
+    A subscriber is woken as soon as an event is published, but only events
+    published by its own process ever reach it.
+    """
+
+    def __init__(self, maxlen=1000):
+        self._events = deque(maxlen=maxlen)
+        self._last_id = 0
+        self._condition = threading.Condition()
+
+    def publish(self, event_type, data):
+        with self._condition:
+            self._last_id += 1
+            self._events.append({'id': self._last_id, 'type': event_type, 'data': data})
+            self._condition.notify_all()
+            return self._last_id
+
+    def last_id(self):
+        with self._condition:
+            return self._last_id
+
+    def since(self, after_id):
+        with self._condition:
+            return [event for event in self._events if event['id'] > after_id]
+
+    def wait(self, after_id, timeout):
+        """Events newer than ``after_id``, blocking up to ``timeout`` seconds for one"""
+        with self._condition:
+            self._condition.wait_for(lambda: self._last_id > after_id, timeout)
+        return self.since(after_id)
+
+
+class SQLiteEventBus:
+    """Event bus on a SQLite file, so a stream in one worker sees events published by any other.
+
+    Subscribers poll the file every ``poll_interval`` seconds, which is a cheap
+    indexed read that never touches MySQL. Events older than ``retention``
+    seconds are pruned as new ones are published.
+    """
+
+    def __init__(self, path, poll_interval=1, retention=3600):
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self._file = SQLiteFile(path, '''CREATE TABLE IF NOT EXISTS events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, type TEXT NOT NULL, data TEXT NOT NULL, created_at REAL NOT NULL)''')
+        self._connection = self._file.connection
+
+    def publish(self, event_type, data):
+        connection = self._connection()
+        now = time.time()
+        cursor = connection.execute('INSERT INTO events (type, data, created_at) VALUES (?, ?, ?)',
+                                    (event_type, json.dumps(data, default=str), now))
+        connection.execute('DELETE FROM events WHERE created_at < ?', (now - self.retention,))
+        return cursor.lastrowid
+
+    def last_id(self):
+        return self._connection().execute('SELECT COALESCE(MAX(id), 0) FROM events').fetchone()[0]
+
+    def since(self, after_id):
+        rows = self._connection().execute('SELECT id, type, data FROM events WHERE id > ? ORDER BY id',
+                                          (after_id,)).fetchall()
+        return [{'id': row[0], 'type': row[1], 'data': json.loads(row[2])} for row in rows]
+
+    def wait(self, after_id, timeout):
+        deadline = time.monotonic() + timeout
+        while True:
+            events = self.since(after_id)
+            remaining = deadline - time.monotonic()
+            if events or remaining <= 0:
+                return events
+            time.sleep(min(self.poll_interval, remaining))
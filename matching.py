@@ -0,0 +1,304 @@
+import threading
+import time
+
+import numpy as np
+
+# Relative weight of each signal in a match score (scores fall in 0..1)
+MATCH_WEIGHTS = {
+    'skills': 0.5,
+    'location': 0.2,
+    'experience': 0.15,
+    'education': 0.1,
+    'availability': 0.05,
+}
+
+# Profile availability as a ranking signal
+AVAILABILITY_WEIGHTS = {
+    'Available': 1.0,
+    'Open to Opportunities': 0.6,
+    'Not Available': 0.0,
+}
+
+# Years outside a job's experience range before the experience signal reaches zero
+EXPERIENCE_TOLERANCE = 5
+MAX_EXPERIENCE = 100
+
+
+class Vocabulary:
+    """Maps strings such as locations to small integer codes; '' and None are 0"""
+
+    def __init__(self):
+        self._codes = {}
+
+    def code(self, value):
+        key = ' '.join((value or '').lower().split())
+        if not key:
+            return 0
+        return self._codes.setdefault(key, len(self._codes) + 1)
+
+
+class FeatureTable:
+    """Column arrays of match features for one kind of entity (profiles or jobs).
+
+    Skills are posting lists (skill id -> set of rows holding it), so memory
+    follows the number of (row, skill) pairs rather than rows times distinct
+    skills, and the overlap with a handful of skills only visits their rows.
+    Rows grow by doubling; ``upsert`` rewrites a row in place.
+    """
+
+    def __init__(self, capacity=1024):
+        self.size = 0
+        self.rows = {}
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.location = np.zeros(capacity, dtype=np.int32)
+        self.education = np.zeros(capacity, dtype=np.int32)
+        self.exp_min = np.zeros(capacity, dtype=np.int16)
+        self.exp_max = np.zeros(capacity, dtype=np.int16)
+        self.weight = np.zeros(capacity, dtype=np.float32)
+        self.skill_count = np.zeros(capacity, dtype=np.int16)
+        self.postings = {}
+        self.row_skills = {}
+
+    def _grow_rows(self):
+        capacity = len(self.ids) * 2
+        for name in ('ids', 'active', 'location', 'education', 'exp_min', 'exp_max', 'weight', 'skill_count'):
+            array = getattr(self, name)
+            grown = np.zeros(capacity, dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
+
+    def upsert(self, entity_id, active, location, education, exp_min, exp_max, weight, skill_ids):
+        row = self.rows.get(entity_id)
+        if row is None:
+            if self.size == len(self.ids):
+                self._grow_rows()
+            row = self.rows[entity_id] = self.size
+            self.size += 1
+        self.ids[row] = entity_id
+        self.active[row] = active
+        self.location[row] = location
+        self.education[row] = education
+        self.exp_min[row] = exp_min
+        self.exp_max[row] = exp_max
+        self.weight[row] = weight
+        for skill_id in self.row_skills.get(row, ()):
+            rows = self.postings[skill_id]
+            rows.discard(row)
+            if not rows:
+                del self.postings[skill_id]
+        for skill_id in skill_ids:
+            self.postings.setdefault(skill_id, set()).add(row)
+        self.row_skills[row] = list(skill_ids)
+        self.skill_count[row] = len(skill_ids)
+
+    def features(self, entity_id):
+        """The query-side features of one entity, or None if it is not indexed"""
+        row = self.rows.get(entity_id)
+        if row is None:
+            return None
+        return {
+            'skills': self.row_skills.get(row, []),
+            'location': int(self.location[row]),
+            'education': int(self.education[row]),
+            'exp_min': int(self.exp_min[row]),
+            'exp_max': int(self.exp_max[row]),
+        }
+
+    def skill_overlap(self, skill_ids):
+        overlap = np.zeros(self.size, dtype=np.float32)
+        for skill_id in set(skill_ids):
+            rows = self.postings.get(skill_id)
+            if rows:
+                overlap[np.fromiter(rows, dtype=np.int64, count=len(rows))] += 1
+        return overlap
+
+
+def rank(table, query, k, weights=MATCH_WEIGHTS, query_is_job=True):
+    """Top ``k`` active rows of ``table`` for ``query`` features as (id, score, signals).
+
+    The skills signal is the share of the job's skills covered, so it divides
+    by the query's skill count when the query is the job and by each row's
+    count when the rows are jobs.
+    """
+    n = table.size
+    if n == 0 or k <= 0:
+        return []
+
+    overlap = table.skill_overlap(query['skills'])
+    if query_is_job:
+        skills = overlap / max(1, len(query['skills']))
+    else:
+        skills = overlap / np.maximum(1, table.skill_count[:n])
+    signals = {
+        'skills': skills,
+        'location': (table.location[:n] == query['location']) & (query['location'] != 0),
+        'education': (table.education[:n] == query['education']) & (query['education'] != 0),
+        'availability': table.weight[:n],
+    }
+    exp_min = table.exp_min[:n].astype(np.float32)
+    exp_max = table.exp_max[:n].astype(np.float32)
+    gap = np.maximum(0, np.maximum(exp_min - query['exp_max'], query['exp_min'] - exp_max))
+    signals['experience'] = np.clip(1 - gap / EXPERIENCE_TOLERANCE, 0, 1)
+
+    scores = np.zeros(n, dtype=np.float32)
+    for name, weight in weights.items():
+        scores += weight * signals[name]
+    scores[~table.active[:n]] = -np.inf
+
+    k = min(k, int(table.active[:n].sum()))
+    if k == 0:
+        return []
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top], kind='stable')]
+    return [(int(table.ids[row]), round(float(scores[row]), 4),
+             {name: round(float(signals[name][row]), 4) for name in weights})
+            for row in top]
+
+
+def _latest(rows, since):
+    return max([row['updated_at'] for row in rows] + ([since] if since else []), default=None)
+
+
+class MatchEngine:
+    """In-memory feature tables for profiles and open jobs, ranked with numpy.
+
+    ``refresh`` runs on a caller-supplied DB-API dict cursor. It reloads rows
+    whose ``updated_at`` is at or after the last one seen every
+    ``refresh_interval`` seconds. Every ``rebuild_interval`` seconds the tables
+    are rebuilt from scratch so deleted rows drop out; that rebuild runs on a
+    background thread with its own connection from ``connect`` (cursors of
+    class ``dict_cursor``) and replaces the tables when done, so requests keep
+    ranking on the current data. Only the first build uses the caller's cursor.
+    """
+
+    def __init__(self, connect, dict_cursor, refresh_interval=30, rebuild_interval=3600, weights=MATCH_WEIGHTS):
+        self.connect = connect
+        self.dict_cursor = dict_cursor
+        self.refresh_interval = refresh_interval
+        self.rebuild_interval = rebuild_interval
+        self.weights = weights
+        self._lock = threading.Lock()
+        self._refreshing = threading.Lock()
+        self._rebuilder = None
+        self.vocabulary = Vocabulary()
+        self.profiles = FeatureTable()
+        self.jobs = FeatureTable()
+        self._profiles_since = None
+        self._jobs_since = None
+        self._refreshed_at = None
+        self._rebuilt_at = None
+
+    def refresh(self, cursor, force=False):
+        """Bring the tables up to date if the refresh interval has passed.
+
+        ``force`` skips the interval check and waits for a refresh already in
+        progress, e.g. to pick up a row the caller knows was just written.
+        """
+        now = time.monotonic()
+        if not force and self._refreshed_at is not None and now - self._refreshed_at < self.refresh_interval:
+            return
+        if self._rebuilt_at is not None and now - self._rebuilt_at >= self.rebuild_interval:
+            self._start_rebuild()
+        # One refresher at a time; concurrent requests rank on the current data
+        if not self._refreshing.acquire(blocking=force):
+            return
+        try:
+            self._update(cursor, rebuild=self._rebuilt_at is None)
+        finally:
+            self._refreshing.release()
+
+    def _start_rebuild(self):
+        with self._lock:
+            if self._rebuilder is not None and self._rebuilder.is_alive():
+                return
+            self._rebuilder = threading.Thread(target=self._rebuild, name='match-engine-rebuild', daemon=True)
+            self._rebuilder.start()
+
+    def _rebuild(self):
+        with self._refreshing:
+            connection = None
+            try:
+                connection = self.connect()
+                cursor = connection.cursor(self.dict_cursor)
+                self._update(cursor, rebuild=True)
+                cursor.close()
+            except Exception as e:
+                print(f"Match engine rebuild error: {str(e)}")
+            finally:
+                if connection is not None:
+                    connection.close()
+
+    def _update(self, cursor, rebuild):
+        """Load rows changed since the last refresh (everything when ``rebuild``) into the tables"""
+        now = time.monotonic()
+        profiles, profile_skills = self._load(cursor, '''SELECT id, current_location AS location, education,
+            experience AS exp_min, experience AS exp_max, availability, updated_at
+            FROM professional_profiles''', '''SELECT pp.id, us.skill_id FROM user_skills us
+            JOIN professional_profiles pp ON pp.user_id = us.user_id''', 'pp.',
+            None if rebuild else self._profiles_since)
+        jobs, job_skills = self._load(cursor, '''SELECT id, location, education,
+            min_experience AS exp_min, max_experience AS exp_max, status, updated_at
+            FROM job_opportunities''', '''SELECT j.id, js.skill_id FROM job_skills js
+            JOIN job_opportunities j ON j.id = js.job_id''', 'j.', None if rebuild else self._jobs_since)
+
+        if rebuild:
+            # Fill new tables without the lock, then swap them in
+            vocabulary, profile_table, job_table = Vocabulary(), FeatureTable(), FeatureTable()
+            self._fill(vocabulary, profile_table, job_table, profiles, profile_skills, jobs, job_skills)
+            with self._lock:
+                self.vocabulary, self.profiles, self.jobs = vocabulary, profile_table, job_table
+                self._profiles_since = _latest(profiles, None)
+                self._jobs_since = _latest(jobs, None)
+                self._rebuilt_at = now
+        else:
+            with self._lock:
+                self._fill(self.vocabulary, self.profiles, self.jobs, profiles, profile_skills, jobs, job_skills)
+                self._profiles_since = _latest(profiles, self._profiles_since)
+                self._jobs_since = _latest(jobs, self._jobs_since)
+        self._refreshed_at = now
+
+    @staticmethod
+    def _fill(vocabulary, profile_table, job_table, profiles, profile_skills, jobs, job_skills):
+        for row in profiles:
+            profile_table.upsert(row['id'], True, vocabulary.code(row['location']),
+                                 vocabulary.code(row['education']), row['exp_min'], row['exp_max'],
+                                 AVAILABILITY_WEIGHTS.get(row['availability'], 0.0),
+                                 profile_skills.get(row['id'], []))
+        for row in jobs:
+            job_table.upsert(row['id'], row['status'] == 'Open', vocabulary.code(row['location']),
+                             vocabulary.code(row['education']),
+                             row['exp_min'] or 0, MAX_EXPERIENCE if row['exp_max'] is None else row['exp_max'],
+                             1.0, job_skills.get(row['id'], []))
+
+    @staticmethod
+    def _load(cursor, rows_query, skills_query, alias, since):
+        if since is None:
+            cursor.execute(rows_query)
+            rows = cursor.fetchall()
+            cursor.execute(skills_query)
+        else:
+            cursor.execute(rows_query + ' WHERE updated_at >= %s', (since,))
+            rows = cursor.fetchall()
+            cursor.execute(skills_query + f' WHERE {alias}updated_at >= %s', (since,))
+        skills = {}
+        for row in cursor.fetchall():
+            skills.setdefault(row['id'], []).append(row['skill_id'])
+        return rows, skills
+
+    def profiles_for_job(self, job_id, k=10):
+        """Best profiles for a job, or None if the job is unknown"""
+        with self._lock:
+            query = self.jobs.features(job_id)
+            if query is None:
+                return None
+            return rank(self.profiles, query, k, self.weights)
+
+    def jobs_for_profile(self, profile_id, k=10):
+        """Best open jobs for a profile, or None if the profile is unknown"""
+        with self._lock:
+            query = self.profiles.features(profile_id)
+            if query is None:
+                return None
+            weights = dict(self.weights, availability=0)
+            return rank(self.jobs, query, k, weights, query_is_job=False)
@@ -0,0 +1,191 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+
+class OTPError(Exception):
+    """Raised when an OTP request is refused (rate or attempt limit)"""
+
+
+def identity_of(email, mobile):
+    """The column and value an OTP is keyed on: email when present, otherwise mobile"""
+    return ('email', email) if email else ('mobile', mobile)
+
+
+def send_identities(email, mobile):
+    """Every (column, value) an OTP send counts against: the email and the mobile, each on its own"""
+    return [(column, value) for column, value in (('email', email), ('mobile', mobile)) if value]
+
+
+class MySQLOTPStore:
+    """OTP records in the otp_verifications table.
+
+    Every lookup is keyed by identity and code so it is served by the
+    (email, otp_code) / (mobile, otp_code) indexes, and expired rows are left
+    for ``sweep`` instead of being deleted on the request path. Calls run on
+    the caller's cursor so they commit with the rest of the request.
+    """
+
+    def __init__(self, max_attempts=5, send_limit=5, send_window=timedelta(minutes=15)):
+        self.max_attempts = max_attempts
+        self.send_limit = send_limit
+        self.send_window = send_window
+
+    def issue(self, cursor, email, mobile, otp_type, otp, expires_at):
+        """Store a new OTP, refusing once the email or the mobile hits its send limit for the window"""
+        for column, value in send_identities(email, mobile):
+            cursor.execute(f'''SELECT COUNT(*) FROM otp_verifications
+                             WHERE {column} = %s AND created_at >= %s''',
+                         (value, datetime.now() - self.send_window))
+            if self._scalar(cursor) >= self.send_limit:
+                raise OTPError('Too many OTP requests. Please try again later.')
+        cursor.execute('''INSERT INTO otp_verifications
+                        (email, mobile, otp_code, otp_type, expires_at, created_at)
+                        VALUES (%s, %s, %s, %s, %s, %s)''',
+                     (email, mobile, otp, otp_type, expires_at, datetime.now()))
+
+    def verify(self, cursor, email, mobile, otp):
+        """Mark a matching live OTP verified; a wrong code counts against the identity"""
+        column, value = identity_of(email, mobile)
+        now = datetime.now()
+        query = f'''SELECT id, attempts FROM otp_verifications
+                   WHERE {column} = %s AND otp_code = %s AND is_verified = FALSE AND expires_at > %s'''
+        params = [value, otp, now]
+        if email and mobile:
+            query += ' AND mobile = %s'
+            params.append(mobile)
+        cursor.execute(query + ' ORDER BY id DESC LIMIT 1', params)
+        record = self._row(cursor)
+
+        if record and record['attempts'] < self.max_attempts:
+            cursor.execute('UPDATE otp_verifications SET is_verified = TRUE WHERE id = %s', (record['id'],))
+            return True
+
+        # Count the failure against this identity's live codes only
+        cursor.execute(f'''UPDATE otp_verifications SET attempts = attempts + 1
+                         WHERE {column} = %s AND is_verified = FALSE AND expires_at > %s''',
+                     (value, now))
+        if record:
+            raise OTPError('Too many incorrect attempts. Please request a new OTP.')
+        return False
+
+    def is_verified(self, cursor, email, otp):
+        cursor.execute('''SELECT id FROM otp_verifications
+                        WHERE email = %s AND otp_code = %s AND is_verified = TRUE AND expires_at > %s''',
+                     (email, otp, datetime.now()))
+        return self._row(cursor) is not None
+
+    def consume(self, cursor, email, otp):
+        """Remove a used OTP"""
+        cursor.execute('DELETE FROM otp_verifications WHERE email = %s AND otp_code = %s', (email, otp))
+
+    def sweep(self, cursor, batch_size=1000):
+        """Delete one batch of expired OTPs via idx_otp_expires; returns rows removed"""
+        cursor.execute('DELETE FROM otp_verifications WHERE expires_at < %s LIMIT %s',
+                     (datetime.now(), batch_size))
+        return cursor.rowcount
+
+    @staticmethod
+    def _row(cursor):
+        row = cursor.fetchone()
+        if row is None or isinstance(row, dict):
+            return row
+        return dict(zip([column[0] for column in cursor.description], row))
+
+    @classmethod
+    def _scalar(cls, cursor):
+        row = cls._row(cursor)
+        return list(row.values())[0]
+
+
+class MemoryOTPStore:
+    """In-process OTP store with TTL expiry, for single-node deployments.
+
+    Only correct when one process serves every request (WEB_CONCURRENCY=1);
+    with several gunicorn workers a code issued by one is invisible to the
+    others. The ``cursor`` arguments exist to match MySQLOTPStore and are ignored.
+    """
+
+    def __init__(self, max_attempts=5, send_limit=5, send_window=timedelta(minutes=15), sweep_interval=60):
+        self.max_attempts = max_attempts
+        self.send_limit = send_limit
+        self.send_window = send_window
+        self.sweep_interval = sweep_interval
+        self._records = {}
+        self._sends = {}
+        self._lock = threading.Lock()
+        self._sweeper = None
+
+    def issue(self, cursor, email, mobile, otp_type, otp, expires_at):
+        key = identity_of(email, mobile)
+        now = datetime.now()
+        with self._lock:
+            self._start_sweeper()
+            sends = {identity: [sent for sent in self._sends.get(identity, []) if sent >= now - self.send_window]
+                     for identity in send_identities(email, mobile)}
+            if any(len(sent) >= self.send_limit for sent in sends.values()):
+                raise OTPError('Too many OTP requests. Please try again later.')
+            for identity, sent in sends.items():
+                self._sends[identity] = sent + [now]
+            self._records.setdefault(key, []).append({
+                'email': email, 'mobile': mobile, 'otp_code': otp, 'otp_type': otp_type,
+                'expires_at': expires_at, 'is_verified': False, 'attempts': 0,
+            })
+
+    def verify(self, cursor, email, mobile, otp):
+        key = identity_of(email, mobile)
+        now = datetime.now()
+        with self._lock:
+            live = [record for record in self._records.get(key, [])
+                    if not record['is_verified'] and record['expires_at'] > now]
+            matches = [record for record in live
+                       if record['otp_code'] == otp and (not (email and mobile) or record['mobile'] == mobile)]
+            if matches and matches[-1]['attempts'] < self.max_attempts:
+                matches[-1]['is_verified'] = True
+                return True
+            for record in live:
+                record['attempts'] += 1
+        if matches:
+            raise OTPError('Too many incorrect attempts. Please request a new OTP.')
+        return False
+
+    def is_verified(self, cursor, email, otp):
+        now = datetime.now()
+        with self._lock:
+            return any(record['otp_code'] == otp and record['is_verified'] and record['expires_at'] > now
+                       for record in self._records.get(('email', email), []))
+
+    def consume(self, cursor, email, otp):
+        with self._lock:
+            key = ('email', email)
+            self._records[key] = [record for record in self._records.get(key, []) if record['otp_code'] != otp]
+
+    def sweep(self, cursor=None, batch_size=None):
+        """Drop expired codes and stale send timestamps; returns codes removed"""
+        now = datetime.now()
+        removed = 0
+        with self._lock:
+            for key in list(self._records):
+                live = [record for record in self._records[key] if record['expires_at'] > now]
+                removed += len(self._records[key]) - len(live)
+                if live:
+                    self._records[key] = live
+                else:
+                    del self._records[key]
+            for key in list(self._sends):
+                sends = [sent for sent in self._sends[key] if sent >= now - self.send_window]
+                if sends:
+                    self._sends[key] = sends
+                else:
+                    del self._sends[key]
+        return removed
+
+    def _start_sweeper(self):
+        if self._sweeper is None:
+            self._sweeper = threading.Thread(target=self._sweep_forever, name='otp-sweeper', daemon=True)
+            self._sweeper.start()
+
+    def _sweep_forever(self):
+        while True:
+            time.sleep(self.sweep_interval)
+            self.sweep()
@@ -0,0 +1,195 @@
+import os
+import threading
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+
+
+class ConsoleTransport:
+    """Development transport that prints messages instead of sending them"""
+
+    def __init__(self, label='Console'):
+        self.label = label
+
+    def send_batch(self, messages):
+        for message in messages:
+            print(f"Development Mode - {self.label} to {message['recipient']}: {message['subject'] or ''} {message['body']}")
+        return {message['id']: None for message in messages}
+
+
+class FlaskMailTransport:
+    """Send email through Flask-Mail, reusing one SMTP connection per batch.
+
+    Point MAIL_SERVER/MAIL_PORT at a local SMTP stand-in (for example
+    ``python -m aiosmtpd -n -l localhost:1025``) to test without Gmail.
+    """
+
+    def __init__(self, mail, sender):
+        self.mail = mail
+        self.sender = sender
+
+    def send_batch(self, messages):
+        from flask_mail import Message
+
+        results = {}
+        with self.mail.connect() as connection:
+            for message in messages:
+                try:
+                    msg = Message(message['subject'], sender=self.sender, recipients=[message['recipient']])
+                    msg.html = message['body']
+                    connection.send(msg)
+                    results[message['id']] = None
+                except Exception as e:
+                    results[message['id']] = str(e)
+        return results
+
+
+class TwilioTransport:
+    """Send SMS through the Twilio REST API, sharing one client across a batch"""
+
+    def __init__(self, account_sid, auth_token, from_number):
+        from twilio.rest import Client
+
+        self.client = Client(account_sid, auth_token)
+        self.from_number = from_number
+
+    def send_batch(self, messages):
+        results = {}
+        for message in messages:
+            try:
+                self.client.messages.create(body=message['body'], from_=self.from_number, to=message['recipient'])
+                results[message['id']] = None
+            except Exception as e:
+                results[message['id']] = str(e)
+        return results
+
+
+class Outbox:
+    """Persistent outbound message queue backed by the outbound_messages table.
+
+    Requests call ``enqueue`` on their own cursor and return immediately; worker
+    threads (or the ``flask outbox-worker`` process) claim due messages in
+    batches, hand them to the transport for their channel, and retry failures
+    with exponential backoff. ``dict_cursor`` is the connection's cursor class
+    returning rows as dicts. ``context`` (e.g. ``app.app_context``) wraps each
+    worker for transports that need the Flask application context.
+    """
+
+    def __init__(self, connect, transports, dict_cursor, context=None, batch_size=20, max_attempts=5,
+                 backoff_seconds=30, claim_timeout=300, poll_interval=5):
+        self.connect = connect
+        self.transports = transports
+        self.dict_cursor = dict_cursor
+        self.context = context or nullcontext
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self.claim_timeout = claim_timeout
+        self.poll_interval = poll_interval
+        self._wakeup = threading.Event()
+        self._lock = threading.Lock()
+        self._pid = None
+
+    def enqueue(self, cursor, channel, recipient, body, subject=None):
+        """Queue a message on the caller's cursor; it is sent once the caller commits"""
+        cursor.execute('''INSERT INTO outbound_messages
+                        (channel, recipient, subject, body, next_attempt_at, created_at)
+                        VALUES (%s, %s, %s, %s, %s, %s)''',
+                     (channel, recipient, subject, body, datetime.now(), datetime.now()))
+
+    def notify(self):
+        """Wake a worker after the enqueuing transaction has committed"""
+        self._wakeup.set()
+
+    def start(self, workers):
+        """Start worker threads in this process (once per process, safe after fork)"""
+        with self._lock:
+            if workers <= 0 or self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._wakeup = threading.Event()
+            for i in range(workers):
+                thread = threading.Thread(target=self.run_forever, name=f'outbox-worker-{i}', daemon=True)
+                thread.start()
+
+    def run_forever(self):
+        with self.context():
+            self._work()
+
+    def _work(self):
+        connection = None
+        while True:
+            try:
+                if connection is None:
+                    connection = self.connect()
+                while self.process_batch(connection):
+                    pass
+            except Exception as e:
+                print(f"Outbox error: {str(e)}")
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+                connection = None
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+
+    def claim_batch(self, connection):
+        """Lock and mark up to batch_size due messages as sending.
+
+        A claim expires after claim_timeout seconds, so messages held by a
+        worker that died are picked up again.
+        """
+        now = datetime.now()
+        cursor = connection.cursor(self.dict_cursor)
+        cursor.execute('''SELECT * FROM outbound_messages
+                        WHERE status IN ('pending', 'sending') AND next_attempt_at <= %s
+                        ORDER BY next_attempt_at LIMIT %s
+                        FOR UPDATE SKIP LOCKED''', (now, self.batch_size))
+        messages = cursor.fetchall()
+        if messages:
+            ids = [message['id'] for message in messages]
+            placeholders = ', '.join(['%s'] * len(ids))
+            cursor.execute(f'''UPDATE outbound_messages
+                             SET status = 'sending', attempts = attempts + 1, next_attempt_at = %s
+                             WHERE id IN ({placeholders})''',
+                         [now + timedelta(seconds=self.claim_timeout)] + ids)
+        connection.commit()
+        cursor.close()
+        return messages
+
+    def process_batch(self, connection):
+        """Deliver one claimed batch; returns False when nothing was due"""
+        messages = self.claim_batch(connection)
+        if not messages:
+            return False
+
+        results = {}
+        for channel in {message['channel'] for message in messages}:
+            batch = [message for message in messages if message['channel'] == channel]
+            transport = self.transports.get(channel)
+            try:
+                if transport is None:
+                    raise RuntimeError(f'No transport configured for {channel}')
+                results.update(transport.send_batch(batch))
+            except Exception as e:
+                results.update({message['id']: str(e) for message in batch})
+
+        now = datetime.now()
+        cursor = connection.cursor()
+        for message in messages:
+            error = results.get(message['id'], 'No delivery result')
+            attempts = message['attempts'] + 1
+            if error is None:
+                cursor.execute('''UPDATE outbound_messages SET status = 'sent', sent_at = %s, last_error = NULL
+                                WHERE id = %s''', (now, message['id']))
+            elif attempts >= self.max_attempts:
+                cursor.execute('''UPDATE outbound_messages SET status = 'failed', last_error = %s
+                                WHERE id = %s''', (error, message['id']))
+            else:
+                retry_at = now + timedelta(seconds=self.backoff_seconds * 2 ** (attempts - 1))
+                cursor.execute('''UPDATE outbound_messages SET status = 'pending', next_attempt_at = %s, last_error = %s
+                                WHERE id = %s''', (retry_at, error, message['id']))
+        connection.commit()
+        cursor.close()
+        return True
@@ -0,0 +1,145 @@
+import re
+
+# Common spellings folded onto the names used in the skills table
+SKILL_ALIASES = {
+    'js': 'JavaScript',
+    'javascript': 'JavaScript',
+    'py': 'Python',
+    'python3': 'Python',
+    'golang': 'Go',
+    'reactjs': 'React',
+    'react.js': 'React',
+    'nodejs': 'Node.js',
+    'node': 'Node.js',
+    'vue': 'Vue.js',
+    'vuejs': 'Vue.js',
+    'angularjs': 'Angular',
+    'html': 'HTML/CSS',
+    'css': 'HTML/CSS',
+    'postgres': 'PostgreSQL',
+    'mongo': 'MongoDB',
+    'mssql': 'SQL Server',
+    'k8s': 'Kubernetes',
+    'amazon web services': 'AWS',
+    'ml': 'Machine Learning',
+    'ui/ux': 'UI/UX Design',
+    'ux': 'UI/UX Design',
+    'cpp': 'C++',
+    'csharp': 'C#',
+}
+
+SKILL_NAME_MAX_LENGTH = 100
+
+
+def parse_skills(text):
+    """Split a free-text skills field into distinct, canonical skill names.
+
+    Entries are separated by commas, semicolons, pipes or new lines. Known
+    aliases map to their canonical name; other entries keep their spelling
+    with whitespace collapsed. Duplicates are dropped case-insensitively.
+    """
+    names = []
+    seen = set()
+    for entry in re.split(r'[,;|\n]+', text or ''):
+        name = ' '.join(entry.split())[:SKILL_NAME_MAX_LENGTH]
+        if not name:
+            continue
+        name = SKILL_ALIASES.get(name.lower(), name)
+        if name.lower() not in seen:
+            seen.add(name.lower())
+            names.append(name)
+    return names
+
+
+def skill_id_map(cursor, names):
+    """{lowercased name: skill id} for ``names``, adding unknown skills without a category"""
+    if not names:
+        return {}
+    placeholders = ', '.join(['%s'] * len(names))
+    cursor.executemany('INSERT IGNORE INTO skills (skill_name) VALUES (%s)', [(name,) for name in names])
+    cursor.execute(f'SELECT id, skill_name FROM skills WHERE skill_name IN ({placeholders})', names)
+    return {_row(row)[1].lower(): _row(row)[0] for row in cursor.fetchall()}
+
+
+def resolve_skill_ids(cursor, names):
+    """Skill ids for ``names``, adding unknown skills to the skills table without a category"""
+    return list(skill_id_map(cursor, names).values())
+
+
+def _sync_skills(cursor, table, key_column, key, text):
+    skill_ids = resolve_skill_ids(cursor, parse_skills(text))
+    if not skill_ids:
+        cursor.execute(f'DELETE FROM {table} WHERE {key_column} = %s', (key,))
+        return skill_ids
+
+    placeholders = ', '.join(['%s'] * len(skill_ids))
+    cursor.execute(f'DELETE FROM {table} WHERE {key_column} = %s AND skill_id NOT IN ({placeholders})',
+                   [key] + skill_ids)
+    cursor.executemany(f'INSERT IGNORE INTO {table} ({key_column}, skill_id) VALUES (%s, %s)',
+                       [(key, skill_id) for skill_id in skill_ids])
+    return skill_ids
+
+
+def sync_user_skills(cursor, user_id, text):
+    """Replace a user's user_skills rows with the skills parsed from ``text``.
+
+    Runs on the caller's cursor so it commits with the profile it belongs to.
+    Returns the skill ids.
+    """
+    return _sync_skills(cursor, 'user_skills', 'user_id', user_id, text)
+
+
+def sync_user_skills_bulk(cursor, skills_by_user):
+    """Replace user_skills for many users at once from {user_id: skills text}.
+
+    Uses a fixed number of statements however many users are given, for
+    bulk imports.
+    """
+    names_by_user = {user_id: parse_skills(text) for user_id, text in skills_by_user.items()}
+    names = list({name.lower(): name for user_names in names_by_user.values() for name in user_names}.values())
+    skill_ids = skill_id_map(cursor, names)
+
+    user_ids = list(names_by_user)
+    if not user_ids:
+        return
+    placeholders = ', '.join(['%s'] * len(user_ids))
+    cursor.execute(f'DELETE FROM user_skills WHERE user_id IN ({placeholders})', user_ids)
+    pairs = {(user_id, skill_ids[name.lower()]) for user_id, user_names in names_by_user.items()
+             for name in user_names if name.lower() in skill_ids}
+    if pairs:
+        cursor.executemany('INSERT IGNORE INTO user_skills (user_id, skill_id) VALUES (%s, %s)', sorted(pairs))
+
+
+def sync_job_skills(cursor, job_id, text):
+    """Replace a job's job_skills rows with the skills parsed from ``text``"""
+    return _sync_skills(cursor, 'job_skills', 'job_id', job_id, text)
+
+
+def skill_filter(names=None, category=None):
+    """SQL predicate on ``pp.user_id`` for profiles with all ``names`` and any skill in ``category``.
+
+    Each part is a semi-join over the (skill_id, user_id) index on user_skills,
+    so a multi-skill filter intersects the per-skill user lists in the index
+    rather than scanning profile text. Returns (sql, params).
+    """
+    clauses = []
+    params = []
+    if names:
+        placeholders = ', '.join(['%s'] * len(names))
+        clauses.append(f'''pp.user_id IN (SELECT us.user_id FROM skills s
+                          JOIN user_skills us ON us.skill_id = s.id
+                          WHERE s.skill_name IN ({placeholders})
+                          GROUP BY us.user_id HAVING COUNT(*) = %s)''')
+        params.extend(names)
+        params.append(len(names))
+    if category:
+        clauses.append('''pp.user_id IN (SELECT us.user_id FROM skill_categories sc
+                          JOIN skills s ON s.category_id = sc.id
+                          JOIN user_skills us ON us.skill_id = s.id
+                          WHERE sc.category_name = %s)''')
+        params.append(category)
+    return ' AND '.join(clauses), params
+
+
+def _row(row):
+    return list(row.values()) if isinstance(row, dict) else row
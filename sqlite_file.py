@@ -0,0 +1,29 @@
+import os
+import sqlite3
+import threading
+
+
+class SQLiteFile:
+    """Autocommit connections to one local SQLite file in WAL mode, one per thread.
+
+    Used for the small files the gunicorn workers on a host share (events,
+    caches, data versions, the audit spill). A connection is opened on a
+    thread's first use and reopened in a forked child, since sqlite3
+    connections must not cross a fork. ``schema`` runs once on creation.
+    """
+
+    def __init__(self, path, schema=None, timeout=5):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        if schema:
+            self.connection().executescript(schema)
+
+    def connection(self):
+        """This thread's connection; statements commit on their own unless wrapped in BEGIN ... COMMIT"""
+        pid = os.getpid()
+        if getattr(self._local, 'pid', None) != pid:
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            self._local.connection, self._local.pid = connection, pid
+        return self._local.connection
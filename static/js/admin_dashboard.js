@@ -5,17 +5,98 @@ let currentUsersPage = 1;
 let currentProfilesPage = 1;
 let currentFeedbackPage = 1;
 
+// Sections delivered by /api/admin-bootstrap, shown on the first visit to their tab
+let bootstrapData = {};
+
 // Initialize dashboard
 document.addEventListener('DOMContentLoaded', function() {
-    // Load initial data
-    loadAdminStats();
-    loadUsers();
     setupTabNavigation();
     
-    // Check admin session
-    checkAdminSession();
+    // Session, stats and the first page of every tab in one request
+    bootstrapDashboard();
 });
 
+async function bootstrapDashboard() {
+    try {
+        const response = await fetch('/api/admin-bootstrap');
+        const result = await response.json();
+        
+        if (!result.success) {
+            window.location.href = '/admin/login';
+            return;
+        }
+        
+        const data = result.data;
+        document.getElementById('adminWelcome').textContent = `Welcome, ${data.admin.full_name} (${data.admin.role})`;
+        displayAdminStats(data.stats);
+        displayUsers(data.users.users, data.users.pagination);
+        bootstrapData = data;
+        
+        subscribeToEvents();
+    } catch (error) {
+        console.error('Dashboard bootstrap failed:', error);
+        window.location.href = '/admin/login';
+    }
+}
+
+// Live updates: apply server-sent deltas instead of re-fetching the stats
+function subscribeToEvents() {
+    if (!window.EventSource) {
+        return;
+    }
+    
+    const source = new EventSource('/api/admin-events');
+    
+    source.addEventListener('registration', () => {
+        incrementStat('totalUsers');
+        incrementStat('todayRegistrations');
+    });
+    source.addEventListener('profile_created', () => incrementStat('totalProfiles'));
+    source.addEventListener('feedback', () => incrementStat('totalFeedback'));
+    source.addEventListener('profiles_imported', event => {
+        const data = JSON.parse(event.data);
+        incrementStat('totalProfiles', data.created);
+        incrementStat('totalUsers', data.users_created);
+        incrementStat('todayRegistrations', data.users_created);
+    });
+    source.addEventListener('user_status', event => {
+        const data = JSON.parse(event.data);
+        updateUserRowStatus(data.user_id, data.status);
+    });
+    source.addEventListener('users_status', event => {
+        const data = JSON.parse(event.data);
+        data.user_ids.forEach(userId => updateUserRowStatus(userId, data.status));
+    });
+}
+
+function incrementStat(elementId, amount = 1) {
+    const element = document.getElementById(elementId);
+    const value = parseInt(element.textContent, 10);
+    if (!isNaN(value)) {
+        element.textContent = value + amount;
+    }
+}
+
+function updateUserRowStatus(userId, status) {
+    const row = document.querySelector(`#usersTable tr[data-user-id="${userId}"]`);
+    if (!row) {
+        return;
+    }
+    const badge = row.querySelector('.status-badge');
+    badge.className = `status-badge status-${status}`;
+    badge.textContent = status;
+    const button = row.querySelector('.btn-warning');
+    button.textContent = status === 'active' ? 'Suspend' : 'Activate';
+    button.setAttribute('onclick', `toggleUserStatus(${userId}, '${status}')`);
+}
+
+// Use the bootstrap payload once for a tab's first page, then fetch as usual
+function takeBootstrapSection(section) {
+    const data = bootstrapData[section];
+    delete bootstrapData[section];
+    return data;
+}
+
 // Tab Navigation
 function setupTabNavigation() {
     const tabButtons = document.querySelectorAll('.tab-btn');
@@ -38,15 +119,34 @@ function setupTabNavigation() {
                 case 'users':
                     loadUsers();
                     break;
-                case 'profiles':
-                    loadProfiles();
+                case 'profiles': {
+                    const profiles = takeBootstrapSection('profiles');
+                    if (profiles) {
+                        displayProfiles(profiles.profiles, profiles.pagination);
+                        populateProfessionFilter(profiles.professions);
+                    } else {
+                        loadProfiles();
+                    }
                     break;
-                case 'feedback':
-                    loadFeedback();
+                }
+                case 'feedback': {
+                    const feedback = takeBootstrapSection('feedback');
+                    if (feedback) {
+                        displayFeedback(feedback.feedback, feedback.pagination);
+                    } else {
+                        loadFeedback();
+                    }
                     break;
-                case 'analytics':
-                    loadAdminAnalytics();
+                }
+                case 'analytics': {
+                    const analytics = takeBootstrapSection('analytics');
+                    if (analytics) {
+                        displayAnalytics(analytics);
+                    } else {
+                        loadAdminAnalytics();
+                    }
                     break;
+                }
                 case 'export':
                     // Export tab doesn't need data loading
                     break;
@@ -79,16 +179,20 @@ async function loadAdminStats() {
         const result = await response.json();
         
         if (result.success) {
-            document.getElementById('totalUsers').textContent = result.data.total_users;
-            document.getElementById('totalProfiles').textContent = result.data.total_profiles;
-            document.getElementById('todayRegistrations').textContent = result.data.today_registrations;
-            document.getElementById('totalFeedback').textContent = result.data.total_feedback;
+            displayAdminStats(result.data);
         }
     } catch (error) {
         console.error('Failed to load admin stats:', error);
     }
 }
 
+function displayAdminStats(stats) {
+    document.getElementById('totalUsers').textContent = stats.total_users;
+    document.getElementById('totalProfiles').textContent = stats.total_profiles;
+    document.getElementById('todayRegistrations').textContent = stats.today_registrations;
+    document.getElementById('totalFeedback').textContent = stats.total_feedback;
+}
+
 // Load users data
 async function loadUsers(page = 1, search = '', filter = '') {
     const container = document.getElementById('usersTable');
@@ -127,6 +231,7 @@ function displayUsers(users, pagination) {
         <table class="data-table">
             <thead>
                 <tr>
+                    <th><input type="checkbox" id="selectAllUsers" onchange="toggleAllUsers(this.checked)"></th>
                     <th>ID</th>
                     <th>Username</th>
                     <th>Email</th>
@@ -143,7 +248,8 @@ function displayUsers(users, pagination) {
     
     users.forEach(user => {
         html += `
-            <tr>
+            <tr data-user-id="${user.id}">
+                <td><input type="checkbox" class="user-select" value="${user.id}"></td>
                 <td>${user.id}</td>
                 <td>${user.username}</td>
                 <td>${user.email}</td>
@@ -498,6 +604,63 @@ async function updateUserStatus(userId, status) {
     }
 }
 
+function toggleAllUsers(checked) {
+    document.querySelectorAll('#usersTable .user-select').forEach(box => {
+        box.checked = checked;
+    });
+}
+
+// Bulk status change for the checked rows, or for every user matching the current search/filter
+function bulkUpdateUserStatus(status) {
+    const userIds = Array.from(document.querySelectorAll('#usersTable .user-select:checked'))
+        .map(box => parseInt(box.value, 10));
+    const action = status === 'active' ? 'activate' : 'suspend';
+    let payload;
+    
+    if (userIds.length > 0) {
+        if (!confirm(`Are you sure you want to ${action} ${userIds.length} selected users?`)) {
+            return;
+        }
+        payload = { status: status, user_ids: userIds };
+    } else {
+        const search = document.getElementById('userSearch').value.trim();
+        const filter = document.getElementById('userFilter').value;
+        if (!search && !filter) {
+            showMessage('Select users, or search or filter the list first.', 'error');
+            return;
+        }
+        if (!confirm(`No users selected. ${action[0].toUpperCase() + action.slice(1)} every user matching the current search and filter?`)) {
+            return;
+        }
+        payload = { status: status, search: search, filter: filter };
+    }
+    
+    sendBulkUserStatus(payload);
+}
+
+async function sendBulkUserStatus(payload) {
+    try {
+        const response = await fetch('/api/admin-bulk-user-status', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify(payload)
+        });
+        
+        const result = await response.json();
+        
+        if (result.success) {
+            showMessage(result.message, 'success');
+            loadUsers(); // Reload users
+        } else {
+            showMessage(result.message, 'error');
+        }
+    } catch (error) {
+        showMessage('Failed to update user status.', 'error');
+    }
+}
+
 function viewProfileDetails(profileId) {
     alert(`View profile details for ID: ${profileId}`);
 }
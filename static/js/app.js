@@ -267,25 +267,32 @@ async function handleProfileSubmit(event) {
 }
 
 // Search Functions
+let searchNextCursor = null;
+let searchParams = null;
+
 async function handleSearch() {
     const profession = document.getElementById('searchProfession').value;
     const location = document.getElementById('searchLocation').value;
     const education = document.getElementById('searchEducation').value;
     const experience = document.getElementById('searchExperience').value;
+    const skills = document.getElementById('searchSkills').value;
     
     const params = new URLSearchParams();
     if (profession) params.append('profession', profession);
     if (location) params.append('location', location);
     if (education) params.append('education', education);
     if (experience) params.append('experience', experience);
+    if (skills) params.append('skills', skills);
     
     const resultsContainer = document.getElementById('searchResults');
     showLoading(resultsContainer);
+    searchParams = params;
     
     try {
         const result = await apiRequest(`/api/search?${params.toString()}`);
         
         if (result.success) {
+            searchNextCursor = result.pagination ? result.pagination.next_cursor : null;
             displaySearchResults(result.data);
         } else {
             showMessage(result.message, 'error');
@@ -297,15 +304,38 @@ async function handleSearch() {
     }
 }
 
-function displaySearchResults(results) {
+async function loadMoreSearchResults() {
+    if (!searchNextCursor || !searchParams) return;
+    
+    const params = new URLSearchParams(searchParams);
+    params.set('cursor', searchNextCursor);
+    
+    try {
+        const result = await apiRequest(`/api/search?${params.toString()}`);
+        
+        if (result.success) {
+            searchNextCursor = result.pagination.next_cursor;
+            displaySearchResults(result.data, true);
+        } else {
+            showMessage(result.message, 'error');
+        }
+    } catch (error) {
+        showMessage('Search failed. Please try again.', 'error');
+    }
+}
+
+function displaySearchResults(results, append = false) {
     const resultsContainer = document.getElementById('searchResults');
     
-    if (results.length === 0) {
+    const loadMoreButton = document.getElementById('loadMoreResults');
+    if (loadMoreButton) loadMoreButton.remove();
+    
+    if (results.length === 0 && !append) {
         resultsContainer.innerHTML = '<p class="text-center">No professionals found matching your criteria.</p>';
         return;
     }
     
-    resultsContainer.innerHTML = results.map(person => `
+    const html = results.map(person => `
         <div class="result-card">
             <div class="result-header">
                 <div>
@@ -331,6 +361,20 @@ function displaySearchResults(results) {
             </div>
         </div>
     `).join('');
+    
+    if (append) {
+        resultsContainer.insertAdjacentHTML('beforeend', html);
+    } else {
+        resultsContainer.innerHTML = html;
+    }
+    
+    if (searchNextCursor) {
+        resultsContainer.insertAdjacentHTML('beforeend', `
+            <div class="text-center mt-2" id="loadMoreResults">
+                <button class="btn btn-secondary" onclick="loadMoreSearchResults()">Load More</button>
+            </div>
+        `);
+    }
 }
 
 function getBadgeClass(availability) {
@@ -459,7 +503,38 @@ function validateForm(formElement) {
 }
 
 // Event Listeners
+// Autocomplete for inputs marked data-suggest="profession|location|education"
+function setupSuggest(input) {
+    const datalist = document.createElement('datalist');
+    datalist.id = `${input.id}Suggestions`;
+    input.after(datalist);
+    input.setAttribute('list', datalist.id);
+    input.setAttribute('autocomplete', 'off');
+    
+    let timer = null;
+    input.addEventListener('input', () => {
+        clearTimeout(timer);
+        const query = input.value.trim();
+        if (query.length < 2) return;
+        
+        timer = setTimeout(async () => {
+            const params = new URLSearchParams({ field: input.dataset.suggest, q: query });
+            const result = await apiRequest(`/api/suggest?${params.toString()}`);
+            if (!result.success) return;
+            
+            datalist.innerHTML = '';
+            result.data.forEach(item => {
+                const option = document.createElement('option');
+                option.value = item.value;
+                datalist.appendChild(option);
+            });
+        }, 150);
+    });
+}
+
 document.addEventListener('DOMContentLoaded', function() {
+    document.querySelectorAll('[data-suggest]').forEach(setupSuggest);
+    
     // Login form
     const loginForm = document.getElementById('loginForm');
     if (loginForm) {
@@ -531,6 +606,7 @@ document.addEventListener('DOMContentLoaded', function() {
             document.getElementById('searchLocation').value = '';
             document.getElementById('searchEducation').value = '';
             document.getElementById('searchExperience').value = '';
+            document.getElementById('searchSkills').value = '';
             document.getElementById('searchResults').innerHTML = '<p class="text-center">Enter search criteria above to find professionals.</p>';
         });
     }
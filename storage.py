@@ -0,0 +1,258 @@
+import functools
+import os
+import re
+import sqlite3
+import threading
+from datetime import date, datetime
+
+try:
+    import MySQLdb
+    import MySQLdb.cursors
+except ImportError:
+    MySQLdb = None
+
+SQLITE_SCHEMA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'database', 'schema_sqlite.sql')
+
+
+class MySQLBackend:
+    """MySQL through mysqlclient; the production backend.
+
+    A backend opens connections, names the cursor classes the app asks for
+    (rows as dicts, rows as tuples, rows streamed from the server) and
+    supplies the few SQL fragments the two dialects cannot share.
+    """
+
+    name = 'mysql'
+
+    def __init__(self, host, user, password, database, port=3306):
+        if MySQLdb is None:
+            raise RuntimeError('The MySQL backend needs mysqlclient (pip install mysqlclient)')
+        self.host = host
+        self.user = user
+        self.password = password
+        self.database = database
+        self.port = port
+        self.dict_cursor = MySQLdb.cursors.DictCursor
+        self.tuple_cursor = MySQLdb.cursors.Cursor
+        self.stream_cursor = MySQLdb.cursors.SSDictCursor
+
+    def connect(self, host=None, port=None):
+        """New connection to the primary, or to the replica at ``host``/``port``"""
+        return MySQLdb.connect(host=host or self.host, user=self.user, passwd=self.password,
+                               db=self.database, port=port or self.port)
+
+    def text_match(self, table, columns, words):
+        """(where SQL, relevance SQL, params) for rows whose ``columns`` contain every word as a prefix.
+
+        Both SQL strings take ``params`` and are served by the FULLTEXT index
+        on exactly ``columns``.
+        """
+        match_sql = f"MATCH({', '.join(columns)}) AGAINST (%s IN BOOLEAN MODE)"
+        return match_sql, match_sql, [' '.join(f'+{word}*' for word in words)]
+
+    def hour_bucket(self, column):
+        return f"DATE_FORMAT({column}, '%Y-%m-%d %H:00:00')"
+
+    def day_bucket(self, column):
+        return f'DATE({column})'
+
+
+class SQLiteBackend:
+    """Embedded SQLite database file in WAL mode, for development, tests, benchmarks and small installs.
+
+    The schema (database/schema_sqlite.sql) mirrors database/schema.sql:
+    CHECK constraints stand in for ENUMs, NOCASE collation for MySQL's
+    case-insensitive comparisons, triggers for ON UPDATE CURRENT_TIMESTAMP
+    and an FTS5 table for the FULLTEXT indexes. It is created on the first
+    connection to an empty file. Statements are written for MySQL and
+    translated by the cursor (see ``translate``).
+    """
+
+    name = 'sqlite'
+
+    def __init__(self, path, timeout=30):
+        if sqlite3.sqlite_version_info < (3, 35):
+            raise RuntimeError(f'The SQLite backend needs SQLite 3.35 or newer, not {sqlite3.sqlite_version}')
+        self.path = path
+        self.timeout = timeout
+        self.dict_cursor = SQLiteDictCursor
+        self.tuple_cursor = SQLiteCursor
+        self.stream_cursor = SQLiteDictCursor
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def connect(self, host=None, port=None):
+        """New connection to the database file (``host`` and ``port`` only apply to MySQL)"""
+        raw = sqlite3.connect(self.path, timeout=self.timeout, detect_types=sqlite3.PARSE_DECLTYPES,
+                              check_same_thread=False)
+        raw.execute('PRAGMA journal_mode=WAL')
+        raw.execute('PRAGMA synchronous=NORMAL')
+        raw.execute('PRAGMA foreign_keys=ON')
+        # Scratch table whose only row has a rowid no real table hands out; see SQLiteCursor.execute
+        raw.execute('CREATE TEMP TABLE upsert_probe (id INTEGER PRIMARY KEY)')
+        if not self._schema_ready:
+            self._create_schema(raw)
+        return SQLiteConnection(raw)
+
+    def _create_schema(self, raw):
+        with self._schema_lock:
+            if self._schema_ready:
+                return
+            if raw.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'users'").fetchone() is None:
+                with open(SQLITE_SCHEMA) as f:
+                    raw.executescript(f.read())
+            self._schema_ready = True
+
+    def text_match(self, table, columns, words):
+        """(where SQL, relevance SQL, params) for rows whose ``columns`` contain every word as a prefix.
+
+        Both SQL strings take ``params`` and are served by the ``<table>_fts``
+        FTS5 table, whose rowid is the table's id; relevance is negated BM25.
+        """
+        alias, _, _ = columns[0].rpartition('.')
+        row_id = f'{alias}.id' if alias else 'id'
+        names = ' '.join(column.rpartition('.')[2] for column in columns)
+        prefixes = ' AND '.join('"%s"*' % word for word in words)
+        fts = f'{table}_fts'
+        return (f'{row_id} IN (SELECT rowid FROM {fts} WHERE {fts} MATCH %s)',
+                f'COALESCE((SELECT -bm25({fts}) FROM {fts} WHERE {fts} MATCH %s AND rowid = {row_id}), 0)',
+                [f'{{{names}}} : ({prefixes})'])
+
+    def hour_bucket(self, column):
+        return f"strftime('%Y-%m-%d %H:00:00', {column})"
+
+    def day_bucket(self, column):
+        return f"strftime('%Y-%m-%d 00:00:00', {column})"
+
+
+class SQLiteConnection:
+    """DB-API connection wrapper handing out MySQLdb-style cursors"""
+
+    def __init__(self, raw):
+        self.raw = raw
+
+    def cursor(self, cursor_class=None):
+        return (cursor_class or SQLiteCursor)(self)
+
+    def commit(self):
+        self.raw.commit()
+
+    def rollback(self):
+        self.raw.rollback()
+
+    def ping(self):
+        self.raw.execute('SELECT 1')
+
+    def close(self):
+        self.raw.close()
+
+
+PLACEHOLDER = re.compile(r'%([s%])')
+# Rowid SQLite never assigns itself; the app never sets one explicitly
+UPSERT_PROBE_ID = -1
+INSERT_IGNORE = re.compile(r'^\s*INSERT\s+IGNORE\b', re.I)
+ON_DUPLICATE = re.compile(r'\bON\s+DUPLICATE\s+KEY\s+UPDATE\b', re.I)
+INSERTED_VALUE = re.compile(r'\bVALUES\((\w+)\)', re.I)
+FOR_UPDATE = re.compile(r'\s+FOR\s+UPDATE(\s+SKIP\s+LOCKED)?\s*$', re.I)
+DELETE_LIMIT = re.compile(r'^\s*DELETE\s+FROM\s+(\w+)\s+WHERE\s+(.+?)\s+LIMIT\s+(\S+)\s*$', re.I | re.S)
+
+
+@functools.lru_cache(maxsize=1024)
+def translate(query, has_args):
+    """Rewrite one MySQL statement for SQLite; returns (sql, locks, upsert).
+
+    Only rewrites with an exact SQLite equivalent are made: ``%s``
+    placeholders (when there are arguments, as MySQLdb only interpolates
+    then), INSERT IGNORE, ON DUPLICATE KEY UPDATE with VALUES(col), DELETE
+    ... LIMIT, and FOR UPDATE [SKIP LOCKED], which becomes a write
+    transaction started before the SELECT (``locks``).
+    """
+    if has_args:
+        query = PLACEHOLDER.sub(lambda match: '?' if match.group(1) == 's' else '%', query)
+    query = INSERT_IGNORE.sub('INSERT OR IGNORE', query)
+    upsert = ON_DUPLICATE.search(query)
+    if upsert:
+        head, tail = query[:upsert.start()], query[upsert.end():]
+        query = head + 'ON CONFLICT DO UPDATE SET' + INSERTED_VALUE.sub(r'excluded.\1', tail)
+    delete = DELETE_LIMIT.match(query)
+    if delete:
+        table, where, limit = delete.groups()
+        query = f'DELETE FROM {table} WHERE rowid IN (SELECT rowid FROM {table} WHERE {where} LIMIT {limit})'
+    locks = FOR_UPDATE.search(query) is not None
+    if locks:
+        query = FOR_UPDATE.sub('', query)
+    return query, locks, bool(upsert)
+
+
+class SQLiteCursor:
+    """MySQLdb-style cursor over sqlite3: MySQL statements, tuple rows"""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self._cursor = connection.raw.cursor()
+        self.rowcount = -1
+
+    def execute(self, query, args=None):
+        sql, locks, upsert = translate(query, args is not None)
+        raw = self.connection.raw
+        if locks and not raw.in_transaction:
+            # SQLite locks the whole database for writing; take that lock before reading
+            raw.execute('BEGIN IMMEDIATE')
+        if upsert:
+            # Set last_insert_rowid() to UPSERT_PROBE_ID; only an actual insert moves it
+            raw.execute('INSERT OR REPLACE INTO temp.upsert_probe (id) VALUES (?)', (UPSERT_PROBE_ID,))
+        self._cursor.execute(sql, args or ())
+        self.rowcount = self._cursor.rowcount
+        if upsert and self.rowcount == 1 and self._cursor.lastrowid == UPSERT_PROBE_ID:
+            # MySQL reports 2 affected rows when an upsert updated an existing row
+            self.rowcount = 2
+        return self.rowcount
+
+    def executemany(self, query, args):
+        sql, _, _ = translate(query, True)
+        self._cursor.executemany(sql, args)
+        self.rowcount = self._cursor.rowcount
+        return self.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    def _row(self, row):
+        return row
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        return None if row is None else self._row(row)
+
+    def fetchmany(self, size=None):
+        rows = self._cursor.fetchmany(size) if size is not None else self._cursor.fetchmany()
+        return [self._row(row) for row in rows]
+
+    def fetchall(self):
+        return [self._row(row) for row in self._cursor.fetchall()]
+
+    def __iter__(self):
+        for row in self._cursor:
+            yield self._row(row)
+
+    def close(self):
+        self._cursor.close()
+
+
+class SQLiteDictCursor(SQLiteCursor):
+    """MySQLdb-style cursor over sqlite3 returning rows as dicts"""
+
+    def _row(self, row):
+        return dict(zip([column[0] for column in self._cursor.description], row))
+
+
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(' '))
+sqlite3.register_adapter(date, lambda value: value.isoformat())
+sqlite3.register_converter('DATETIME', lambda value: datetime.fromisoformat(value.decode()))
+sqlite3.register_converter('DATE', lambda value: date.fromisoformat(value.decode()))
+sqlite3.register_converter('BOOLEAN', lambda value: bool(int(value)))
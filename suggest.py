@@ -0,0 +1,321 @@
+import heapq
+import math
+import os
+import re
+import threading
+from collections import Counter
+
+# Word-level abbreviations expanded before values are compared
+ABBREVIATIONS = {
+    'engg': 'engineer',
+    'engr': 'engineer',
+    'eng': 'engineer',
+    'mgr': 'manager',
+    'sr': 'senior',
+    'jr': 'junior',
+    'dev': 'developer',
+    'govt': 'government',
+    'asst': 'assistant',
+    'admin': 'administrator',
+}
+
+# Trailing words dropped from locations ("Palwal, Haryana", "Palwal Haryana India")
+LOCATION_QUALIFIERS = {'haryana', 'hr', 'india', 'district', 'distt', 'dist'}
+
+# Trigram similarity a canonical key needs before it is checked as a merge target
+MERGE_CANDIDATE_SIMILARITY = 0.5
+# A rarer spelling is folded into a more common one only if they differ in one word of at
+# least MERGE_MIN_WORD_LENGTH letters, by one edit (two from MERGE_LONG_WORD letters up)
+MERGE_MIN_WORD_LENGTH = 4
+MERGE_LONG_WORD = 8
+# Share of a typed query's trigrams a value must contain to be offered as a correction
+FUZZY_MIN_CONTAINMENT = 0.5
+
+
+def normalize(value, location=False, partial=False):
+    """Comparison key for a free-text value: lowercase words, abbreviations expanded.
+
+    With ``partial`` the last word is being typed, so it is left unexpanded.
+    """
+    text = (value or '').lower()
+    if location:
+        text = text.split(',')[0]
+    words = re.findall(r'\w+', text)
+    if location and not partial:
+        while len(words) > 1 and words[-1] in LOCATION_QUALIFIERS:
+            words.pop()
+    expanded = [ABBREVIATIONS.get(word, word) for word in words]
+    if partial and words:
+        expanded[-1] = words[-1]
+    return ' '.join(expanded)
+
+
+def trigrams(key):
+    padded = f'  {key} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def similarity(a, b):
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared) if shared else 0.0
+
+
+def edit_distance(a, b, limit):
+    """Levenshtein distance counting an adjacent transposition as one edit; ``limit`` + 1 once over ``limit``"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    before, previous = None, list(range(len(b) + 1))
+    for i, char in enumerate(a, 1):
+        current = [i]
+        for j, other in enumerate(b, 1):
+            cost = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char != other))
+            if before is not None and j > 1 and char == b[j - 2] and a[i - 2] == other:
+                cost = min(cost, before[j - 2] + 1)
+            current.append(cost)
+        if min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+    return min(previous[-1], limit + 1)
+
+
+def is_typo(key, other):
+    """Whether two normalized keys differ only by a typo in one longer, alphabetic word.
+
+    "sofware engineer" is a typo of "software engineer"; "sales manager ii"
+    and "sales manager", or "engineer i" and "engineer ii", are different values.
+    """
+    words, other_words = key.split(), other.split()
+    if len(words) != len(other_words):
+        return False
+    differing = [(word, other_word) for word, other_word in zip(words, other_words) if word != other_word]
+    if len(differing) != 1:
+        return False
+    word, other_word = differing[0]
+    shortest = min(len(word), len(other_word))
+    if shortest < MERGE_MIN_WORD_LENGTH or not (word.isalpha() and other_word.isalpha()):
+        return False
+    limit = 2 if shortest >= MERGE_LONG_WORD else 1
+    return edit_distance(word, other_word, limit) <= limit
+
+
+class _TrieNode:
+    __slots__ = ('children', 'keys')
+
+    def __init__(self):
+        self.children = {}
+        self.keys = set()
+
+
+class SuggestIndex:
+    """Completions and canonical spellings for one free-text column.
+
+    Canonical keys live in a prefix trie (every word start is indexed, so
+    "eng" finds "software engineer") and a trigram index used for typo
+    tolerance. A spelling whose key equals a more common canonical key, or
+    is a typo of it (see ``is_typo``), is folded into it, so "Software Engg",
+    "software engineer" and "Sofware Engineer" count as one value while
+    "Sales Manager II" stays apart from "Sales Manager".
+    """
+
+    def __init__(self, location=False):
+        self.location = location
+        self._lock = threading.Lock()
+        self._root = _TrieNode()
+        self._trigrams = {}
+        self._key_trigrams = {}
+        self._counts = Counter()
+        self._spellings = {}
+        self._canonical_key = {}
+
+    def build(self, values):
+        """Index (value, count) pairs, most common first so they become canonical"""
+        for value, count in sorted(values, key=lambda item: -item[1]):
+            self.add(value, count)
+
+    def add(self, value, count=1):
+        key = normalize(value, self.location)
+        if not key:
+            return
+        with self._lock:
+            canonical = self._canonical_key.get(key)
+            if canonical is None:
+                canonical = self._closest(key) or key
+                self._canonical_key[key] = canonical
+                if canonical == key:
+                    self._insert(key)
+            self._counts[canonical] += count
+            self._spellings.setdefault(canonical, Counter())[value.strip()] += count
+
+    def remove(self, value, count=1):
+        """Take back ``count`` occurrences of ``value`` recorded by ``add``"""
+        key = normalize(value, self.location)
+        with self._lock:
+            canonical = self._canonical_key.get(key)
+            if canonical is None:
+                return
+            self._counts[canonical] -= count
+            spellings = self._spellings[canonical]
+            spellings[value.strip()] -= count
+            if spellings[value.strip()] <= 0:
+                del spellings[value.strip()]
+
+    def _closest(self, key):
+        grams = trigrams(key)
+        candidates = Counter()
+        for gram in grams:
+            candidates.update(self._trigrams.get(gram, ()))
+        best, best_similarity = None, MERGE_CANDIDATE_SIMILARITY
+        for candidate in candidates:
+            score = similarity(grams, self._key_trigrams[candidate])
+            if score >= best_similarity and is_typo(key, candidate):
+                best, best_similarity = candidate, score
+        return best
+
+    def _insert(self, key):
+        grams = trigrams(key)
+        self._key_trigrams[key] = grams
+        for gram in grams:
+            self._trigrams.setdefault(gram, set()).add(key)
+        starts = [0] + [match.end() for match in re.finditer(r' ', key)]
+        for start in starts:
+            node = self._root
+            for char in key[start:]:
+                node = node.children.setdefault(char, _TrieNode())
+                node.keys.add(key)
+
+    def _display(self, key):
+        return self._spellings[key].most_common(1)[0][0]
+
+    def suggest(self, prefix, limit=8):
+        """Ranked completions: prefix matches by popularity, then close misspellings"""
+        query = normalize(prefix, self.location, partial=True)
+        if not query:
+            return []
+        with self._lock:
+            node = self._root
+            for char in query:
+                node = node.children.get(char)
+                if node is None:
+                    break
+            # Values whose every occurrence was removed stay in the trie with no spellings
+            matches = {key for key in node.keys if self._spellings[key]} if node is not None else set()
+            ranked = heapq.nlargest(limit, matches, key=lambda key: self._counts[key])
+
+            if len(ranked) < limit:
+                grams = trigrams(query)
+                candidates = Counter()
+                for gram in grams:
+                    candidates.update(self._trigrams.get(gram, ()))
+                # The query is a prefix, so score by how much of it each value contains
+                fuzzy = [(shared / len(grams), key) for key, shared in candidates.items()
+                         if key not in matches and self._spellings[key]]
+                fuzzy = [(score * math.log(2 + self._counts[key]), key) for score, key in fuzzy
+                         if score >= FUZZY_MIN_CONTAINMENT]
+                ranked += [key for _, key in heapq.nlargest(limit - len(ranked), fuzzy)]
+
+            return [{'value': self._display(key), 'count': self._counts[key]} for key in ranked]
+
+    def canonical(self, value):
+        """The canonical spelling for ``value``, or ``value`` itself if unknown"""
+        with self._lock:
+            key = self._canonical_key.get(normalize(value, self.location))
+            return self._display(key) if key and self._spellings[key] else value
+
+    def variants(self, value):
+        """Every stored spelling that canonicalizes the same way as ``value`` (empty if unknown)"""
+        with self._lock:
+            key = self._canonical_key.get(normalize(value, self.location))
+            return list(self._spellings[key]) if key else []
+
+    def canonical_map(self):
+        """{spelling: canonical spelling} for every spelling that differs from its canonical form"""
+        with self._lock:
+            mapping = {}
+            for key, spellings in self._spellings.items():
+                if not spellings:
+                    continue
+                display = self._display(key)
+                mapping.update({spelling: display for spelling in spellings if spelling != display})
+            return mapping
+
+
+class SuggestIndexes:
+    """The SuggestIndex of every field, built on a background thread and swapped in whole.
+
+    ``fields`` maps a field name to its ``location`` flag. ``load`` takes a
+    dict cursor and returns (field, value, count) rows. The builder thread
+    opens its own connection from ``connect`` (cursors of class
+    ``dict_cursor``) right after ``start`` and then every
+    ``rebuild_interval`` seconds, or sooner after ``refresh``. Requests read
+    whatever indexes are current and never wait for a build; until the
+    first one finishes the indexes are empty.
+    """
+
+    def __init__(self, connect, dict_cursor, load, fields, rebuild_interval=600):
+        self.connect = connect
+        self.dict_cursor = dict_cursor
+        self.load = load
+        self.fields = fields
+        self.rebuild_interval = rebuild_interval
+        self._lock = threading.Lock()
+        self._building = threading.Lock()
+        self._wakeup = threading.Event()
+        self._pid = None
+        self._indexes = self._empty()
+
+    def _empty(self):
+        return {field: SuggestIndex(location=location) for field, location in self.fields.items()}
+
+    def get(self):
+        """{field: SuggestIndex} as of the last finished build"""
+        self.start()
+        with self._lock:
+            return self._indexes
+
+    def add(self, field, value):
+        """Count one new occurrence of ``value`` until the next build picks it up"""
+        self.get()[field].add(value)
+        if self._building.locked():
+            # The build in progress may have read the table before this value was written
+            self._wakeup.set()
+
+    def refresh(self):
+        """Ask the builder thread for a rebuild; returns at once"""
+        self.start()
+        self._wakeup.set()
+
+    def start(self):
+        """Start the builder thread in this process (once per process, safe after fork)"""
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._wakeup = threading.Event()
+        threading.Thread(target=self._run, name='suggest-index-builder', daemon=True).start()
+
+    def _run(self):
+        while True:
+            self.build()
+            self._wakeup.wait(self.rebuild_interval)
+            self._wakeup.clear()
+
+    def build(self):
+        """Build new indexes from the database and swap them in; the old ones stay on error"""
+        with self._building:
+            connection = None
+            try:
+                connection = self.connect()
+                cursor = connection.cursor(self.dict_cursor)
+                rows = self.load(cursor)
+                cursor.close()
+            except Exception as e:
+                print(f"Suggest index build error: {str(e)}")
+                return
+            finally:
+                if connection is not None:
+                    connection.close()
+            indexes = self._empty()
+            for field, index in indexes.items():
+                index.build([(value, count) for row_field, value, count in rows if row_field == field])
+            with self._lock:
+                self._indexes = indexes
@@ -0,0 +1,109 @@
+"""Shared fixtures: the app running on a fresh SQLite database per test"""
+import hashlib
+import os
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Configure before the app module is first imported; each test then gets its own database
+_IMPORT_DIR = tempfile.mkdtemp(prefix='palwalreunion-tests-')
+os.environ.update({
+    'DB_BACKEND': 'sqlite',
+    'SQLITE_PATH': os.path.join(_IMPORT_DIR, 'import.db'),
+    'OTP_BACKEND': 'mysql',
+    'OUTBOX_WORKERS': '0',
+    'AUDIT_SPILL_PATH': os.path.join(_IMPORT_DIR, 'audit-spill.sqlite3'),
+})
+
+from audit import AuditLog  # noqa: E402
+from storage import SQLiteBackend, SQLiteDictCursor  # noqa: E402
+from matching import MatchEngine  # noqa: E402
+from skills import sync_user_skills  # noqa: E402
+from suggest import SuggestIndexes  # noqa: E402
+
+PASSWORD = 'secret123'
+
+
+@pytest.fixture
+def app_module(tmp_path, monkeypatch):
+    """The app module pointed at an empty SQLite file, with every in-process cache cleared"""
+    import app as module
+    backend = SQLiteBackend(str(tmp_path / 'app.db'))
+    monkeypatch.setattr(module, 'db_backend', backend)
+    monkeypatch.setattr(module, 'db_pool', module.create_pool())
+    monkeypatch.setattr(module, 'match_engine', MatchEngine(module.connect_db, backend.dict_cursor, refresh_interval=0))
+    # Tests call suggest_indexes.build() themselves rather than wait for the builder thread
+    monkeypatch.setattr(module, 'suggest_indexes', SuggestIndexes(module.connect_db, backend.dict_cursor,
+                                                                  module.load_suggest_values,
+                                                                  module.suggest_indexes.fields))
+    # A fresh audit log so no connection or spill file carries over from another test's database
+    monkeypatch.setattr(module, 'audit_log', AuditLog(module.connect_db, str(tmp_path / 'audit-spill.sqlite3'),
+                                                      on_flush=module.audit_rollups,
+                                                      on_commit=module.audit_log.on_commit, flush_interval=3600))
+    for cache in (module.analytics_cache, module.count_cache, module.identity_cache,
+                  module.page_cache, module.compressed_cache):
+        cache.invalidate()
+    module.app.config['TESTING'] = True
+    yield module
+    module.audit_log.flush()
+
+
+@pytest.fixture
+def client(app_module):
+    return app_module.app.test_client()
+
+
+@pytest.fixture
+def db(app_module):
+    """Raw connection to the test database (dict rows), for arranging and checking data"""
+    connection = app_module.connect_db()
+    yield connection
+    connection.close()
+
+
+def query(db, sql, args=None):
+    cursor = db.cursor(SQLiteDictCursor)
+    cursor.execute(sql, args)
+    rows = cursor.fetchall()
+    cursor.close()
+    return rows
+
+
+def create_user(db, username, status='active', mobile=None):
+    cursor = db.cursor()
+    cursor.execute('''INSERT INTO users (username, email, mobile, password, email_verified, status) 
+                      VALUES (%s, %s, %s, %s, %s, %s)''',
+                   (username, f'{username}@example.com', mobile, hashlib.sha256(PASSWORD.encode()).hexdigest(),
+                    True, status))
+    db.commit()
+    return cursor.lastrowid
+
+
+def create_profile(db, user_id, profession='Software Engineer', location='Palwal', education='B.Tech',
+                   experience=3, skills='python, sql', full_name=None):
+    cursor = db.cursor()
+    cursor.execute('''INSERT INTO professional_profiles 
+                      (user_id, full_name, profession, education, experience, skills, current_location, phone) 
+                      VALUES (%s, %s, %s, %s, %s, %s, %s, %s)''',
+                   (user_id, full_name or f'User {user_id}', profession, education, experience, skills,
+                    location, '9999999999'))
+    profile_id = cursor.lastrowid
+    sync_user_skills(cursor, user_id, skills)
+    db.commit()
+    return profile_id
+
+
+def login(client, username):
+    response = client.post('/api/login', json={'username': username, 'password': PASSWORD})
+    assert response.get_json()['success'], response.get_json()
+    return response
+
+
+def admin_login(client, username='admin', password='admin123'):
+    response = client.post('/api/admin-login', json={'username': username, 'password': password})
+    assert response.get_json()['success'], response.get_json()
+    return response
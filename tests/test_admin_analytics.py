@@ -0,0 +1,67 @@
+from conftest import admin_login, create_profile, create_user, login
+
+
+def admin_analytics(client, **params):
+    body = client.get('/api/admin-analytics', query_string=params).get_json()
+    assert body['success'], body
+    return body['data']
+
+
+def today(trend):
+    return trend[-1]['count']
+
+
+def send_feedback(client, feedback_type, rating):
+    body = client.post('/api/feedback', json={'name': 'Asha', 'email': 'asha@example.com',
+                                              'feedback_type': feedback_type, 'subject': 'Hello',
+                                              'message': 'Nice platform', 'rating': rating}).get_json()
+    assert body['success'], body
+
+
+def save_profile(client, profession):
+    body = client.post('/api/profile', json={'full_name': 'Asha', 'profession': profession, 'education': 'B.Ed',
+                                             'experience': 4, 'skills': '', 'current_location': 'Hodal',
+                                             'phone': '9999999999', 'availability': 'Available'}).get_json()
+    assert body['success'], body
+
+
+def test_writes_are_counted_in_the_rollups_as_they_happen(client, db):
+    create_user(db, 'asha')
+    login(client, 'asha')
+    save_profile(client, 'Teacher')
+    save_profile(client, 'Principal')
+    send_feedback(client, 'Suggestion', 4)
+    send_feedback(client, 'Suggestion', 2)
+    admin_login(client)
+
+    data = admin_analytics(client, days=7)
+
+    assert len(data['profile_created_trends']) == 7
+    assert today(data['profile_created_trends']) == 1
+    assert today(data['profile_updated_trends']) == 1
+    assert today(data['feedback_trends']) == 2
+    assert data['feedback_by_type'] == [{'feedback_type': 'Suggestion', 'count': 2, 'avg_rating': 3.0}]
+    assert data['growth_stats']['avg_rating'] == 3.0
+
+
+def test_rebuild_backfills_rows_written_outside_the_app(app_module, client, db):
+    for name in ('asha', 'ravi', 'meena'):
+        create_user(db, name)
+    create_profile(db, create_user(db, 'kiran'))
+    admin_login(client)
+    assert admin_analytics(client)['growth_stats']['weekly_registrations'] == 0
+
+    result = app_module.app.test_cli_runner().invoke(args=['rebuild-rollups'])
+
+    assert result.exit_code == 0, result.output
+    data = admin_analytics(client, granularity='hour', days=1)
+    assert data['growth_stats']['weekly_registrations'] == 4
+    assert data['growth_stats']['profile_completion_rate'] == 25.0
+    assert today(data['registration_trends']) == 4
+    assert today(data['profile_updated_trends']) == 0
+
+
+def test_unknown_granularity_is_refused(client):
+    admin_login(client)
+
+    assert not client.get('/api/admin-analytics?granularity=week').get_json()['success']
@@ -0,0 +1,48 @@
+from conftest import admin_login, create_profile, create_user
+
+
+def bootstrap(client, **params):
+    return client.get('/api/admin-bootstrap', query_string=params)
+
+
+def test_bootstrap_matches_the_separate_endpoints(client, db):
+    for name in ('asha', 'ravi'):
+        create_profile(db, create_user(db, name))
+    admin_login(client)
+
+    data = bootstrap(client).get_json()['data']
+
+    assert set(data) == {'admin', 'stats', 'users', 'profiles', 'feedback', 'analytics'}
+    assert data['admin']['username'] == 'admin'
+    assert data['stats'] == client.get('/api/admin-stats').get_json()['data']
+    assert data['users'] == client.get('/api/admin-users').get_json()['data']
+    assert data['users']['pagination']['total_items'] == 2
+
+
+def test_include_limits_the_sections(client):
+    admin_login(client)
+
+    data = bootstrap(client, include='stats,users').get_json()['data']
+
+    assert set(data) == {'admin', 'stats', 'users'}
+    assert not bootstrap(client, include='stats,passwords').get_json()['success']
+
+
+def test_bootstrap_needs_an_admin_and_revalidates(client, db):
+    assert not bootstrap(client).get_json()['success']
+    admin_login(client)
+    etag = bootstrap(client).headers['ETag']
+
+    assert client.get('/api/admin-bootstrap', headers={'If-None-Match': etag}).status_code == 304
+
+
+def test_status_change_invalidates_the_bootstrap_etag(client, db):
+    asha = create_user(db, 'asha')
+    admin_login(client)
+    etag = bootstrap(client).headers['ETag']
+
+    client.post('/api/admin-update-user-status', json={'user_id': asha, 'status': 'suspended'})
+
+    response = client.get('/api/admin-bootstrap', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.get_json()['data']['users']['users'][0]['status'] == 'suspended'
@@ -0,0 +1,92 @@
+from conftest import admin_login, create_user, query
+
+
+def bulk(client, **payload):
+    return client.post('/api/admin-bulk-user-status', json=payload).get_json()
+
+
+def statuses(db):
+    return {row['username']: row['status'] for row in query(db, 'SELECT username, status FROM users')}
+
+
+def suspended_total(client):
+    body = client.get('/api/admin-users', query_string={'filter': 'suspended'}).get_json()
+    return body['data']['pagination']['total_items']
+
+
+def test_bulk_without_ids_search_or_filter_is_rejected(client, db):
+    for name in ('asha', 'ravi', 'meena'):
+        create_user(db, name)
+    admin_login(client)
+
+    for payload in ({}, {'search': '', 'filter': ''}, {'search': '  '}):
+        body = bulk(client, status='suspended', **payload)
+        assert not body['success']
+
+    assert set(statuses(db).values()) == {'active'}
+
+
+def test_bulk_by_ids_skips_users_already_in_status(client, app_module, db):
+    asha, ravi = create_user(db, 'asha'), create_user(db, 'ravi', status='suspended')
+    create_user(db, 'meena')
+    admin_login(client)
+
+    body = bulk(client, status='suspended', user_ids=[asha, ravi])
+
+    assert body['success'] and body['updated'] == 1
+    assert statuses(db) == {'asha': 'suspended', 'ravi': 'suspended', 'meena': 'active'}
+    # Written with the UPDATE, not through the buffered audit log
+    assert app_module.audit_log.pending() == 0
+    assert [row['target_id'] for row in query(db, "SELECT target_id FROM admin_activity_log "
+                                                  "WHERE action = 'update_user_status_suspended'")] == [asha]
+
+
+def test_bulk_by_search_only_touches_matches(client, db):
+    for name in ('asha', 'ashok', 'ravi'):
+        create_user(db, name)
+    admin_login(client)
+
+    body = bulk(client, status='suspended', search='ash')
+
+    assert body['updated'] == 2
+    assert statuses(db) == {'asha': 'suspended', 'ashok': 'suspended', 'ravi': 'active'}
+
+
+def test_bulk_refuses_selections_over_the_limit(client, app_module, db, monkeypatch):
+    for name in ('asha', 'ashok', 'ashwin'):
+        create_user(db, name)
+    monkeypatch.setattr(app_module, 'BULK_STATUS_MAX_USERS', 2)
+    admin_login(client)
+
+    assert not bulk(client, status='suspended', search='ash')['success']
+    assert set(statuses(db).values()) == {'active'}
+
+
+def test_status_changes_refresh_cached_totals(client, db):
+    asha, ravi = create_user(db, 'asha'), create_user(db, 'ravi')
+    admin_login(client)
+    assert suspended_total(client) == 0
+
+    client.post('/api/admin-update-user-status', json={'user_id': asha, 'status': 'suspended'})
+    assert suspended_total(client) == 1
+
+    bulk(client, status='suspended', user_ids=[ravi])
+    assert suspended_total(client) == 2
+
+
+def test_user_list_cursor_walks_every_user_once(client, app_module, db, monkeypatch):
+    for i in range(7):
+        create_user(db, f'user{i}')
+    monkeypatch.setattr(app_module, 'ADMIN_PAGE_SIZE', 3)
+    admin_login(client)
+
+    seen, params = [], {}
+    while True:
+        data = client.get('/api/admin-users', query_string=params).get_json()['data']
+        seen += [user['username'] for user in data['users']]
+        params = {'cursor': data['pagination']['next_cursor']}
+        if not params['cursor']:
+            break
+
+    assert sorted(seen) == [f'user{i}' for i in range(7)]
+    assert data['pagination']['total_items'] == 7
@@ -0,0 +1,59 @@
+from conftest import create_profile, create_user, login, query
+
+
+def stats(db, dimension):
+    rows = query(db, 'SELECT value, count FROM profile_stats WHERE dimension = %s AND count > 0', (dimension,))
+    return {row['value']: row['count'] for row in rows}
+
+
+def analytics(client):
+    body = client.get('/api/analytics').get_json()
+    assert body['success'], body
+    return body['data']
+
+
+def test_triggers_keep_counts_in_step_with_profile_writes(db):
+    asha = create_profile(db, create_user(db, 'asha'), profession='Teacher', experience=1)
+    create_profile(db, create_user(db, 'ravi'), profession='Teacher', experience=12)
+    assert stats(db, 'profession') == {'Teacher': 2}
+    assert stats(db, 'experience') == {'Fresher (0-2 years)': 1, 'Expert (10+ years)': 1}
+
+    db.raw.execute("UPDATE professional_profiles SET profession = 'Farmer', experience = 3 WHERE id = ?", (asha,))
+    db.commit()
+    assert stats(db, 'profession') == {'Teacher': 1, 'Farmer': 1}
+    assert stats(db, 'experience') == {'Mid-level (2-5 years)': 1, 'Expert (10+ years)': 1}
+
+    db.raw.execute('DELETE FROM professional_profiles WHERE id = ?', (asha,))
+    db.commit()
+    assert stats(db, 'profession') == {'Teacher': 1}
+
+
+def test_rebuild_recomputes_drifted_counts(app_module, db):
+    create_profile(db, create_user(db, 'asha'), profession='Teacher', location='Hodal')
+    create_profile(db, create_user(db, 'ravi'), profession='Doctor', location='Hodal')
+    db.raw.execute("UPDATE profile_stats SET count = 40 WHERE dimension = 'location'")
+    db.raw.execute("INSERT INTO profile_stats (dimension, value, count) VALUES ('profession', 'Ghost', 7)")
+    db.commit()
+
+    result = app_module.app.test_cli_runner().invoke(args=['rebuild-analytics'])
+
+    assert result.exit_code == 0, result.output
+    assert stats(db, 'profession') == {'Teacher': 1, 'Doctor': 1}
+    assert stats(db, 'location') == {'Hodal': 2}
+
+
+def test_analytics_merges_spellings_and_follows_profile_saves(client, app_module, db):
+    create_profile(db, create_user(db, 'ravi'), location='Palwal')
+    create_profile(db, create_user(db, 'meena'), location='Palwal, Haryana')
+    app_module.suggest_indexes.build()
+    assert analytics(client)['location_stats'] == [{'current_location': 'Palwal', 'count': 2}]
+
+    create_user(db, 'asha')
+    login(client, 'asha')
+    client.post('/api/profile', json={'full_name': 'Asha', 'profession': 'Teacher', 'education': 'B.Ed',
+                                      'experience': 4, 'skills': '', 'current_location': 'Hodal',
+                                      'phone': '9999999999', 'availability': 'Available'})
+
+    locations = analytics(client)['location_stats']
+    assert {'current_location': 'Hodal', 'count': 1} in locations
+    assert {'current_location': 'Palwal', 'count': 2} in locations
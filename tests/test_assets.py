@@ -0,0 +1,55 @@
+import gzip
+import os
+
+import pytest
+
+from assets import AssetManifest, build
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    os.makedirs(tmp_path / 'css')
+    (tmp_path / 'css' / 'style.css').write_text('body { color: #333; }\n' * 50)
+    (tmp_path / 'robots.txt').write_text('User-agent: *\n')
+    return tmp_path
+
+
+def test_build_fingerprints_and_precompresses_text_assets(static_dir):
+    manifest = build(str(static_dir))
+
+    target = manifest['files']['css/style.css']
+    assert target.startswith('dist/css/style.') and target.endswith('.css')
+    assert 'robots.txt' not in manifest['files']
+    assert 'gzip' in manifest['encodings'][target]
+    assert gzip.decompress((static_dir / (target + '.gz')).read_bytes()) == (static_dir / 'css' / 'style.css').read_bytes()
+
+
+def test_fingerprint_changes_only_with_content(static_dir):
+    first = build(str(static_dir))['files']['css/style.css']
+    assert build(str(static_dir))['files']['css/style.css'] == first
+
+    (static_dir / 'css' / 'style.css').write_text('body { color: #000; }\n')
+    assert build(str(static_dir))['files']['css/style.css'] != first
+
+
+def test_manifest_falls_back_to_source_names_before_a_build(static_dir):
+    manifest = AssetManifest(str(static_dir))
+
+    assert manifest.resolve('css/style.css') == 'css/style.css'
+    assert manifest.version == ''
+
+
+def test_fingerprinted_assets_are_served_precompressed_and_immutable(client, app_module, static_dir, monkeypatch):
+    build(str(static_dir))
+    monkeypatch.setattr(app_module.app, 'static_folder', str(static_dir))
+    monkeypatch.setattr(app_module, 'asset_manifest', AssetManifest(str(static_dir)))
+
+    with app_module.app.test_request_context():
+        url = app_module.url_for('static', filename='css/style.css')
+    response = client.get(url, headers={'Accept-Encoding': 'gzip'})
+
+    assert '/dist/css/style.' in url
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'immutable' in response.headers['Cache-Control']
+    assert gzip.decompress(response.get_data()) == (static_dir / 'css' / 'style.css').read_bytes()
+    assert client.get('/static/css/style.css').status_code == 200
@@ -0,0 +1,83 @@
+from datetime import datetime
+
+import pytest
+
+from audit import AuditLog
+from conftest import admin_login, create_user, query
+
+
+def broken_connect():
+    raise ConnectionError('database unavailable')
+
+
+@pytest.fixture
+def admin_id(db):
+    return query(db, "SELECT id FROM admin_users WHERE username = 'admin'")[0]['id']
+
+
+def make_log(app_module, tmp_path, connect=None):
+    # A long flush interval keeps the background flusher out of the way; tests flush explicitly
+    return AuditLog(connect or app_module.connect_db, str(tmp_path / 'spill.sqlite3'),
+                    on_flush=app_module.audit_rollups, flush_interval=3600)
+
+
+def row(admin_id, action, at=datetime(2024, 3, 1, 10, 15)):
+    return (admin_id, action, 'system', None, None, '127.0.0.1', None, at)
+
+
+def logged(db):
+    return [r['action'] for r in query(db, 'SELECT action FROM admin_activity_log ORDER BY id')]
+
+
+def test_record_buffers_until_flush(app_module, tmp_path, db, admin_id):
+    audit_log = make_log(app_module, tmp_path)
+    audit_log.record_many([row(admin_id, 'export_users'), row(admin_id, 'export_users'),
+                           row(admin_id, 'import_profiles')])
+
+    assert audit_log.pending() == 3 and logged(db) == []
+    audit_log.flush()
+
+    assert audit_log.pending() == 0
+    assert logged(db) == ['export_users', 'export_users', 'import_profiles']
+    rollups = query(db, '''SELECT dimension, count FROM activity_rollups 
+                           WHERE metric = 'admin_action' AND bucket_type = 'hour' ORDER BY dimension''')
+    assert [(r['dimension'], r['count']) for r in rollups] == [('export_users', 2), ('import_profiles', 1)]
+
+
+def test_failed_flush_spills_and_next_flush_drains(app_module, tmp_path, db, admin_id):
+    failing = make_log(app_module, tmp_path, connect=broken_connect)
+    failing.record_many([row(admin_id, 'export_users'), row(admin_id, 'import_profiles')])
+    failing.flush()
+
+    assert failing.pending() == 2 and logged(db) == []
+
+    # Another worker sharing the spill file picks the rows up on its next flush
+    healthy = make_log(app_module, tmp_path)
+    assert healthy.pending() == 2
+    healthy.flush()
+
+    assert healthy.pending() == 0 and failing.pending() == 0
+    assert logged(db) == ['export_users', 'import_profiles']
+    assert query(db, 'SELECT created_at FROM admin_activity_log')[0]['created_at'] == datetime(2024, 3, 1, 10, 15)
+
+
+def test_close_spills_the_buffer(app_module, tmp_path, db, admin_id):
+    audit_log = make_log(app_module, tmp_path)
+    audit_log.record_many([row(admin_id, 'export_users')])
+    audit_log.close()
+
+    assert audit_log.pending() == 1
+    audit_log.flush()
+    assert logged(db) == ['export_users']
+
+
+def test_admin_actions_reach_the_log_on_flush(app_module, client, db):
+    user_id = create_user(db, 'asha')
+    admin_login(client)
+    assert client.post('/api/admin-update-user-status',
+                       json={'user_id': user_id, 'status': 'suspended'}).get_json()['success']
+
+    app_module.audit_log.flush()
+
+    [entry] = query(db, 'SELECT action, target_type, target_id FROM admin_activity_log')
+    assert entry == {'action': 'update_user_status_suspended', 'target_type': 'user', 'target_id': user_id}
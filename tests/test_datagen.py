@@ -0,0 +1,37 @@
+from conftest import query
+
+
+def generate(app_module, *args):
+    result = app_module.app.test_cli_runner().invoke(args=['generate-data', '--batch-size', '50', *args])
+    assert result.exit_code == 0, result.output
+    return result
+
+
+def daily_total(db, metric):
+    rows = query(db, "SELECT SUM(count) AS count FROM activity_rollups WHERE bucket_type = 'day' AND metric = %s",
+                 (metric,))
+    return rows[0]['count'] or 0
+
+
+def test_generated_rows_follow_the_requested_counts(app_module, db):
+    generate(app_module, '--profiles', '120', '--users', '150', '--feedback', '40', '--otps', '30',
+             '--admin-actions', '20', '--days', '30')
+
+    counts = {table: query(db, f'SELECT COUNT(*) AS n FROM {table}')[0]['n']
+              for table in ('users', 'professional_profiles', 'feedback', 'otp_verifications')}
+    assert counts == {'users': 150, 'professional_profiles': 120, 'feedback': 40, 'otp_verifications': 30}
+    assert query(db, 'SELECT COUNT(*) AS n FROM admin_activity_log')[0]['n'] >= 20
+    assert query(db, '''SELECT COUNT(*) AS n FROM professional_profiles pp
+                        WHERE NOT EXISTS (SELECT 1 FROM user_skills us WHERE us.user_id = pp.user_id)''')[0]['n'] == 0
+
+
+def test_only_edited_profiles_count_as_updates(app_module, db):
+    generate(app_module, '--profiles', '200', '--feedback', '0', '--otps', '0', '--admin-actions', '0')
+
+    rows = query(db, 'SELECT created_at, updated_at FROM professional_profiles')
+    edited = sum(row['updated_at'] > row['created_at'] for row in rows)
+    assert all(row['updated_at'] >= row['created_at'] for row in rows)
+    assert 0 < edited < len(rows) / 2
+    assert daily_total(db, 'profile_created') == len(rows)
+    assert daily_total(db, 'profile_updated') == edited
+
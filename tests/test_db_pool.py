@@ -0,0 +1,45 @@
+import pytest
+
+from db_pool import ConnectionPool, PoolTimeout
+from storage import SQLiteBackend
+
+
+@pytest.fixture
+def backend(tmp_path):
+    return SQLiteBackend(str(tmp_path / 'pool.db'))
+
+
+def test_connections_are_reused_and_rolled_back(backend):
+    pool = ConnectionPool(backend.connect, size=2)
+    connection = pool.acquire()
+    connection.cursor().execute("INSERT INTO users (username, email, password) VALUES ('a', 'a@example.com', 'x')")
+    pool.release(connection)
+
+    again = pool.acquire()
+    cursor = again.cursor()
+    cursor.execute('SELECT COUNT(*) FROM users')
+
+    assert again is connection
+    assert cursor.fetchone() == (0,)
+    assert pool.stats()['created'] == 1
+
+
+def test_acquire_times_out_when_pool_is_exhausted(backend):
+    pool = ConnectionPool(backend.connect, size=1, timeout=0.05)
+    pool.acquire()
+
+    with pytest.raises(PoolTimeout):
+        pool.acquire()
+    assert pool.stats()['timeouts'] == 1
+
+
+def test_discarded_and_expired_connections_are_replaced(backend):
+    pool = ConnectionPool(backend.connect, size=1, recycle=0)
+    first = pool.acquire()
+    pool.release(first, discard=True)
+    second = pool.acquire()
+    pool.release(second)
+    third = pool.acquire()
+
+    assert len({id(first), id(second), id(third)}) == 3
+    assert pool.stats()['recycled'] == 1
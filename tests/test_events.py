@@ -0,0 +1,77 @@
+import json
+
+import pytest
+
+from conftest import admin_login, create_user, login
+from events import MemoryEventBus, SQLiteEventBus
+
+
+@pytest.fixture
+def bus(app_module, monkeypatch):
+    bus = MemoryEventBus()
+    monkeypatch.setattr(app_module, 'event_bus', bus)
+    monkeypatch.setattr(app_module, 'EVENT_STREAM_SECONDS', 0.2)
+    monkeypatch.setattr(app_module, 'EVENT_HEARTBEAT_SECONDS', 0.05)
+    return bus
+
+
+def stream(client, last_event_id=None):
+    headers = {'Last-Event-ID': str(last_event_id)} if last_event_id is not None else {}
+    response = client.get('/api/admin-events', headers=headers)
+    assert response.mimetype == 'text/event-stream'
+    return response.get_data(as_text=True)
+
+
+def events(text):
+    parsed = []
+    for block in text.split('\n\n'):
+        fields = dict(line.split(': ', 1) for line in block.splitlines() if not line.startswith(':') and ': ' in line)
+        if 'event' in fields:
+            parsed.append((int(fields['id']), fields['event'], json.loads(fields['data'])))
+    return parsed
+
+
+def test_stream_resumes_after_last_event_id(client, bus):
+    admin_login(client)
+    first = bus.publish('feedback', {'rating': 5})
+    bus.publish('user_status', {'user_id': 7, 'status': 'suspended'})
+
+    assert events(stream(client, first)) == [(first + 1, 'user_status', {'user_id': 7, 'status': 'suspended'})]
+
+
+def test_new_stream_starts_at_the_latest_event_and_keeps_alive(client, bus):
+    admin_login(client)
+    bus.publish('feedback', {'rating': 5})
+
+    text = stream(client)
+
+    assert text.startswith('retry: 3000\n\n')
+    assert events(text) == []
+    assert ': keepalive' in text
+
+
+def test_profile_saves_are_published(client, bus, db):
+    create_user(db, 'asha')
+    login(client, 'asha')
+    client.post('/api/profile', json={'full_name': 'Asha', 'profession': 'Teacher', 'education': 'B.Ed',
+                                      'experience': 4, 'skills': '', 'current_location': 'Hodal',
+                                      'phone': '9999999999', 'availability': 'Available'})
+    admin_login(client)
+
+    [(_, event_type, data)] = events(stream(client, 0))
+    assert event_type == 'profile_created' and data['full_name'] == 'Asha'
+
+
+def test_stream_needs_an_admin(client, bus):
+    assert not client.get('/api/admin-events').get_json()['success']
+
+
+def test_sqlite_bus_carries_events_between_instances(tmp_path):
+    path = str(tmp_path / 'events.sqlite3')
+    publisher, subscriber = SQLiteEventBus(path, poll_interval=0.01), SQLiteEventBus(path, poll_interval=0.01)
+    start = subscriber.last_id()
+
+    publisher.publish('feedback', {'rating': 4})
+
+    assert [(event['type'], event['data']) for event in subscriber.wait(start, 1)] == [('feedback', {'rating': 4})]
+    assert subscriber.wait(subscriber.last_id(), 0.05) == []
@@ -0,0 +1,59 @@
+import csv
+import gzip
+import io
+import json
+from datetime import datetime
+
+from conftest import admin_login, create_user
+
+
+def export(client, data_type, **params):
+    response = client.get(f'/api/admin-export/{data_type}', query_string=params)
+    assert response.status_code == 200
+    return response
+
+
+def test_csv_export_streams_every_row_in_batches(client, app_module, db, monkeypatch):
+    monkeypatch.setattr(app_module, 'EXPORT_BATCH_SIZE', 2)
+    for i in range(5):
+        create_user(db, f'user{i}')
+    admin_login(client)
+
+    response = export(client, 'users')
+
+    assert response.is_streamed
+    assert response.mimetype == 'text/csv'
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    assert sorted(row['username'] for row in rows) == [f'user{i}' for i in range(5)]
+
+
+def test_since_only_exports_rows_changed_after_it(client, db):
+    old, recent = create_user(db, 'old'), create_user(db, 'recent')
+    db.raw.execute("UPDATE users SET updated_at = '2020-01-01 00:00:00' WHERE id = ?", (old,))
+    db.commit()
+    admin_login(client)
+
+    response = export(client, 'users', format='ndjson', since=datetime(2024, 1, 1).isoformat())
+
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [row['id'] for row in rows] == [recent]
+
+
+def test_gzip_export_decompresses_to_the_plain_export(client, db):
+    for name in ('asha', 'ravi'):
+        create_user(db, name)
+    admin_login(client)
+
+    plain = export(client, 'users', format='ndjson').get_data()
+    zipped = export(client, 'users', format='ndjson', gzip='1')
+
+    assert zipped.mimetype == 'application/gzip'
+    assert zipped.headers['Content-Disposition'].endswith('.ndjson.gz')
+    assert gzip.decompress(zipped.get_data()) == plain
+
+
+def test_export_needs_an_admin_and_a_known_type(client):
+    assert not client.get('/api/admin-export/users').get_json()['success']
+    admin_login(client)
+    assert not client.get('/api/admin-export/passwords').get_json()['success']
+    assert not client.get('/api/admin-export/users?format=xml').get_json()['success']
@@ -0,0 +1,75 @@
+import gzip
+import json
+
+import pytest
+
+from conftest import create_profile, create_user, login
+
+
+def test_search_answers_repeat_requests_with_304_until_profiles_change(client, db):
+    create_profile(db, create_user(db, 'asha'))
+    etag = client.get('/api/search?profession=engineer').headers['ETag']
+
+    assert client.get('/api/search?profession=engineer', headers={'If-None-Match': etag}).status_code == 304
+    assert client.get('/api/search?profession=teacher', headers={'If-None-Match': etag}).status_code == 200
+
+    create_user(db, 'ravi')
+    login(client, 'ravi')
+    client.post('/api/profile', json={'full_name': 'Ravi', 'profession': 'Civil Engineer', 'education': 'B.E.',
+                                      'experience': 2, 'skills': '', 'current_location': 'Hodal',
+                                      'phone': '9999999999', 'availability': 'Available'})
+    response = client.get('/api/search?profession=engineer', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert len(response.get_json()['data']) == 2
+
+
+def test_cached_page_is_compressed_once_per_encoding(client, app_module, monkeypatch):
+    calls = []
+    compress_body = app_module.compress_body
+    monkeypatch.setattr(app_module, 'compress_body', lambda data, encoding: calls.append(encoding) or
+                        compress_body(data, encoding))
+
+    responses = [client.get('/', headers={'Accept-Encoding': 'gzip'}) for _ in range(3)]
+
+    assert calls == ['gzip']
+    assert {response.headers['Content-Encoding'] for response in responses} == {'gzip'}
+    assert len({response.get_data() for response in responses}) == 1
+    assert b'<html' in gzip.decompress(responses[0].get_data()).lower()
+    assert 'Accept-Encoding' in responses[0].headers['Vary']
+
+
+def test_identity_clients_get_uncompressed_pages(client):
+    response = client.get('/', headers={'Accept-Encoding': 'identity'})
+
+    assert 'Content-Encoding' not in response.headers
+    assert b'<html' in response.get_data().lower()
+
+
+def test_page_etag_gives_304(client):
+    etag = client.get('/').headers['ETag']
+
+    assert client.get('/', headers={'If-None-Match': etag}).status_code == 304
+
+
+def test_bodies_sharing_an_etag_are_compressed_separately(client, app_module, db, monkeypatch):
+    # Rows written behind the app's back leave the data versions, and so the ETag, unchanged
+    monkeypatch.setattr(app_module, 'COMPRESS_MIN_BYTES', 1)
+    create_profile(db, create_user(db, 'asha'))
+    first = client.get('/api/search?profession=engineer', headers={'Accept-Encoding': 'gzip'})
+    create_profile(db, create_user(db, 'ravi'))
+    second = client.get('/api/search?profession=engineer', headers={'Accept-Encoding': 'gzip'})
+
+    assert first.headers['ETag'] == second.headers['ETag']
+    assert len(json.loads(gzip.decompress(first.get_data()))['data']) == 1
+    assert len(json.loads(gzip.decompress(second.get_data()))['data']) == 2
+
+
+def test_memory_data_versions_are_refused_with_several_workers(app_module, monkeypatch):
+    monkeypatch.setattr(app_module, 'DATA_VERSION_PATH', None)
+    monkeypatch.setattr(app_module, 'WEB_CONCURRENCY', 4)
+
+    with pytest.raises(RuntimeError):
+        app_module.create_data_versions()
+
+    monkeypatch.setattr(app_module, 'WEB_CONCURRENCY', 1)
+    assert isinstance(app_module.create_data_versions(), app_module.MemoryVersions)
@@ -0,0 +1,52 @@
+from caching import SQLiteCache
+from conftest import admin_login, create_user, login, query
+
+PROFILE = {'full_name': 'Asha', 'profession': 'Teacher', 'education': 'B.Ed', 'experience': 4, 'skills': '',
+           'current_location': 'Hodal', 'phone': '9999999999', 'availability': 'Available'}
+
+
+def test_suspension_takes_effect_on_the_users_next_request(app_module, client, db):
+    asha = create_user(db, 'asha')
+    login(client, 'asha')
+    assert client.post('/api/profile', json=PROFILE).get_json()['success']
+    admin = app_module.app.test_client()
+    admin_login(admin)
+
+    admin.post('/api/admin-update-user-status', json={'user_id': asha, 'status': 'suspended'})
+
+    assert not client.post('/api/profile', json=PROFILE).get_json()['success']
+
+
+def test_identity_is_served_from_the_cache_until_invalidated(app_module, client, db):
+    admin_login(client)
+    admin_id = query(db, "SELECT id FROM admin_users WHERE username = 'admin'")[0]['id']
+    db.raw.execute("UPDATE admin_users SET full_name = 'Renamed' WHERE id = ?", (admin_id,))
+    db.commit()
+
+    assert client.get('/api/admin-session').get_json()['admin']['full_name'] != 'Renamed'
+
+    app_module.identity_cache.invalidate(f'admin:{admin_id}')
+    assert client.get('/api/admin-session').get_json()['admin']['full_name'] == 'Renamed'
+
+
+def test_deactivating_an_admin_ends_their_session(app_module, client):
+    admin_login(client)
+    assert client.get('/api/admin-session').get_json()['success']
+
+    result = app_module.app.test_cli_runner().invoke(args=['set-admin', 'admin', '--inactive'])
+
+    assert result.exit_code == 0, result.output
+    assert not client.get('/api/admin-session').get_json()['success']
+
+
+def test_sqlite_cache_invalidation_is_seen_by_every_instance(tmp_path):
+    path = str(tmp_path / 'identity.sqlite3')
+    first, second = SQLiteCache(path, ttl=60), SQLiteCache(path, ttl=60)
+    first.set('user:1', {'status': 'active'})
+    assert second.get('user:1') == {'status': 'active'}
+
+    second.invalidate('user:1')
+
+    assert first.get('user:1') is None
+    assert first.get_or_set('user:1', lambda: {'status': 'suspended'}) == {'status': 'suspended'}
+    assert second.get('user:1') == {'status': 'suspended'}
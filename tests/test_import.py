@@ -0,0 +1,61 @@
+import io
+
+from conftest import admin_login, create_profile, create_user, query
+
+HEADER = 'user_id,email,full_name,profession,education,current_location,experience,skills\n'
+
+
+def import_csv(client, text, **params):
+    body = client.post('/api/admin-import-profiles', query_string=params,
+                       data={'file': (io.BytesIO(text.encode()), 'profiles.csv')},
+                       content_type='multipart/form-data').get_json()
+    assert body['success'], body
+    return body['data']
+
+
+def test_import_creates_and_updates_profiles(client, db):
+    asha, ravi = create_user(db, 'asha'), create_user(db, 'ravi')
+    create_profile(db, ravi, profession='Teacher')
+    admin_login(client)
+
+    result = import_csv(client, HEADER +
+                        f'{asha},,Asha,Software Engineer,B.Tech,Palwal,3,"python, sql"\n'
+                        f',ravi@example.com,Ravi,Civil Engineer,B.E.,Hodal,5,autocad\n')
+
+    assert (result['created'], result['updated'], result['skipped']) == (1, 1, 0)
+    rows = query(db, 'SELECT user_id, profession FROM professional_profiles ORDER BY user_id')
+    assert [(row['user_id'], row['profession']) for row in rows] == [(asha, 'Software Engineer'),
+                                                                     (ravi, 'Civil Engineer')]
+    assert len(query(db, 'SELECT * FROM user_skills WHERE user_id = %s', (asha,))) == 2
+
+
+def test_duplicate_users_are_reported_and_totals_add_up(client, app_module, db, monkeypatch):
+    asha = create_user(db, 'asha')
+    monkeypatch.setattr(app_module, 'IMPORT_BATCH_SIZE', 2)
+    admin_login(client)
+    rows = [f'{asha},,Asha,Software Engineer,B.Tech,Palwal,3,python\n',
+            f',asha@example.com,Asha K,Teacher,B.Ed,Hodal,4,teaching\n',
+            f'{asha},,Asha J,Doctor,MBBS,Delhi,1,surgery\n',
+            f',nobody@example.com,Nobody,Doctor,MBBS,Delhi,1,\n',
+            'x,,Bad,Doctor,MBBS,Delhi,1,\n']
+
+    result = import_csv(client, HEADER + ''.join(rows))
+
+    assert result['created'] + result['updated'] + result['skipped'] == len(rows)
+    assert (result['created'], result['updated'], result['skipped']) == (1, 0, 4)
+    assert sorted((error['record'], error['message']) for error in result['errors']) == [
+        (2, 'Same user as record 1'),
+        (3, 'Same user as record 1'),
+        (4, 'No matching user'),
+        (5, 'experience and user_id must be whole numbers'),
+    ]
+    assert query(db, 'SELECT profession FROM professional_profiles')[0]['profession'] == 'Software Engineer'
+
+
+def test_import_can_create_pending_users(client, db):
+    admin_login(client)
+
+    result = import_csv(client, HEADER + ',new@example.com,New,Teacher,B.Ed,Palwal,2,\n', create_users='1')
+
+    assert (result['users_created'], result['created']) == (1, 1)
+    assert query(db, "SELECT status FROM users WHERE email = 'new@example.com'")[0]['status'] == 'pending'
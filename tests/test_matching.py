@@ -0,0 +1,88 @@
+import numpy as np
+
+from conftest import create_profile, create_user, login, query
+from matching import FeatureTable, rank
+
+
+def post_job(client, **overrides):
+    job = {'title': 'Backend Developer', 'description': 'APIs', 'company': 'Acme', 'location': 'Palwal',
+           'education': 'B.Tech', 'min_experience': 2, 'max_experience': 5, 'skills': 'python, sql'}
+    job.update(overrides)
+    return client.post('/api/jobs', json=job).get_json()
+
+
+def matched_names(client, job_id):
+    body = client.get(f'/api/jobs/{job_id}/matches').get_json()
+    assert body['success'], body
+    return [row['full_name'] for row in body['data']]
+
+
+def test_skill_postings_follow_upserts():
+    table = FeatureTable(capacity=2)
+    table.upsert(10, True, 1, 1, 0, 0, 1.0, [1, 2])
+    table.upsert(11, True, 1, 1, 0, 0, 1.0, [2])
+    table.upsert(12, True, 1, 1, 0, 0, 1.0, [3])
+
+    assert table.skill_overlap([1, 2]).tolist() == [2, 1, 0]
+
+    table.upsert(10, True, 1, 1, 0, 0, 1.0, [3])
+
+    assert table.skill_overlap([1, 2]).tolist() == [0, 1, 0]
+    assert 1 not in table.postings
+    assert table.skill_overlap([3]).tolist() == [1, 0, 1]
+
+
+def test_rank_orders_by_weighted_signals_and_skips_inactive():
+    table = FeatureTable()
+    table.upsert(1, True, 5, 0, 3, 3, 1.0, [1, 2])
+    table.upsert(2, True, 6, 0, 3, 3, 1.0, [1])
+    table.upsert(3, False, 5, 0, 3, 3, 1.0, [1, 2])
+    job = {'skills': [1, 2], 'location': 5, 'education': 0, 'exp_min': 2, 'exp_max': 5}
+
+    ranked = rank(table, job, 10)
+
+    assert [entity_id for entity_id, _, _ in ranked] == [1, 2]
+    assert ranked[0][2]['skills'] == 1.0 and ranked[1][2]['skills'] == 0.5
+    assert np.isclose(ranked[0][1], 0.9)
+
+
+def test_job_matches_rank_profiles(client, db):
+    create_profile(db, create_user(db, 'asha'), skills='python, sql', full_name='Asha')
+    create_profile(db, create_user(db, 'ravi'), skills='python', location='Hodal', full_name='Ravi')
+    create_profile(db, create_user(db, 'meena'), skills='teaching', location='Delhi', experience=20,
+                   education='B.Ed', full_name='Meena')
+    login(client, 'asha')
+
+    body = post_job(client)
+
+    assert body['success'], body
+    assert matched_names(client, body['job_id'])[:2] == ['Asha', 'Ravi']
+
+
+def test_pending_members_cannot_post_jobs(client, db):
+    create_user(db, 'asha', status='pending')
+    login(client, 'asha')
+
+    assert not post_job(client)['success']
+    assert query(db, 'SELECT COUNT(*) AS n FROM job_opportunities')[0]['n'] == 0
+
+
+def test_rebuild_runs_in_background_and_drops_deleted_rows(client, app_module, db):
+    create_profile(db, create_user(db, 'asha'), full_name='Asha')
+    ravi = create_user(db, 'ravi')
+    create_profile(db, ravi, full_name='Ravi')
+    login(client, 'asha')
+    job_id = post_job(client)['job_id']
+    assert sorted(matched_names(client, job_id)) == ['Asha', 'Ravi']
+
+    db.cursor().execute('DELETE FROM users WHERE id = %s', (ravi,))
+    db.commit()
+    engine = app_module.match_engine
+    engine.rebuild_interval = 0
+    # The request that finds a rebuild due starts it on another thread
+    matched_names(client, job_id)
+    engine._rebuilder.join(5)
+    engine.rebuild_interval = 3600
+
+    assert engine._rebuilder.name == 'match-engine-rebuild'
+    assert matched_names(client, job_id) == ['Asha']
@@ -0,0 +1,36 @@
+import re
+
+from conftest import create_profile, create_user
+
+
+def sql_queries(client, endpoint):
+    """(count, sum) of the SQL-statements-per-request histogram for ``endpoint``"""
+    text = client.get('/metrics').get_data(as_text=True)
+    labels = r'\{endpoint="%s",method="GET"\}' % re.escape(endpoint)
+    count = re.search(r'http_request_sql_queries_count%s (\S+)' % labels, text)
+    total = re.search(r'http_request_sql_queries_sum%s (\S+)' % labels, text)
+    return (float(count.group(1)), float(total.group(1))) if count else (0, 0)
+
+
+def test_streamed_search_sql_is_counted_when_stream_closes(client, db):
+    create_profile(db, create_user(db, 'asha'))
+    before_count, before_sum = sql_queries(client, '/api/search')
+
+    response = client.get('/api/search', query_string={'format': 'ndjson', 'skills': 'python'})
+    assert response.get_data(as_text=True).count('\n') == 1
+    response.close()
+
+    count, total = sql_queries(client, '/api/search')
+    assert count == before_count + 1
+    assert total >= before_sum + 1
+
+
+def test_buffered_request_sql_is_counted(client, db):
+    create_profile(db, create_user(db, 'asha'))
+    before_count, before_sum = sql_queries(client, '/api/search')
+
+    client.get('/api/search', query_string={'skills': 'python'})
+
+    count, total = sql_queries(client, '/api/search')
+    assert count == before_count + 1
+    assert total >= before_sum + 1
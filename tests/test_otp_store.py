@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from otp_store import MemoryOTPStore, MySQLOTPStore, OTPError
+
+
+@pytest.fixture(params=['mysql', 'memory'])
+def store(request, db):
+    """Both stores, the MySQL one running on the SQLite test database"""
+    if request.param == 'mysql':
+        return MySQLOTPStore(max_attempts=2, send_limit=2)
+    store = MemoryOTPStore(max_attempts=2, send_limit=2)
+    store._start_sweeper = lambda: None
+    return store
+
+
+def issue(store, db, email, mobile, otp='123456'):
+    cursor = db.cursor()
+    store.issue(cursor, email, mobile, 'both', otp, datetime.now() + timedelta(minutes=10))
+    db.commit()
+
+
+def test_send_limit_applies_to_the_mobile_on_its_own(store, db):
+    issue(store, db, 'a@example.com', '9000000001')
+    issue(store, db, 'b@example.com', '9000000001')
+
+    with pytest.raises(OTPError):
+        issue(store, db, 'c@example.com', '9000000001')
+    issue(store, db, 'c@example.com', '9000000002')
+
+
+def test_send_limit_applies_to_the_email_on_its_own(store, db):
+    issue(store, db, 'a@example.com', '9000000001')
+    issue(store, db, 'a@example.com', None)
+
+    with pytest.raises(OTPError):
+        issue(store, db, 'a@example.com', '9000000003')
+
+
+def test_verify_then_register_flow(store, db):
+    cursor = db.cursor()
+    issue(store, db, 'a@example.com', None, otp='111111')
+
+    assert not store.verify(cursor, 'a@example.com', None, '999999')
+    assert store.verify(cursor, 'a@example.com', None, '111111')
+    assert store.is_verified(cursor, 'a@example.com', '111111')
+
+    store.consume(cursor, 'a@example.com', '111111')
+    assert not store.is_verified(cursor, 'a@example.com', '111111')
+
+
+def test_too_many_wrong_codes_lock_the_live_code(store, db):
+    cursor = db.cursor()
+    issue(store, db, 'a@example.com', None, otp='111111')
+
+    assert not store.verify(cursor, 'a@example.com', None, '000000')
+    assert not store.verify(cursor, 'a@example.com', None, '000000')
+    with pytest.raises(OTPError):
+        store.verify(cursor, 'a@example.com', None, '111111')
+
+
+def test_sweep_removes_expired_codes(store, db):
+    cursor = db.cursor()
+    store.issue(cursor, 'a@example.com', None, 'email', '111111', datetime.now() - timedelta(minutes=1))
+    store.issue(cursor, 'b@example.com', None, 'email', '222222', datetime.now() + timedelta(minutes=1))
+    db.commit()
+
+    assert store.sweep(cursor) == 1
+
+
+def test_send_endpoint_answers_429_at_the_limit(client, app_module, monkeypatch):
+    monkeypatch.setattr(app_module, 'otp_store', MySQLOTPStore(send_limit=1))
+    payload = {'email': 'a@example.com', 'mobile': '9000000001', 'type': 'both'}
+
+    first = client.post('/api/send-otp', json=payload)
+    refused = client.post('/api/send-otp', json=payload)
+
+    assert first.status_code == 200 and first.get_json()['success']
+    assert refused.status_code == 429 and not refused.get_json()['success']
@@ -0,0 +1,70 @@
+from conftest import query
+from outbox import ConsoleTransport, Outbox
+
+
+class RecordingTransport:
+    def __init__(self, error=None):
+        self.error = error
+        self.sent = []
+
+    def send_batch(self, messages):
+        self.sent += [message['recipient'] for message in messages]
+        return {message['id']: self.error for message in messages}
+
+
+def outbox_for(app_module, transports, **options):
+    return Outbox(app_module.connect_db, transports, app_module.db_backend.dict_cursor, **options)
+
+
+def test_send_otp_queues_email_and_sms_in_the_request_transaction(client, db):
+    body = client.post('/api/send-otp', json={'email': 'a@example.com', 'mobile': '9000000001'}).get_json()
+
+    assert body['success'], body
+    rows = query(db, 'SELECT channel, recipient, status FROM outbound_messages ORDER BY channel')
+    assert [(row['channel'], row['recipient'], row['status']) for row in rows] == [
+        ('email', 'a@example.com', 'pending'), ('sms', '9000000001', 'pending')]
+
+
+def test_worker_delivers_due_messages_per_channel(client, app_module, db):
+    client.post('/api/send-otp', json={'email': 'a@example.com', 'mobile': '9000000001'})
+    email, sms = RecordingTransport(), RecordingTransport()
+    outbox = outbox_for(app_module, {'email': email, 'sms': sms})
+    connection = app_module.connect_db()
+
+    assert outbox.process_batch(connection)
+    assert not outbox.process_batch(connection)
+    connection.close()
+
+    assert (email.sent, sms.sent) == (['a@example.com'], ['9000000001'])
+    assert {row['status'] for row in query(db, 'SELECT status FROM outbound_messages')} == {'sent'}
+
+
+def test_failed_sends_back_off_then_give_up(client, app_module, db):
+    client.post('/api/send-otp', json={'email': 'a@example.com', 'type': 'email'})
+    transport = RecordingTransport(error='SMTP down')
+    connection = app_module.connect_db()
+
+    outbox_for(app_module, {'email': transport}, max_attempts=2, backoff_seconds=3600).process_batch(connection)
+    row = query(db, 'SELECT status, attempts, last_error FROM outbound_messages')[0]
+    assert (row['status'], row['attempts'], row['last_error']) == ('pending', 1, 'SMTP down')
+    # Not due again until the backoff has passed
+    assert not outbox_for(app_module, {'email': transport}).process_batch(connection)
+
+    outbox = outbox_for(app_module, {'email': transport}, max_attempts=2, backoff_seconds=0)
+    db.cursor().execute('UPDATE outbound_messages SET next_attempt_at = created_at')
+    db.commit()
+    outbox.process_batch(connection)
+    connection.close()
+
+    row = query(db, 'SELECT status, attempts FROM outbound_messages')[0]
+    assert (row['status'], row['attempts']) == ('failed', 2)
+    assert transport.sent == ['a@example.com', 'a@example.com']
+
+
+def test_sms_is_not_printed_unless_the_console_is_asked_for(app_module, monkeypatch):
+    monkeypatch.setattr(app_module, 'TWILIO_ACCOUNT_SID', None)
+    monkeypatch.setattr(app_module, 'SMS_CONSOLE', False)
+    assert 'sms' not in app_module.build_outbox_transports()
+
+    monkeypatch.setattr(app_module, 'SMS_CONSOLE', True)
+    assert isinstance(app_module.build_outbox_transports()['sms'], ConsoleTransport)
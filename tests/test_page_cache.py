@@ -0,0 +1,50 @@
+import pytest
+
+from conftest import create_user, login
+
+
+@pytest.fixture
+def renders(app_module, monkeypatch):
+    calls = []
+    render_template = app_module.render_template
+    monkeypatch.setattr(app_module, 'render_template', lambda template: calls.append(template) or
+                        render_template(template))
+    return calls
+
+
+def test_visitor_pages_render_once(client, renders):
+    responses = [client.get('/vision') for _ in range(3)]
+
+    assert renders == ['vision.html']
+    assert len({response.get_data() for response in responses}) == 1
+    assert responses[0].headers['Cache-Control'] == 'no-cache'
+
+
+def test_logged_in_users_get_their_own_copy(client, app_module, db, renders):
+    visitor = client.get('/').get_data(as_text=True)
+    create_user(db, 'asha')
+    login(client, 'asha')
+
+    first, second = client.get('/'), client.get('/')
+
+    assert renders == ['index.html', 'index.html']
+    assert 'Welcome, asha!' in first.get_data(as_text=True) and 'Welcome, asha!' not in visitor
+    assert first.headers['Cache-Control'] == 'private, no-cache'
+    assert first.headers['ETag'] == second.headers['ETag']
+    assert client.get('/', headers={'If-None-Match': first.headers['ETag']}).status_code == 304
+
+
+def test_new_asset_version_renders_afresh(client, app_module, monkeypatch, renders):
+    client.get('/login')
+    monkeypatch.setattr(app_module.asset_manifest, 'version', 'next-deploy')
+    client.get('/login')
+
+    assert renders == ['login.html', 'login.html']
+
+
+def test_debug_mode_always_renders(client, app_module, monkeypatch, renders):
+    monkeypatch.setattr(app_module.app, 'debug', True)
+    client.get('/feedback')
+    client.get('/feedback')
+
+    assert renders == ['feedback.html', 'feedback.html']
@@ -0,0 +1,63 @@
+import pytest
+
+from conftest import create_profile, create_user, login
+from db_pool import ConnectionPool, ReplicaSet
+from storage import SQLiteBackend
+
+
+def test_unhealthy_replica_is_skipped(tmp_path):
+    # SQLite has no replication status, so the lag check fails and the replica is skipped
+    replicas = ReplicaSet([ConnectionPool(SQLiteBackend(str(tmp_path / 'replica.db')).connect, size=1)])
+
+    assert replicas.acquire() is None
+    assert replicas.stats()[0]['healthy'] is False
+
+
+class StandaloneConnection:
+    """A server that answers SHOW REPLICA STATUS with no row"""
+
+    def cursor(self):
+        return self
+
+    def execute(self, query):
+        self.description = [('Seconds_Behind_Source',)]
+
+    def fetchone(self):
+        return None
+
+    def close(self):
+        pass
+
+
+def test_server_without_replica_status_is_skipped_unless_allowed():
+    assert ReplicaSet([])._check_lag(StandaloneConnection()) is False
+    assert ReplicaSet([], allow_standalone=True)._check_lag(StandaloneConnection()) is True
+
+
+@pytest.fixture
+def replica(app_module, tmp_path, monkeypatch):
+    """A second database standing in for a healthy replica of the primary"""
+    replica_backend = SQLiteBackend(str(tmp_path / 'replica.db'))
+    replicas = ReplicaSet([ConnectionPool(replica_backend.connect, size=2)])
+    monkeypatch.setattr(replicas, '_check_lag', lambda connection: True)
+    monkeypatch.setattr(app_module, 'replica_set', replicas)
+    connection = replica_backend.connect()
+    yield connection
+    connection.close()
+
+
+def search_names(client):
+    return sorted(row['full_name'] for row in client.get('/api/search?profession=engineer').get_json()['data'])
+
+
+def test_reads_use_replica_until_the_user_writes(client, db, replica):
+    create_profile(replica, create_user(replica, 'asha'), full_name='On replica')
+    create_profile(db, create_user(db, 'asha'), full_name='On primary')
+    assert search_names(client) == ['On replica']
+
+    login(client, 'asha')
+    client.post('/api/profile', json={'full_name': 'Asha', 'profession': 'Software Engineer', 'education': 'B.Tech',
+                                      'experience': 3, 'skills': '', 'current_location': 'Palwal',
+                                      'phone': '9999999999', 'availability': 'Available'})
+
+    assert search_names(client) == ['Asha']
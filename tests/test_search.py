@@ -0,0 +1,64 @@
+from conftest import create_profile, create_user
+
+
+def search(client, **params):
+    body = client.get('/api/search', query_string=params).get_json()
+    assert body['success'], body
+    return body
+
+
+def names(body):
+    return sorted(row['full_name'] for row in body['data'])
+
+
+def test_search_matches_words_inside_longer_values(client, db):
+    create_profile(db, create_user(db, 'asha'), profession='Software Engineer', full_name='Asha')
+    create_profile(db, create_user(db, 'ravi'), profession='Civil Engineer', full_name='Ravi')
+    create_profile(db, create_user(db, 'meena'), profession='Teacher', full_name='Meena')
+
+    assert names(search(client, profession='engineer')) == ['Asha', 'Ravi']
+
+
+def test_known_value_keeps_substring_matches(client, db):
+    # "Palwal" is a known location, but "Hodal, Palwal" must still match it
+    create_profile(db, create_user(db, 'asha'), location='Palwal', full_name='Asha')
+    create_profile(db, create_user(db, 'ravi'), location='Hodal, Palwal', full_name='Ravi')
+    create_profile(db, create_user(db, 'meena'), location='Faridabad', full_name='Meena')
+
+    assert names(search(client, location='palwal')) == ['Asha', 'Ravi']
+
+
+def test_known_value_also_matches_other_spellings(client, app_module, db):
+    create_profile(db, create_user(db, 'asha'), profession='Software Engineer', full_name='Asha')
+    create_profile(db, create_user(db, 'ravi'), profession='Software Engg', full_name='Ravi')
+    create_profile(db, create_user(db, 'meena'), profession='Teacher', full_name='Meena')
+    app_module.suggest_indexes.build()
+
+    assert names(search(client, profession='software engineer')) == ['Asha', 'Ravi']
+
+
+def test_keyset_cursor_walks_every_result_once(client, db):
+    for i in range(7):
+        create_profile(db, create_user(db, f'user{i}'), full_name=f'User {i}')
+
+    seen, cursor = [], None
+    while True:
+        params = {'profession': 'engineer', 'limit': 3}
+        if cursor:
+            params['cursor'] = cursor
+        body = search(client, **params)
+        seen += names(body)
+        cursor = body['pagination']['next_cursor']
+        if not cursor:
+            break
+
+    assert sorted(seen) == [f'User {i}' for i in range(7)]
+
+
+def test_ndjson_stream_returns_every_match(client, db):
+    for i in range(4):
+        create_profile(db, create_user(db, f'user{i}'), full_name=f'User {i}')
+
+    response = client.get('/api/search', query_string={'profession': 'engineer', 'format': 'ndjson'})
+
+    assert len([line for line in response.get_data(as_text=True).splitlines() if line.strip()]) == 4
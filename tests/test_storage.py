@@ -0,0 +1,80 @@
+from datetime import datetime
+
+import pytest
+
+from storage import SQLiteBackend, SQLiteDictCursor, translate
+
+
+def test_translate_rewrites_mysql_only_syntax():
+    assert translate('SELECT * FROM t WHERE a = %s AND b LIKE %s', True)[0] == \
+        'SELECT * FROM t WHERE a = ? AND b LIKE ?'
+    assert translate("SELECT '%s'", False)[0] == "SELECT '%s'"
+    assert translate('INSERT IGNORE INTO t (a) VALUES (%s)', True)[0] == 'INSERT OR IGNORE INTO t (a) VALUES (?)'
+    assert translate('DELETE FROM t WHERE a < %s LIMIT 100', True)[0] == \
+        'DELETE FROM t WHERE rowid IN (SELECT rowid FROM t WHERE a < ? LIMIT 100)'
+
+
+def test_translate_upsert_and_row_locks():
+    sql, locks, upsert = translate('INSERT INTO t (a, b) VALUES (%s, %s) ON DUPLICATE KEY UPDATE b = VALUES(b)', True)
+    assert sql == 'INSERT INTO t (a, b) VALUES (?, ?) ON CONFLICT DO UPDATE SET b = excluded.b'
+    assert upsert and not locks
+
+    sql, locks, _ = translate('SELECT id FROM t WHERE a = %s FOR UPDATE SKIP LOCKED', True)
+    assert sql == 'SELECT id FROM t WHERE a = ?'
+    assert locks
+
+
+@pytest.fixture
+def connection(tmp_path):
+    connection = SQLiteBackend(str(tmp_path / 'storage.db')).connect()
+    yield connection
+    connection.close()
+
+
+def test_upsert_reports_mysql_affected_rows(connection):
+    cursor = connection.cursor()
+    sql = '''INSERT INTO profile_stats (dimension, value, count) VALUES (%s, %s, %s) 
+             ON DUPLICATE KEY UPDATE count = count + VALUES(count)'''
+
+    assert cursor.execute(sql, ('profession', 'Teacher', 1)) == 1
+    assert cursor.execute(sql, ('profession', 'Teacher', 2)) == 2
+
+    cursor.execute("SELECT count FROM profile_stats WHERE dimension = 'profession' AND value = 'Teacher'")
+    assert cursor.fetchone() == (3,)
+
+
+def test_upsert_insert_is_not_mistaken_for_update_when_rowids_coincide(connection):
+    cursor = connection.cursor()
+    # users row 1 leaves last_insert_rowid() at 1, the rowid the new profile_stats row gets too
+    cursor.execute("INSERT INTO users (username, email, password) VALUES ('asha', 'asha@example.com', 'x')")
+    sql = '''INSERT INTO profile_stats (dimension, value, count) VALUES (%s, %s, %s)
+             ON DUPLICATE KEY UPDATE count = count + VALUES(count)'''
+
+    assert cursor.execute(sql, ('profession', 'Teacher', 1)) == 1
+    assert cursor.lastrowid == 1
+    assert cursor.execute(sql, ('profession', 'Teacher', 1)) == 2
+
+
+def test_dict_rows_and_type_conversion(connection):
+    cursor = connection.cursor(SQLiteDictCursor)
+    cursor.execute('''INSERT INTO users (username, email, password, email_verified, created_at) 
+                      VALUES (%s, %s, %s, %s, %s)''', ('asha', 'asha@example.com', 'x', True, datetime(2024, 5, 1, 9)))
+    cursor.execute('SELECT username, email_verified, created_at FROM users WHERE email = %s', ('ASHA@example.com',))
+
+    assert cursor.fetchone() == {'username': 'asha', 'email_verified': True, 'created_at': datetime(2024, 5, 1, 9)}
+
+
+def test_full_text_index_follows_profile_writes(connection):
+    backend = SQLiteBackend(':memory:')
+    cursor = connection.cursor()
+    cursor.execute("INSERT INTO users (username, email, password) VALUES ('asha', 'asha@example.com', 'x')")
+    cursor.execute('''INSERT INTO professional_profiles (user_id, full_name, profession, education, current_location) 
+                      VALUES (%s, 'Asha', 'Software Engineer', 'B.Tech', 'Palwal')''', (cursor.lastrowid,))
+    where_sql, _, params = backend.text_match('professional_profiles', ['profession'], ['engin'])
+
+    cursor.execute(f'SELECT COUNT(*) FROM professional_profiles WHERE {where_sql}', params)
+    assert cursor.fetchone() == (1,)
+
+    cursor.execute("UPDATE professional_profiles SET profession = 'Teacher'")
+    cursor.execute(f'SELECT COUNT(*) FROM professional_profiles WHERE {where_sql}', params)
+    assert cursor.fetchone() == (0,)
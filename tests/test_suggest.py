@@ -0,0 +1,116 @@
+import threading
+
+from conftest import create_profile, create_user, login
+from suggest import SuggestIndex, SuggestIndexes, is_typo
+
+
+def counts(app_module, client, field, q):
+    app_module.suggest_indexes.build()
+    body = client.get('/api/suggest', query_string={'field': field, 'q': q}).get_json()
+    assert body['success'], body
+    return {row['value']: row['count'] for row in body['data']}
+
+
+def save_profile(client, **overrides):
+    profile = {'full_name': 'Asha', 'profession': 'Software Engineer', 'education': 'B.Tech', 'experience': 3,
+               'skills': 'python', 'current_location': 'Palwal', 'phone': '9999999999',
+               'availability': 'Available'}
+    profile.update(overrides)
+    body = client.post('/api/profile', json=profile).get_json()
+    assert body['success'], body
+
+
+def test_spellings_fold_into_most_common_value():
+    index = SuggestIndex()
+    index.build([('Software Engineer', 5), ('Software Engg', 2), ('Teacher', 3)])
+
+    assert index.canonical('software engg') == 'Software Engineer'
+    assert sorted(index.variants('Software Engineer')) == ['Software Engg', 'Software Engineer']
+    assert index.suggest('eng') == [{'value': 'Software Engineer', 'count': 7}]
+
+
+def test_typos_fold_but_distinct_titles_stay_apart():
+    index = SuggestIndex()
+    index.build([('Software Engineer', 5), ('Sales Manager', 4), ('Engineer I', 3), ('Teacher', 3),
+                 ('Sofware Engineer', 1), ('Sales Manager II', 2), ('Engineer II', 1), ('Teachers', 1),
+                 ('software  engineer.', 1), ('Senior Manager', 1), ('MCA', 2), ('MBA', 1)])
+
+    assert index.canonical('Sofware Engineer') == 'Software Engineer'
+    assert index.canonical('software  engineer.') == 'Software Engineer'
+    assert index.canonical('Teachers') == 'Teacher'
+    for distinct in ('Sales Manager II', 'Engineer II', 'Senior Manager', 'MBA'):
+        assert index.variants(distinct) == [distinct]
+
+
+def test_typo_needs_one_long_alphabetic_word_within_the_edit_limit():
+    assert is_typo('sofware engineer', 'software engineer')
+    assert is_typo('enginere', 'engineer')
+    assert is_typo('adminstrator', 'administrator')
+    assert not is_typo('sales manager ii', 'sales manager')
+    assert not is_typo('engineer i', 'engineer ii')
+    assert not is_typo('mba', 'mca')
+    assert not is_typo('grade 10', 'grade 12')
+    assert not is_typo('senior manager', 'junior manager')
+    assert not is_typo('software tester', 'hardware engineer')
+    assert not is_typo('teacher', 'teaching')
+
+
+def test_removing_last_occurrence_hides_value():
+    index = SuggestIndex()
+    index.build([('Teacher', 1), ('Software Engineer', 2)])
+
+    index.remove('Teacher')
+
+    assert index.suggest('tea') == []
+    assert index.variants('Teacher') == []
+    assert index.canonical('Teacher') == 'Teacher'
+
+
+def test_resaving_profile_does_not_inflate_counts(app_module, client, db):
+    create_profile(db, create_user(db, 'ravi'), profession='Software Engineer')
+    create_user(db, 'asha')
+    login(client, 'asha')
+    assert counts(app_module, client, 'profession', 'soft') == {'Software Engineer': 1}
+
+    for _ in range(3):
+        save_profile(client)
+
+    assert counts(app_module, client, 'profession', 'soft') == {'Software Engineer': 2}
+
+
+def test_changing_profile_moves_count_to_new_value(client, app_module, db):
+    create_profile(db, create_user(db, 'ravi'), profession='Teacher')
+    create_user(db, 'asha')
+    login(client, 'asha')
+    save_profile(client, profession='Software Engineer')
+    assert counts(app_module, client, 'profession', 'soft') == {'Software Engineer': 1}
+
+    save_profile(client, profession='Teacher')
+
+    assert counts(app_module, client, 'profession', 'soft') == {}
+    assert counts(app_module, client, 'profession', 'tea') == {'Teacher': 2}
+
+
+def test_new_profile_is_suggested_before_the_next_build(client, app_module, db):
+    create_user(db, 'asha')
+    login(client, 'asha')
+    app_module.suggest_indexes.build()
+
+    save_profile(client, profession='Civil Engineer')
+
+    body = client.get('/api/suggest', query_string={'field': 'profession', 'q': 'civ'}).get_json()
+    assert body['data'] == [{'value': 'Civil Engineer', 'count': 1}]
+
+
+def test_requests_do_not_wait_for_a_build():
+    release = threading.Event()
+
+    def connect():
+        release.wait(5)
+        raise RuntimeError('database unavailable')
+
+    indexes = SuggestIndexes(connect, None, None, {'profession': False})
+    try:
+        assert indexes.get()['profession'].suggest('eng') == []
+    finally:
+        release.set()